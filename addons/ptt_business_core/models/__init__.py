@@ -4,6 +4,7 @@
 # NOTE: Constants are in ptt_business_core/constants.py (addon root)
 
 from . import mail_mail  # Email kill switch - MUST BE FIRST
+from . import mail_template  # Bulk (queued) template sending
 from . import res_partner  # Partner extensions
 from . import ptt_crm_vendor_estimate  # CRM vendor estimates (before crm_lead)
 from . import ptt_crm_service_line  # CRM service lines (before crm_lead)
@@ -1,6 +1,9 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
+
 from odoo import models, fields, api, _
 from odoo.exceptions import UserError
+from odoo.tools import SQL
 
 from odoo.addons.ptt_business_core.constants import (
     CONTACT_METHODS,
@@ -297,8 +300,17 @@ class CrmLead(models.Model):
         - ptt_estimated_margin: Client total minus vendor costs
         - ptt_margin_percent: Margin as percentage of client total
         """
+        # Saved leads are summed with one grouped query, leads being edited
+        # in a form (new records) from their lines in memory
+        saved = self.filtered(lambda lead: isinstance(lead.id, int))
+        vendor_totals = dict(self.env["ptt.crm.vendor.estimate"]._read_group(
+            [("crm_lead_id", "in", saved.ids)], ["crm_lead_id"], ["estimated_cost:sum"],
+        )) if saved else {}
         for lead in self:
-            vendor_total = sum(lead.ptt_vendor_estimate_ids.mapped("estimated_cost"))
+            if lead in saved:
+                vendor_total = vendor_totals.get(lead, 0.0) or 0.0
+            else:
+                vendor_total = sum(lead.ptt_vendor_estimate_ids.mapped("estimated_cost"))
             lead.ptt_estimated_vendor_total = vendor_total
             lead.ptt_estimated_margin = (lead.ptt_estimated_client_total or 0) - vendor_total
             if lead.ptt_estimated_client_total:
@@ -319,10 +331,56 @@ class CrmLead(models.Model):
     def _compute_sale_order_count(self):
         """Compute count of sale orders linked to this lead.
         
-        Uses the standard order_ids relation from crm module.
+        Uses the standard order_ids relation from crm module, counted with
+        one grouped query for the whole recordset.
         """
+        counts = dict(self.env["sale.order"]._read_group(
+            [("opportunity_id", "in", self._origin.ids)], ["opportunity_id"], ["__count"],
+        ))
         for lead in self:
-            lead.ptt_sale_order_count = len(lead.order_ids)
+            lead.ptt_sale_order_count = counts.get(lead._origin, 0)
+
+    def _get_invoice_rollup(self):
+        """Load the customer invoices of the leads' sale orders in batch.
+        
+        One query maps the leads to the invoices of their orders (through
+        the invoiced order lines, like sale.order.invoice_ids) and one
+        search reads the invoices, whatever the number of leads.
+        
+        Returns:
+            Dict {lead id: account.move recordset of customer invoices}
+        """
+        lead_ids = self._origin.ids
+        if not lead_ids:
+            return {}
+        self.env["sale.order"].flush_model(["opportunity_id"])
+        self.env["sale.order.line"].flush_model(["order_id", "invoice_lines"])
+        self.env["account.move.line"].flush_model(["move_id"])
+        rows = self.env.execute_query(SQL(
+            """
+            SELECT so.opportunity_id, aml.move_id
+              FROM sale_order so
+              JOIN sale_order_line sol ON sol.order_id = so.id
+              JOIN sale_order_line_invoice_rel rel ON rel.order_line_id = sol.id
+              JOIN account_move_line aml ON aml.id = rel.invoice_line_id
+             WHERE so.opportunity_id IN %s
+          GROUP BY so.opportunity_id, aml.move_id
+            """,
+            tuple(lead_ids),
+        ))
+        invoices = self.env["account.move"].search_fetch(
+            [("id", "in", list({move_id for _lead_id, move_id in rows})), ("move_type", "=", "out_invoice")],
+            ["amount_total", "amount_residual", "invoice_date_due"],
+        )
+        invoice_ids = set(invoices.ids)
+        move_ids_by_lead = defaultdict(list)
+        for lead_id, move_id in rows:
+            if move_id in invoice_ids:
+                move_ids_by_lead[lead_id].append(move_id)
+        return {
+            lead_id: invoices.browse(move_ids)
+            for lead_id, move_ids in move_ids_by_lead.items()
+        }
 
     @api.depends("order_ids.invoice_ids")
     def _compute_invoice_data(self):
@@ -334,11 +392,13 @@ class CrmLead(models.Model):
         - ptt_invoice_paid: Amount already paid
         - ptt_invoice_remaining: Outstanding balance
         - ptt_payment_status: paid/partial/overdue/not_paid
+        
+        The invoices of the whole recordset are loaded at once, see
+        _get_invoice_rollup.
         """
+        invoices_by_lead = self._get_invoice_rollup()
         for lead in self:
-            invoices = lead.order_ids.mapped("invoice_ids").filtered(
-                lambda inv: inv.move_type == "out_invoice"
-            )
+            invoices = invoices_by_lead.get(lead._origin.id, self.env["account.move"])
             lead.ptt_invoice_count = len(invoices)
             lead.ptt_invoice_total = sum(invoices.mapped("amount_total"))
             lead.ptt_invoice_paid = lead.ptt_invoice_total - sum(invoices.mapped("amount_residual"))
@@ -33,3 +33,14 @@ class MailMail(models.Model):
             return True
         
         return super().send(auto_commit=auto_commit, raise_exception=raise_exception, post_send_callback=post_send_callback)
+
+    @api.model
+    def _ptt_trigger_queue(self):
+        """Wake up the mail queue so queued emails go out right away.
+
+        ``process_email_queue`` delivers them in batch over one SMTP session
+        per server, outside of the transaction that queued them.
+        """
+        cron = self.env.ref("mail.ir_cron_mail_scheduler_action", raise_if_not_found=False)
+        if cron:
+            cron._trigger()
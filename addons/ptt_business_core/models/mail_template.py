@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# Part of Party Time Texas Event Management System
+# Bulk template sending - render once, queue in batch, deliver from the queue
+
+from odoo import models
+
+
+class MailTemplate(models.Model):
+    """Bulk sending helpers used by the PTT crons and wizards."""
+    _inherit = "mail.template"
+
+    def _ptt_queue_mail_batch(self, res_ids, email_values=None):
+        """Render the template on all records in one pass and queue the mails.
+
+        The mails are created in batch and delivered by the mail queue,
+        instead of one SMTP exchange per record inside the calling
+        transaction (``force_send=True``).
+
+        Returns:
+            The queued mail.mail records
+        """
+        self.ensure_one()
+        if not res_ids:
+            return self.env["mail.mail"]
+        mails = self.send_mail_batch(list(res_ids), email_values=email_values)
+        self.env["mail.mail"]._ptt_trigger_queue()
+        return mails
+
+    def _ptt_queue_mail_recipients(self, res_id, emails):
+        """Queue the template rendered once on a record to several emails.
+
+        Used when the same message goes to many recipients (e.g. RFQ
+        invitations): the template is rendered once and one mail per email
+        is queued, each recipient only seeing their own address.
+
+        Returns:
+            The queued mail.mail records
+        """
+        self.ensure_one()
+        emails = [email for email in emails if email]
+        if not emails:
+            return self.env["mail.mail"]
+        mails = self.send_mail_batch([res_id], email_values={"email_to": emails[0]})
+        if mails.attachment_ids:
+            # attachments belong to the message of each mail, render them again
+            for email in emails[1:]:
+                mails |= self.send_mail_batch([res_id], email_values={"email_to": email})
+        elif len(emails) > 1:
+            values = {
+                "model": mails.model,
+                "res_id": mails.res_id,
+                "subject": mails.subject,
+                "body_html": mails.body_html,
+                "body": mails.body,
+                "email_from": mails.email_from,
+                "reply_to": mails.reply_to,
+                "email_cc": mails.email_cc,
+                "mail_server_id": mails.mail_server_id.id,
+                "auto_delete": mails.auto_delete,
+                "scheduled_date": mails.scheduled_date,
+                "recipient_ids": [(4, pid) for pid in mails.recipient_ids.ids],
+            }
+            mails |= self.env["mail.mail"].sudo().create([
+                dict(values, email_to=email) for email in emails[1:]
+            ])
+        self.env["mail.mail"]._ptt_trigger_queue()
+        return mails
@@ -14,6 +14,7 @@ Verified Against: Production Database
 """
 
 from odoo import api, models
+from odoo.tools import frozendict, ormcache
 import logging
 
 _logger = logging.getLogger(__name__)
@@ -227,6 +228,35 @@ class NativeCategories:
     EVENT_ENTERTAINMENT = 4  # Child of Services
 
 
+# ============================================================================
+# PTT PRODUCTS (created by the PTT data files)
+# ============================================================================
+# Looked up by default code, resolved through their XML IDs
+
+PTT_PRODUCT_XMLIDS = {
+    'EVENT-KICKOFF-CORP': 'ptt_business_core.product_event_kickoff_corporate',
+    'EVENT-KICKOFF-WEDD': 'ptt_business_core.product_event_kickoff_wedding',
+    'EVENT-KICKOFF-SOCL': 'ptt_business_core.product_event_kickoff_social',
+}
+
+# Registry classes of each model, their UPPER_CASE int attributes are the codes
+NATIVE_MODELS = {
+    'product.template': NativeProducts,
+    'product.attribute': NativeAttributes,
+    'product.attribute.value': NativeAttributeValues,
+    'product.category': NativeCategories,
+}
+
+
+def _get_native_codes(registry_class):
+    """Return ``{code: id}`` for the IDs declared on a registry class"""
+    return {
+        code: value
+        for code, value in vars(registry_class).items()
+        if code.isupper() and isinstance(value, int)
+    }
+
+
 # ============================================================================
 # HELPER MODEL FOR RUNTIME LOOKUPS
 # ============================================================================
@@ -235,10 +265,147 @@ class NativeDataRegistry(models.AbstractModel):
     """
     Helper model for looking up native records at runtime.
     Use this when you need to look up by name rather than ID.
+    
+    PERFORMANCE: the registry classes above are resolved against the
+    database once per registry (validated at registry load) and cached in
+    the 'stable' ormcache, so lookups by code are dictionary lookups
+    instead of queries on every onchange.
     """
     _name = 'ptt.native.data.registry'
     _description = 'Native Data Registry Helper'
     
+    def _register_hook(self):
+        super()._register_hook()
+        # Validate the mapping once, and warm the cache
+        self._get_native_map()
+    
+    @api.model
+    @ormcache(cache='stable')
+    def _get_native_map(self):
+        """
+        Resolve the registry once per database.
+        
+        Returns a dict with:
+        - for each model of NATIVE_MODELS, ``{code: id}`` of the records
+          that exist in the database (missing ones are logged)
+        - 'product.product': ``{code: variant ids}`` of the native products
+        - 'default_code': ``{default code: variant id}`` of the PTT products
+        - 'ptt_created': ids of the product templates and attributes
+          created by PTT (which are not native)
+        """
+        native_map = {}
+        for model_name, registry_class in NATIVE_MODELS.items():
+            codes = _get_native_codes(registry_class)
+            existing_ids = set(self.env[model_name].sudo().with_context(active_test=False).search(
+                [('id', 'in', list(set(codes.values())))]
+            ).ids)
+            missing = sorted(code for code, record_id in codes.items() if record_id not in existing_ids)
+            if missing:
+                _logger.warning(
+                    "Native %s records not found in the database: %s",
+                    model_name, ', '.join(missing),
+                )
+            native_map[model_name] = frozendict({
+                code: record_id for code, record_id in codes.items() if record_id in existing_ids
+            })
+        
+        # Variants of the native products, in one query
+        templates = self.env['product.template'].sudo().browse(
+            list(set(native_map['product.template'].values()))
+        )
+        variants_by_template = {
+            template.id: tuple(template.product_variant_ids.ids) for template in templates
+        }
+        native_map['product.product'] = frozendict({
+            code: variants_by_template.get(template_id, ())
+            for code, template_id in native_map['product.template'].items()
+        })
+        
+        IrModelData = self.env['ir.model.data'].sudo()
+        default_codes = {}
+        for default_code, xmlid in PTT_PRODUCT_XMLIDS.items():
+            template_id = IrModelData._xmlid_to_res_id(xmlid, raise_if_not_found=False)
+            template = self.env['product.template'].sudo().browse(template_id)
+            if template_id and template.product_variant_ids:
+                default_codes[default_code] = template.product_variant_ids[0].id
+            else:
+                _logger.warning("PTT product %s (%s) not found in the database", default_code, xmlid)
+        native_map['default_code'] = frozendict(default_codes)
+        
+        ptt_created = IrModelData.search_fetch([
+            ('model', 'in', ['product.template', 'product.attribute']),
+            ('module', '=', 'ptt_business_core'),
+        ], ['model', 'res_id'])
+        native_map['ptt_created'] = frozendict({
+            model_name: frozenset(ptt_created.filtered(lambda d: d.model == model_name).mapped('res_id'))
+            for model_name in ('product.template', 'product.attribute')
+        })
+        return frozendict(native_map)
+    
+    @api.model
+    def _clear_native_map(self, model_name, records):
+        """
+        Clear the cached registry when records it resolved, or records
+        of the native and PTT products, are created or deleted
+        """
+        if not records:
+            return
+        if model_name == 'ir.model.data':
+            stale = any(
+                data.module == 'ptt_business_core'
+                and data.model in ('product.template', 'product.attribute')
+                for data in records
+            )
+        else:
+            native_map = self._get_native_map()
+            templates = set(native_map['product.template'].values())
+            templates |= native_map['ptt_created']['product.template']
+            if model_name == 'product.template':
+                stale = not templates.isdisjoint(records.ids)
+            else:
+                variants = set(native_map['default_code'].values()).union(
+                    *native_map['product.product'].values()
+                )
+                stale = not variants.isdisjoint(records.ids) or any(
+                    record.product_tmpl_id.id in templates for record in records
+                )
+        if stale:
+            self.env.registry.clear_cache('stable')
+    
+    @api.model
+    def get_native_id(self, model_name, code):
+        """Return the id of a native record by registry code, False if missing"""
+        return self._get_native_map()[model_name].get(code, False)
+    
+    @api.model
+    def get_native_record(self, model_name, code):
+        """Return a native record by registry code (empty recordset if missing)"""
+        return self.env[model_name].browse(self.get_native_id(model_name, code) or ())
+    
+    @api.model
+    def get_product_variants(self, code):
+        """Return the variants (product.product) of a native product by code"""
+        return self.env['product.product'].browse(
+            self._get_native_map()['product.product'].get(code, ())
+        ).exists()
+    
+    @api.model
+    def get_product_by_code(self, default_code):
+        """
+        Get an active product.product by default code.
+        The PTT products (e.g. Event Kickoff) are resolved from the cache,
+        other codes are searched.
+        """
+        variant_id = self._get_native_map()['default_code'].get(default_code)
+        if variant_id:
+            product = self.env['product.product'].browse(variant_id).exists()
+            if product.active and product.default_code == default_code:
+                return product
+        return self.env['product.product'].search([
+            ('default_code', '=', default_code),
+            ('active', '=', True),
+        ], limit=1)
+    
     @api.model
     def get_product_by_name(self, name):
         """
@@ -254,13 +421,7 @@ class NativeDataRegistry(models.AbstractModel):
             return False
             
         # Check it's not a PTT-created product
-        ext_id = self.env['ir.model.data'].search([
-            ('model', '=', 'product.template'),
-            ('res_id', '=', product.id),
-            ('module', '=', 'ptt_business_core')
-        ], limit=1)
-        
-        if ext_id:
+        if not self.is_native_product(product.id):
             _logger.warning(
                 "Attempted to get PTT-created product '%s' - use native product instead!",
                 name
@@ -283,13 +444,7 @@ class NativeDataRegistry(models.AbstractModel):
         if not attr:
             return False
             
-        ext_id = self.env['ir.model.data'].search([
-            ('model', '=', 'product.attribute'),
-            ('res_id', '=', attr.id),
-            ('module', '=', 'ptt_business_core')
-        ], limit=1)
-        
-        if ext_id:
+        if attr.id in self._get_native_map()['ptt_created']['product.attribute']:
             _logger.warning(
                 "Attempted to get PTT-created attribute '%s' - use native attribute instead!",
                 name
@@ -319,34 +474,68 @@ class NativeDataRegistry(models.AbstractModel):
     def get_event_type_values(self):
         """Get all native Event Type attribute values"""
         return {
-            'social': self.env['product.attribute.value'].browse(NativeAttributeValues.EVENT_TYPE_SOCIAL),
-            'wedding': self.env['product.attribute.value'].browse(NativeAttributeValues.EVENT_TYPE_WEDDING),
-            'corporate': self.env['product.attribute.value'].browse(NativeAttributeValues.EVENT_TYPE_CORPORATE),
+            'social': self.get_native_record('product.attribute.value', 'EVENT_TYPE_SOCIAL'),
+            'wedding': self.get_native_record('product.attribute.value', 'EVENT_TYPE_WEDDING'),
+            'corporate': self.get_native_record('product.attribute.value', 'EVENT_TYPE_CORPORATE'),
         }
     
     @api.model
     def get_service_tier_values(self):
         """Get all native Service Tier attribute values"""
         return {
-            'essential': self.env['product.attribute.value'].browse(NativeAttributeValues.SERVICE_TIER_ESSENTIAL),
-            'classic': self.env['product.attribute.value'].browse(NativeAttributeValues.SERVICE_TIER_CLASSIC),
-            'premier': self.env['product.attribute.value'].browse(NativeAttributeValues.SERVICE_TIER_PREMIER),
+            'essential': self.get_native_record('product.attribute.value', 'SERVICE_TIER_ESSENTIAL'),
+            'classic': self.get_native_record('product.attribute.value', 'SERVICE_TIER_CLASSIC'),
+            'premier': self.get_native_record('product.attribute.value', 'SERVICE_TIER_PREMIER'),
         }
     
     @api.model
     def get_sellable_services(self):
         """Get all native sellable service products"""
-        return self.env['product.template'].browse(NativeProducts.ALL_SELLABLE_SERVICES)
+        existing_ids = set(self._get_native_map()['product.template'].values())
+        return self.env['product.template'].browse(
+            [product_id for product_id in NativeProducts.ALL_SELLABLE_SERVICES if product_id in existing_ids]
+        )
     
     @api.model
     def is_native_product(self, product_id):
         """Check if a product is native (not PTT-created)"""
-        ext_id = self.env['ir.model.data'].search([
-            ('model', '=', 'product.template'),
-            ('res_id', '=', product_id),
-            ('module', '=', 'ptt_business_core')
-        ], limit=1)
-        return not bool(ext_id)
+        return product_id not in self._get_native_map()['ptt_created']['product.template']
+
+
+class ProductTemplate(models.Model):
+    _inherit = 'product.template'
+    
+    def unlink(self):
+        self.env['ptt.native.data.registry']._clear_native_map(self._name, self)
+        return super().unlink()
+
+
+class ProductProduct(models.Model):
+    _inherit = 'product.product'
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        products = super().create(vals_list)
+        self.env['ptt.native.data.registry']._clear_native_map(self._name, products)
+        return products
+    
+    def unlink(self):
+        self.env['ptt.native.data.registry']._clear_native_map(self._name, self)
+        return super().unlink()
+
+
+class IrModelData(models.Model):
+    _inherit = 'ir.model.data'
+    
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env['ptt.native.data.registry']._clear_native_map(self._name, records)
+        return records
+    
+    def unlink(self):
+        self.env['ptt.native.data.registry']._clear_native_map(self._name, self)
+        return super().unlink()
 
 
 # ============================================================================
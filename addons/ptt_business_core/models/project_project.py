@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+from collections import defaultdict
 from datetime import timedelta
 from odoo import models, fields, api, _
 
@@ -145,21 +146,23 @@ class ProjectProject(models.Model):
         "project_id",
         string="Vendor Assignments",
     )
+    # Maintained by the assignments themselves (delta on create/write/unlink),
+    # see ptt.project.vendor.assignment._apply_stats_delta
     ptt_vendor_count = fields.Integer(
         string="Vendor Count",
-        compute="_compute_vendor_stats",
-        store=True,
+        readonly=True,
+        copy=False,
     )
     ptt_total_estimated_cost = fields.Monetary(
         string="Total Estimated Costs",
-        compute="_compute_vendor_stats",
-        store=True,
+        readonly=True,
+        copy=False,
         currency_field="currency_id",
     )
     ptt_total_actual_cost = fields.Monetary(
         string="Total Actual Costs",
-        compute="_compute_vendor_stats",
-        store=True,
+        readonly=True,
+        copy=False,
         currency_field="currency_id",
     )
     ptt_cost_variance = fields.Monetary(
@@ -222,27 +225,22 @@ class ProjectProject(models.Model):
                 project.ptt_client_total = 0.0
 
     @api.depends(
-        "ptt_vendor_assignment_ids",
-        "ptt_vendor_assignment_ids.estimated_cost",
-        "ptt_vendor_assignment_ids.actual_cost",
+        "ptt_total_estimated_cost",
+        "ptt_total_actual_cost",
         "ptt_client_total"
     )
     def _compute_vendor_stats(self):
-        """Compute vendor cost statistics and profit margin.
+        """Compute vendor cost variance and profit margin.
+        
+        The vendor count and cost totals are stored aggregates kept up to
+        date by the vendor assignments, so this never reads the assignments.
         
         Calculates:
-        - ptt_vendor_count: Number of vendor assignments
-        - ptt_total_estimated_cost: Sum of estimated vendor costs
-        - ptt_total_actual_cost: Sum of actual vendor costs
         - ptt_cost_variance: Actual minus estimated (negative = under budget)
         - ptt_actual_margin: Client total minus actual costs
         - ptt_margin_percent: Margin as percentage of client total
         """
         for project in self:
-            assignments = project.ptt_vendor_assignment_ids
-            project.ptt_vendor_count = len(assignments)
-            project.ptt_total_estimated_cost = sum(assignments.mapped("estimated_cost"))
-            project.ptt_total_actual_cost = sum(assignments.mapped("actual_cost"))
             project.ptt_cost_variance = project.ptt_total_actual_cost - project.ptt_total_estimated_cost
             project.ptt_actual_margin = (project.ptt_client_total or 0) - project.ptt_total_actual_cost
             if project.ptt_client_total:
@@ -250,6 +248,12 @@ class ProjectProject(models.Model):
             else:
                 project.ptt_margin_percent = 0.0
 
+    def unlink(self):
+        # Delete the assignments through the ORM rather than the database
+        # cascade, so the vendor statistics they feed are decremented
+        self.ptt_vendor_assignment_ids.unlink()
+        return super().unlink()
+
     # =========================================================================
     # EVENT REMINDER METHODS
     # =========================================================================
@@ -290,9 +294,13 @@ class ProjectProject(models.Model):
         target_date = fields.Date.today() + timedelta(days=days_before)
         
         # Find projects with events on target date
-        projects = self.search([
+        projects = self.search_fetch([
             ('ptt_event_date', '=', target_date),
             ('active', '=', True),
+        ], [
+            # everything the missing information check reads
+            'ptt_venue_name', 'ptt_venue_address', 'ptt_event_start_time',
+            'ptt_guest_count', 'partner_id', 'user_id', 'ptt_vendor_count',
         ])
         
         if not projects:
@@ -309,36 +317,56 @@ class ProjectProject(models.Model):
             # Log warning if template not found
             return
         
+        # Only projects with a manager to remind
+        projects = projects.filtered(lambda p: p.user_id.email)
+        digests = projects._get_event_reminder_digests()
         for project in projects:
-            # Get recipient (project manager or user)
-            recipient = project.user_id
-            if not recipient or not recipient.email:
-                continue
-            
-            incomplete_tasks = project._get_incomplete_tasks()
-            missing_info = project._get_missing_information()
-            unconfirmed_vendors = project._get_unconfirmed_vendors()
-
-            task_lines = []
-            for task in incomplete_tasks:
-                if task.date_deadline:
-                    task_lines.append(f"{task.name} (due {task.date_deadline})")
-                else:
-                    task_lines.append(task.name)
+            # Queue email using template, delivered by the mail queue below
+            template.with_context(**digests[project.id]).send_mail(project.id)
 
-            vendor_lines = []
-            for vendor in unconfirmed_vendors:
-                service = dict(vendor._fields['service_type'].selection).get(vendor.service_type, vendor.service_type)
-                vendor_lines.append(f"{vendor.vendor_id.name or 'Vendor'} - {service}")
-
-            template_ctx = {
-                "ptt_missing_info": [str(info) for info in missing_info],
-                "ptt_incomplete_tasks": task_lines,
-                "ptt_unconfirmed_vendors": vendor_lines,
+        self.env["mail.mail"]._ptt_trigger_queue()
+    
+    def _get_event_reminder_digests(self):
+        """Build the reminder digest of all projects from grouped queries.
+        
+        Incomplete tasks and unconfirmed vendors are loaded once for the
+        whole recordset instead of once per project, so the number of
+        queries does not depend on the number of projects.
+        
+        Returns:
+            Dict {project id: template context of the reminder email}
+        """
+        tasks_by_project = defaultdict(list)
+        tasks = self.env['project.task'].search_fetch([
+            ('project_id', 'in', self.ids),
+            ('stage_id.fold', '=', False),  # Not in a "done" stage
+        ], ['project_id', 'name', 'date_deadline'], order='date_deadline asc')
+        for task in tasks:
+            if task.date_deadline:
+                tasks_by_project[task.project_id.id].append(f"{task.name} (due {task.date_deadline})")
+            else:
+                tasks_by_project[task.project_id.id].append(task.name)
+        
+        vendors_by_project = defaultdict(list)
+        Assignment = self.env['ptt.project.vendor.assignment']
+        assignments = Assignment.search_fetch([
+            ('project_id', 'in', self.ids),
+            ('status', 'not in', ('confirmed', 'completed')),
+        ], ['project_id', 'vendor_id', 'service_type'])
+        assignments.vendor_id.fetch(['name'])
+        services = dict(Assignment._fields['service_type'].selection)
+        for vendor in assignments:
+            service = services.get(vendor.service_type, vendor.service_type)
+            vendors_by_project[vendor.project_id.id].append(f"{vendor.vendor_id.name or 'Vendor'} - {service}")
+        
+        return {
+            project.id: {
+                "ptt_missing_info": [str(info) for info in project._get_missing_information()],
+                "ptt_incomplete_tasks": tasks_by_project[project.id],
+                "ptt_unconfirmed_vendors": vendors_by_project[project.id],
             }
-
-            # Send email using template
-            template.with_context(**template_ctx).send_mail(project.id, force_send=True)
+            for project in self
+        }
     
     def _get_incomplete_tasks(self):
         """Get list of incomplete tasks for this project.
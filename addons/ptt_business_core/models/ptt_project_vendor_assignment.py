@@ -1,8 +1,15 @@
 # -*- coding: utf-8 -*-
+import logging
+from collections import defaultdict
+
 from odoo import models, fields, api
+from odoo.fields import Domain
+from odoo.tools import float_compare
 
 from odoo.addons.ptt_business_core.constants import SERVICE_TYPES, VENDOR_ASSIGNMENT_STATUS
 
+_logger = logging.getLogger(__name__)
+
 
 class PttProjectVendorAssignment(models.Model):
     """Actual vendor assignments and costs for projects - execution stage."""
@@ -117,6 +124,128 @@ class PttProjectVendorAssignment(models.Model):
         for record in self:
             record.cost_variance = (record.actual_cost or 0) - (record.estimated_cost or 0)
 
+    # =========================================================================
+    # DELTA-MAINTAINED STATISTICS
+    # =========================================================================
+    # The project (and vendor) statistics are stored aggregates adjusted by
+    # the delta of the assignments created, written or deleted, instead of
+    # being recomputed from every assignment of the project or vendor.
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._apply_stats_delta({}, records._get_stats_contributions())
+        return records
+
+    def write(self, vals):
+        if not self._get_stats_fields().intersection(vals):
+            return super().write(vals)
+        before = self._get_stats_contributions()
+        result = super().write(vals)
+        self._apply_stats_delta(before, self._get_stats_contributions())
+        return result
+
+    def unlink(self):
+        before = self._get_stats_contributions()
+        result = super().unlink()
+        self._apply_stats_delta(before, {})
+        return result
+
+    @api.model
+    def _get_stats_fields(self):
+        """Assignment fields the stored statistics depend on."""
+        return {"project_id", "estimated_cost", "actual_cost"}
+
+    @api.model
+    def _get_stats_targets(self):
+        """Stored statistics maintained by the assignments, per model."""
+        return {
+            "project.project": {"ptt_vendor_count", "ptt_total_estimated_cost", "ptt_total_actual_cost"},
+        }
+
+    def _get_stats_contributions(self):
+        """Sum up what the assignments add to the stored statistics.
+
+        Returns:
+            Dict {(model name, record id): {field name: value}}
+        """
+        contributions = defaultdict(lambda: defaultdict(int))
+        for record in self:
+            project_stats = contributions[("project.project", record.project_id.id)]
+            project_stats["ptt_vendor_count"] += 1
+            project_stats["ptt_total_estimated_cost"] += record.estimated_cost or 0.0
+            project_stats["ptt_total_actual_cost"] += record.actual_cost or 0.0
+        return contributions
+
+    @api.model
+    def _apply_stats_delta(self, before, after):
+        """Adjust the stored statistics by the difference of two contributions."""
+        for key in set(before) | set(after):
+            model_name, record_id = key
+            if not record_id:
+                continue
+            old, new = before.get(key, {}), after.get(key, {})
+            delta = {
+                fname: new.get(fname, 0) - old.get(fname, 0)
+                for fname in set(old) | set(new)
+            }
+            delta = {fname: value for fname, value in delta.items() if value}
+            if not delta:
+                continue
+            record = self.env[model_name].sudo().browse(record_id).exists()
+            if record:
+                record.write({fname: record[fname] + value for fname, value in delta.items()})
+
+    @api.model
+    def _get_expected_stats(self):
+        """Recompute the statistics from scratch with grouped queries.
+
+        Returns:
+            Same structure as :meth:`_get_stats_contributions`
+        """
+        expected = defaultdict(dict)
+        for project, count, estimated, actual in self.sudo()._read_group(
+            [], ["project_id"], ["__count", "estimated_cost:sum", "actual_cost:sum"]
+        ):
+            expected[("project.project", project.id)].update({
+                "ptt_vendor_count": count,
+                "ptt_total_estimated_cost": estimated or 0.0,
+                "ptt_total_actual_cost": actual or 0.0,
+            })
+        return expected
+
+    @api.model
+    def _ptt_check_stats(self, fix=True):
+        """Verify the stored statistics against the assignments.
+
+        Drifted records (e.g. after SQL updates or partner merges) are
+        logged and, when ``fix`` is set, rewritten with the expected values.
+
+        Returns:
+            Number of records whose statistics had drifted
+        """
+        expected = self._get_expected_stats()
+        drifted = 0
+        for model_name, fnames in self._get_stats_targets().items():
+            Model = self.env[model_name].sudo().with_context(active_test=False)
+            record_ids = [rid for (mname, rid) in expected if mname == model_name and rid]
+            # records with stored statistics but no assignment left
+            stale = Model.search(Domain.OR([(fname, "!=", 0)] for fname in fnames))
+            for record in Model.browse(record_ids) | stale:
+                stats = expected.get((model_name, record.id), {})
+                values = {
+                    fname: stats.get(fname, 0)
+                    for fname in fnames
+                    if float_compare(record[fname], stats.get(fname, 0), precision_digits=2)
+                }
+                if not values:
+                    continue
+                drifted += 1
+                _logger.warning("Statistics drift on %s: %s", record, values)
+                if fix:
+                    record.write(values)
+        return drifted
+
     @api.onchange("vendor_id")
     def _onchange_vendor_id(self):
         """Auto-populate vendor contact name when vendor is selected."""
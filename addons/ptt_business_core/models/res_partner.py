@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 from odoo import models, fields, api, _
+from odoo.tools import ormcache
 
 from odoo.addons.ptt_business_core.constants import SERVICE_TYPES
 
+# Fields of the service types _ptt_resolve_code depends on (sequence orders
+# the matches)
+SERVICE_TYPE_RESOLVE_FIELDS = {"code", "name", "active", "sequence"}
+
 
 class ResPartner(models.Model):
     """Partner extensions for Party Time Texas.
@@ -123,4 +128,36 @@ class PttVendorServiceType(models.Model):
     active = fields.Boolean(default=True)
     color = fields.Integer(string="Color Index")
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        self.env.registry.clear_cache("default")  # invalidate _ptt_resolve_code
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        if vals.keys() & SERVICE_TYPE_RESOLVE_FIELDS:
+            self.env.registry.clear_cache("default")  # invalidate _ptt_resolve_code
+        return result
+
+    def unlink(self):
+        result = super().unlink()
+        self.env.registry.clear_cache("default")  # invalidate _ptt_resolve_code
+        return result
+
+    @api.model
+    @ormcache("code", "label")
+    def _ptt_resolve_code(self, code, label):
+        """Return the id of the service type of a service code (cached).
 
+        Matches the code first, then the label of the code, like the vendor
+        assignments do. Resolved as superuser so that the cached id does not
+        depend on the record rules of the first caller. Cleared whenever a
+        service type is created, deleted, or changes one of
+        SERVICE_TYPE_RESOLVE_FIELDS.
+        """
+        service_types = self.sudo().with_context(active_test=True)
+        service_type = service_types.search([("code", "=", code)], limit=1)
+        if not service_type and label:
+            service_type = service_types.search([("name", "ilike", label)], limit=1)
+        return service_type.id
@@ -1,9 +1,13 @@
 # -*- coding: utf-8 -*-
 """Tests for CRM Lead to Project flow."""
 
+from odoo import Command
+from odoo.tests import tagged
 from odoo.tests.common import TransactionCase
 from odoo.exceptions import UserError
 
+from odoo.addons.account.tests.common import AccountTestInvoicingCommon
+
 
 class TestCrmLeadProjectFlow(TransactionCase):
     """Test CRM Lead extensions and project creation flow."""
@@ -174,3 +178,83 @@ class TestCrmLeadProjectFlow(TransactionCase):
         
         # Estimate should be deleted too
         self.assertFalse(self.env['ptt.crm.vendor.estimate'].browse(estimate_id).exists())
+
+
+@tagged('post_install', '-at_install')
+class TestCrmLeadInvoiceRollup(AccountTestInvoicingCommon):
+    """Test the grouped financial rollups of CRM leads."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up leads with orders in various invoicing states."""
+        super().setUpClass()
+        cls.product = cls._create_product(
+            name='Event Service',
+            type='service',
+            invoice_policy='order',
+            lst_price=1000.0,
+            taxes_id=[],
+        )
+        cls.leads = cls.env['crm.lead'].create([
+            {'name': 'Paid and partially paid orders', 'partner_id': cls.partner_a.id},
+            {'name': 'Paid and refunded order', 'partner_id': cls.partner_a.id},
+            {'name': 'Overdue order', 'partner_id': cls.partner_a.id},
+            {'name': 'Uninvoiced order', 'partner_id': cls.partner_a.id},
+            {'name': 'No order', 'partner_id': cls.partner_a.id},
+        ])
+        paid_partial, paid_refunded, overdue, uninvoiced, _no_order = cls.leads
+        
+        invoice = cls._create_order_invoice(paid_partial)
+        cls._register_payment(invoice)
+        invoice = cls._create_order_invoice(paid_partial)
+        cls._register_payment(invoice, amount=400.0)
+        
+        invoice = cls._create_order_invoice(paid_refunded)
+        cls._register_payment(invoice)
+        cls._reverse_invoice(invoice, post=True)
+        
+        cls._create_order_invoice(overdue, invoice_date='2020-01-01')
+        
+        cls._create_order(uninvoiced)
+    
+    @classmethod
+    def _create_order(cls, lead):
+        order = cls.env['sale.order'].create({
+            'partner_id': cls.partner_a.id,
+            'opportunity_id': lead.id,
+            'order_line': [Command.create({'product_id': cls.product.id, 'product_uom_qty': 1})],
+        })
+        order.action_confirm()
+        return order
+    
+    @classmethod
+    def _create_order_invoice(cls, lead, invoice_date=None):
+        invoice = cls._create_order(lead)._create_invoices()
+        if invoice_date:
+            invoice.invoice_date = invoice_date
+        invoice.action_post()
+        return invoice
+    
+    def test_invoice_rollup_matches_per_lead_values(self):
+        """Test the batch rollups against the values computed lead by lead."""
+        self.leads.invalidate_recordset()
+        for lead in self.leads:
+            invoices = lead.order_ids.invoice_ids.filtered(lambda inv: inv.move_type == 'out_invoice')
+            total = sum(invoices.mapped('amount_total'))
+            remaining = sum(invoices.mapped('amount_residual'))
+            self.assertEqual(lead.ptt_sale_order_count, len(lead.order_ids))
+            self.assertEqual(lead.ptt_invoice_count, len(invoices))
+            self.assertAlmostEqual(lead.ptt_invoice_total, total)
+            self.assertAlmostEqual(lead.ptt_invoice_paid, total - remaining)
+            self.assertAlmostEqual(lead.ptt_invoice_remaining, remaining)
+        
+        self.assertEqual(
+            [(lead.ptt_sale_order_count, lead.ptt_invoice_count) for lead in self.leads],
+            [(2, 2), (1, 1), (1, 1), (1, 0), (0, 0)],
+        )
+        self.assertEqual(
+            self.leads.mapped('ptt_payment_status'),
+            ['partial', 'paid', 'overdue', 'not_paid', 'not_paid'],
+        )
+        self.assertAlmostEqual(self.leads[0].ptt_invoice_paid, 1400.0)
+        self.assertAlmostEqual(self.leads[0].ptt_invoice_remaining, 600.0)
@@ -160,6 +160,32 @@ class TestEventReminders(TransactionCase):
         self.assertIn(task_open, incomplete)
         self.assertNotIn(task_done, incomplete)
     
+    def test_reminder_digests_grouped_by_project(self):
+        """Test the digest builder splits tasks and missing info per project."""
+        target_date = fields.Date.today() + timedelta(days=10)
+        project_a = self._create_project_for_date(target_date, name='Digest Project A')
+        project_b = self._create_project_for_date(
+            target_date,
+            name='Digest Project B',
+            ptt_venue_name=False,
+        )
+        open_stage = self.env['project.task.type'].create({
+            'name': 'To Do',
+            'fold': False,
+        })
+        self.env['project.task'].create({
+            'name': 'Book the DJ',
+            'project_id': project_a.id,
+            'stage_id': open_stage.id,
+        })
+        
+        digests = (project_a | project_b)._get_event_reminder_digests()
+        
+        self.assertEqual(digests[project_a.id]['ptt_incomplete_tasks'], ['Book the DJ'])
+        self.assertEqual(digests[project_b.id]['ptt_incomplete_tasks'], [])
+        self.assertNotIn('Venue name not set', digests[project_a.id]['ptt_missing_info'])
+        self.assertIn('Venue name not set', digests[project_b.id]['ptt_missing_info'])
+    
     def test_cron_method_exists(self):
         """Test that cron methods exist and are callable."""
         Project = self.env['project.project']
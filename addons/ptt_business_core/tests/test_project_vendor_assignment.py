@@ -101,6 +101,43 @@ class TestProjectVendorAssignment(TransactionCase):
         # Margin calculation
         self.assertEqual(self.project.ptt_actual_margin, 7450.00)  # 10000 - 2550
         
+    def test_project_vendor_stats_delta(self):
+        """Test project statistics follow assignment writes and deletes."""
+        assignment = self.env['ptt.project.vendor.assignment'].create({
+            'project_id': self.project.id,
+            'service_type': 'dj',
+            'vendor_id': self.vendor_dj.id,
+            'estimated_cost': 1000.00,
+            'actual_cost': 950.00,
+        })
+        self.assertEqual(self.project.ptt_vendor_count, 1)
+        
+        assignment.actual_cost = 1100.00
+        self.assertEqual(self.project.ptt_total_actual_cost, 1100.00)
+        self.assertEqual(self.project.ptt_cost_variance, 100.00)
+        
+        assignment.unlink()
+        self.assertEqual(self.project.ptt_vendor_count, 0)
+        self.assertEqual(self.project.ptt_total_estimated_cost, 0.00)
+        self.assertEqual(self.project.ptt_total_actual_cost, 0.00)
+        
+    def test_project_vendor_stats_rebuild(self):
+        """Test the statistics check repairs drifted aggregates."""
+        self.env['ptt.project.vendor.assignment'].create({
+            'project_id': self.project.id,
+            'service_type': 'dj',
+            'vendor_id': self.vendor_dj.id,
+            'estimated_cost': 1000.00,
+            'actual_cost': 950.00,
+        })
+        self.project.write({'ptt_vendor_count': 7, 'ptt_total_actual_cost': 0.0})
+        
+        Assignment = self.env['ptt.project.vendor.assignment']
+        self.assertTrue(Assignment._ptt_check_stats())
+        self.assertEqual(self.project.ptt_vendor_count, 1)
+        self.assertEqual(self.project.ptt_total_actual_cost, 950.00)
+        self.assertFalse(Assignment._ptt_check_stats())
+        
     def test_vendor_name_denormalized(self):
         """Test vendor name is stored for search efficiency."""
         assignment = self.env['ptt.project.vendor.assignment'].create({
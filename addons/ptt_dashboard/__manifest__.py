@@ -30,6 +30,7 @@ Based on Synconics BI Dashboard technology.
     "version": "19.0.1.0.1",
     "depends": [
         "web",
+        "bus",
         "mail",
         "project",
         "crm",
@@ -90,6 +91,7 @@ Based on Synconics BI Dashboard technology.
         "wizard/mail_compose_message_views.xml",
         "views/dashboard_view.xml",
         "data/dashboard_data.xml",
+        "data/ir_cron_data.xml",
         "data/ptt_dashboards.xml",
         "data/ptt_dashboard_charts.xml",
         "views/dashboard_chart_view.xml",
@@ -0,0 +1,49 @@
+import json
+import os
+import tempfile
+
+from odoo import http, _
+from odoo.exceptions import UserError
+from odoo.http import request
+
+EXPORT_MIMETYPES = {
+    "csv": "text/csv;charset=utf-8",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+
+class DashboardExport(http.Controller):
+    @http.route("/ptt_dashboard/export", type="http", auth="user", methods=["POST"])
+    def export_chart(self, chart_id, file_type, print_vals="{}", **kwargs):
+        """
+        Stream the export of a chart. The rows are written to a temporary
+        file as they are read, so the memory used does not depend on the
+        number of rows.
+        """
+        if file_type not in EXPORT_MIMETYPES:
+            raise request.not_found()
+        chart = request.env["dashboard.chart"].browse(int(chart_id)).exists()
+        if not chart:
+            raise request.not_found()
+        chart.check_access("read")
+        fd, path = tempfile.mkstemp(
+            prefix="ptt_dashboard_export_", suffix=f".{file_type}"
+        )
+        os.close(fd)
+        try:
+            if not chart._write_export_file(file_type, path, json.loads(print_vals)):
+                raise UserError(
+                    _("No data is available for downloading the file at this time!")
+                )
+            # the response keeps the file open, it can be removed right away
+            return http.Stream(
+                type="path",
+                path=path,
+                mimetype=EXPORT_MIMETYPES[file_type],
+                download_name=f"{chart.name}.{file_type}",
+                size=os.path.getsize(path),
+                etag=False,
+                conditional=False,
+            ).get_response(as_attachment=True)
+        finally:
+            os.unlink(path)
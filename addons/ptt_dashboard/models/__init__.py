@@ -5,3 +5,7 @@ from . import list_field
 from . import dashboard_action
 from . import dashboard
 from . import dashboard_chart
+from . import dashboard_chart_rollup
+from . import dashboard_chart_signal
+from . import models
+from . import ir_websocket
@@ -1,7 +1,9 @@
+import copy
+
 from odoo import models, fields, api, _
 from odoo.tools.safe_eval import safe_eval
 from markupsafe import Markup
-from odoo.exceptions import ValidationError
+from odoo.exceptions import AccessError, ValidationError
 
 
 class Dashboard(models.Model):
@@ -51,6 +53,12 @@ class Dashboard(models.Model):
         string="Auto-Refresh Interval",
         tracking=True,
     )
+    live_refresh = fields.Boolean(
+        string="Live Refresh",
+        help="Refresh the charts as soon as their source records change instead of "
+        "reloading every chart on the auto-refresh interval.",
+        tracking=True,
+    )
     mail_cron_id = fields.Many2one("ir.cron", string="Mail Cron Job", copy=False)
     dashboard_mail_ids = fields.One2many(
         "dashboard.mail",
@@ -482,6 +490,15 @@ class Dashboard(models.Model):
             )
             if not dashboard_emails:
                 return False
+            # every chart is computed once, whatever the number of mails
+            # it is sent with
+            all_charts = dashboard_emails.chart_ids
+            images = all_charts.filtered(
+                lambda chart: chart.chart_type in ["kpi", "tile"]
+            ).get_chart_snapshots()
+            payloads = all_charts.filtered(
+                lambda chart: chart.chart_type not in ["kpi", "tile"]
+            ).get_batch_chart_data()
             for mail in dashboard_emails:
                 items = []
                 charts = mail.chart_ids
@@ -491,10 +508,10 @@ class Dashboard(models.Model):
                         chart_dict = {
                             "chart_id": chart.id,
                             "name": chart.name,
-                            "image": chart.html_to_image(),
+                            "image": images[chart.id],
                         }
                     else:
-                        chart_data = chart.get_chart_data(chart.chart_type, chart.name)
+                        chart_data = copy.deepcopy(payloads[chart.id])
                         chart_dict = {
                             "chart_id": chart.id,
                             "chart_type": chart.chart_type,
@@ -686,22 +703,9 @@ class Dashboard(models.Model):
             and not user.has_group("ptt_dashboard.group_dashboard_manager")
         ):
             is_dashboard_user = True
-        user_groups = user.group_ids.ids
-        for chart in self.chart_ids:
-            if (
-                (chart.model_id and not user.has_read_access(chart.model_id))
-                or (
-                    chart.chart_type == "kpi"
-                    and chart.kpi_model_id
-                    and not user.has_read_access(chart.kpi_model_id)
-                )
-                or (
-                    chart.group_ids
-                    and not chart.group_ids.filtered(lambda g: g.id in user_groups)
-                )
-            ):
-                continue
-
+        charts = self._get_user_charts()
+        chart_data = charts.get_batch_chart_data()
+        for chart in charts:
             if chart.id not in existing_ids:
                 x, y = self.find_next_position(
                     grid_stack, 4 if chart.chart_type not in ["tile", "kpi"] else 2
@@ -730,7 +734,7 @@ class Dashboard(models.Model):
                     "name": chart.name,
                     "chart_type": chart.chart_type,
                     "theme": chart.theme,
-                    "recordset": chart.get_chart_data(chart.chart_type, chart.name),
+                    "recordset": chart_data[chart.id],
                     "background_color": chart.background_color,
                     **{k: dim[k] for k in ("x", "y", "h", "w", "minh")},
                 }
@@ -741,8 +745,82 @@ class Dashboard(models.Model):
             chart_data_list,
             self.name,
             is_dashboard_user,
+            self.live_refresh,
         ]
 
+    def _get_user_charts(self):
+        """
+        Return the charts of the dashboard the current user is allowed to see
+        """
+        user = self.env.user
+        user_groups = user.group_ids.ids
+        model_access = {}
+
+        def has_read_access(model):
+            if model not in model_access:
+                model_access[model] = user.has_read_access(model)
+            return model_access[model]
+
+        charts = self.env["dashboard.chart"]
+        for chart in self.chart_ids:
+            if (
+                (chart.model_id and not has_read_access(chart.model_id))
+                or (
+                    chart.chart_type == "kpi"
+                    and chart.kpi_model_id
+                    and not has_read_access(chart.kpi_model_id)
+                )
+                or (
+                    chart.group_ids
+                    and not chart.group_ids.filtered(lambda g: g.id in user_groups)
+                )
+            ):
+                continue
+            charts |= chart
+        return charts
+
+    def get_live_charts_data(self, chart_ids):
+        """
+        Called by the client of a live dashboard when the bus announces that
+        the source records of some of its charts changed: only those charts
+        are recomputed.
+        """
+        self.ensure_one()
+        try:
+            self.check_access("read")
+        except AccessError:
+            # the dashboard was unshared while open, stop refreshing it
+            return {}
+        charts = self._get_user_charts().filtered(lambda c: c.id in chart_ids)
+        # the payloads cached before the change are stale already
+        return charts.get_batch_chart_data()
+
+    @api.model
+    def _notify_live_dashboards(self, model_names):
+        """
+        Tell the clients of the live dashboards which charts are built on the
+        given models, so they reload them
+        """
+        model_names = list(model_names)
+        charts = (
+            self.env["dashboard.chart"]
+            .sudo()
+            .search(
+                [
+                    ("dashboard_id.live_refresh", "=", True),
+                    "|",
+                    ("model_id.model", "in", model_names),
+                    ("kpi_model_id.model", "in", model_names),
+                ]
+            )
+        )
+        for dashboard, dashboard_charts in charts.grouped("dashboard_id").items():
+            self.env["bus.bus"]._sendone(
+                dashboard,
+                "ptt_dashboard/charts_changed",
+                {"chart_ids": dashboard_charts.ids},
+            )
+
     def find_next_position(self, items, new_width, grid_columns=12):
         """
         In case of in any charts positioning is not saved then this function will evaluate positioning
@@ -1,7 +1,13 @@
 import io
+import re
 import csv
+import copy
 import base64
+import hashlib
+import functools
 import logging
+import threading
+from time import monotonic
 
 # imgkit is optional - only needed for PDF export
 try:
@@ -22,17 +28,56 @@ except ImportError:
 from math import gcd
 from markupsafe import Markup
 from types import SimpleNamespace
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict, OrderedDict
 from datetime import datetime, timedelta, date, time
 from dateutil.relativedelta import relativedelta
+import pytz
 
 from odoo import models, fields, api, _
-from odoo.tools import groupby, format_amount
+from odoo.tools import date_utils, groupby, format_amount, get_lang, ormcache
 from odoo.tools.safe_eval import safe_eval
-from odoo.exceptions import ValidationError
+from odoo.exceptions import AccessError, ValidationError
 
 _logger = logging.getLogger(__name__)
 
+# Field types the charts can group on directly in SQL through ``_read_group``
+AGGREGATE_GROUPBY_TYPES = (
+    "many2one",
+    "selection",
+    "char",
+    "integer",
+    "boolean",
+    "date",
+    "datetime",
+)
+# number of records read at once by the streamed exports
+EXPORT_FETCH_SIZE = 1000
+# number of records loaded at once by the list tiles
+LIST_PAGE_SIZE = 80
+# configuration the rollups of the incremental charts are computed from
+ROLLUP_FIELDS = {
+    "use_rollup",
+    "chart_type",
+    "dashboard_id",
+    "model_id",
+    "domain",
+    "data_type",
+    "measurement_field_id",
+    "date_filter_field_id",
+    "date_filter_option",
+    "limit_record",
+    "kpi_model_id",
+    "kpi_domain",
+    "kpi_data_type",
+    "kpi_measurement_field_id",
+    "kpi_date_filter_field_id",
+    "kpi_date_filter_option",
+    "kpi_limit_record",
+}
+# domains using these names depend on the current date
+ROLLUP_DYNAMIC_NAMES = frozenset({"context_today", "datetime", "relativedelta", "time"})
+
 
 class UTCDatetime:
     def __init__(self, dt):
@@ -75,6 +120,116 @@ def format_date_by_range(value, time_range):
         return str(value)  # default fallback
 
 
+class ChartDataCache:
+    """
+    Size bounded LRU cache of chart payloads with a time to live.
+
+    Every entry is stored with the generations of the models it was computed
+    from (see ``dashboard.chart.signal``); a change of one of these models
+    makes all the payloads built on it stale without having to look them up.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key, generations):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expiry, entry_generations, payload = entry
+            if expiry < monotonic() or entry_generations != generations:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return copy.deepcopy(payload)
+
+    def set(self, key, generations, payload, ttl, max_size):
+        payload = copy.deepcopy(payload)
+        with self._lock:
+            self._entries[key] = (monotonic() + ttl, generations, payload)
+            self._entries.move_to_end(key)
+            while len(self._entries) > max_size:
+                self._entries.popitem(last=False)
+
+
+chart_data_cache = ChartDataCache()
+# snapshot images by hash of the page they are rendered from
+snapshot_cache = ChartDataCache()
+SNAPSHOT_CACHE_TTL = 3600
+SNAPSHOT_CACHE_SIZE = 100
+
+
+def render_snapshot(html):
+    """
+    Render a chart page into a JPEG data URL with wkhtmltoimage
+    """
+    options = {
+        "encoding": "UTF-8",
+        "zoom": "1",
+    }
+    img_binary = imgkit.from_string(html, False, options=options)
+    img_base64 = base64.b64encode(img_binary).decode("UTF-8")
+    return f"data:image/jpeg;base64,{img_base64}"
+
+
+class OdooSafeDatetime:
+    def __init__(self, dt):
+        self._dt = dt
+
+    def to_utc(self):
+        utc_dt = fields.Datetime.to_datetime(self._dt)
+        return OdooSafeDatetime(utc_dt)
+
+    def strftime(self, fmt):
+        return self._dt.strftime(fmt)
+
+
+class OdooDatetimeClass:
+    @staticmethod
+    def combine(date_obj, time_obj):
+        combined = datetime.combine(date_obj, time_obj)
+        return OdooSafeDatetime(combined)
+
+
+class DatetimeModule:
+    datetime = OdooDatetimeClass
+    time = time
+
+
+@functools.lru_cache(maxsize=1024)
+def get_domain_names(domain_string):
+    """
+    Names used by a chart domain expression
+    """
+    try:
+        return frozenset(compile(domain_string.strip(), "<domain>", "eval").co_names)
+    except (SyntaxError, ValueError):
+        return frozenset()
+
+
+@functools.lru_cache(maxsize=1024)
+def evaluate_domain_string(domain_string, today=None):
+    """
+    Evaluate a chart domain expression. The result only depends on the text
+    and, for relative dates, on the current day, so it is cached on both;
+    callers get it through :meth:`DashboardChart.evaluate_odoo_domain`,
+    which copies it.
+    """
+    eval_context = {
+        "datetime": DatetimeModule(),
+        "context_today": lambda: today,
+        "relativedelta": relativedelta,
+    }
+
+    try:
+        return safe_eval(domain_string, eval_context)
+    except Exception as e:
+        _logger.warning(f"Failed to evaluate domain: {domain_string}, Error: {e}")
+        return []
+
+
 class DashboardChart(models.Model):
     _name = "dashboard.chart"
     _description = "Dashboard Charts"
@@ -464,6 +619,15 @@ class DashboardChart(models.Model):
     same_period_previous_years = fields.Integer(
         string="Same Period Previous Years", default=0
     )
+    use_rollup = fields.Boolean(
+        string="Incremental KPI",
+        tracking=True,
+        help="Compute the tile from per-day aggregates updated as the records "
+        "change instead of reading all the records. Requires stored date "
+        "filter and measure fields that are not computed, no record limit and "
+        "a domain without relative dates. "
+        "The aggregates do not depend on the record rules of the viewer.",
+    )
     icon_option = fields.Selection(
         [("default", "Default"), ("custom", "Custom")],
         default="default",
@@ -555,6 +719,201 @@ class DashboardChart(models.Model):
             order=order,
         )
 
+    @api.model_create_multi
+    def create(self, vals_list):
+        charts = super(DashboardChart, self).create(vals_list)
+        new_models = charts._get_source_model_names()
+        if new_models - self._get_dashboard_source_models() or any(
+            charts.mapped("use_rollup")
+        ):
+            # _get_dashboard_source_models, _get_rollup_source_models
+            self.env.registry.clear_cache("default")
+        charts.filtered("use_rollup")._rebuild_rollups()
+        return charts
+
+    def write(self, vals):
+        res = super(DashboardChart, self).write(vals)
+        if ({"model_id", "kpi_model_id"} | ROLLUP_FIELDS) & vals.keys():
+            # _get_dashboard_source_models, _get_rollup_source_models
+            self.env.registry.clear_cache("default")
+        if ROLLUP_FIELDS & vals.keys():
+            self._rebuild_rollups()
+        return res
+
+    def unlink(self):
+        model_names = self._get_source_model_names()
+        use_rollup = any(self.mapped("use_rollup"))
+        res = super(DashboardChart, self).unlink()
+        # the source models stay cached as long as another chart uses them
+        remaining_charts = self.sudo().with_context(active_test=False).search(
+            [
+                "|",
+                ("model_id.model", "in", list(model_names)),
+                ("kpi_model_id.model", "in", list(model_names)),
+            ]
+        )
+        if use_rollup or model_names - remaining_charts._get_source_model_names():
+            # _get_dashboard_source_models, _get_rollup_source_models
+            self.env.registry.clear_cache("default")
+        return res
+
+    def _get_source_model_names(self):
+        """
+        Names of the models the given charts are computed from
+        """
+        return set(self.model_id.mapped("model") + self.kpi_model_id.mapped("model"))
+
+    @api.model
+    @ormcache()
+    def _get_dashboard_source_models(self):
+        """
+        Names of the models the dashboard charts are computed from
+        """
+        charts = self.sudo().with_context(active_test=False).search([])
+        return frozenset(charts._get_source_model_names())
+
+    @api.model
+    @ormcache()
+    def _get_rollup_source_models(self):
+        """
+        Date fields of the models aggregated by the incremental charts,
+        by model name
+        """
+        date_fields = defaultdict(set)
+        charts = self.sudo().search([("use_rollup", "=", True)])
+        for chart in charts:
+            for source in chart._get_rollup_sources():
+                date_fields[source["model"]].add(source["date_field"])
+        return {model: frozenset(names) for model, names in date_fields.items()}
+
+    def _get_rollup_sources(self):
+        """
+        Return the data sets of the chart computed from the rollups, the
+        main data and, for KPIs, the second data when they are eligible
+        """
+        self.ensure_one()
+        if not self.use_rollup:
+            return []
+        candidates = [
+            (
+                "main",
+                self.model_id,
+                self.date_filter_field_id,
+                self.date_filter_option,
+                self.data_type,
+                self.measurement_field_id,
+                self.limit_record,
+                self.domain,
+            )
+        ]
+        if self.chart_type == "kpi" and self.kpi_model_id:
+            candidates.append(
+                (
+                    "kpi",
+                    self.kpi_model_id,
+                    self.kpi_date_filter_field_id,
+                    self.kpi_date_filter_option,
+                    self.kpi_data_type,
+                    self.kpi_measurement_field_id,
+                    self.kpi_limit_record,
+                    self.kpi_domain,
+                )
+            )
+        sources = []
+        for (
+            measure,
+            model,
+            date_field,
+            date_option,
+            data_type,
+            measure_field,
+            limit,
+            domain,
+        ) in candidates:
+            # computed fields are recomputed on flush, out of sight of the
+            # write hooks marking the days to refresh
+            if (
+                not model
+                or not self._is_rollup_field(model, date_field)
+                or date_option in (False, "none")
+                or (
+                    data_type != "count"
+                    and not self._is_rollup_field(model, measure_field)
+                )
+                or limit
+                or (domain and get_domain_names(domain) & ROLLUP_DYNAMIC_NAMES)
+            ):
+                continue
+            domain = self.evaluate_odoo_domain(domain) if domain else []
+            if self.company_id and "company_id" in self.env[model.model]._fields:
+                domain.append(("company_id", "in", [self.company_id.id, False]))
+            sources.append(
+                {
+                    "measure": measure,
+                    "model": model.model,
+                    "date_field": date_field.name,
+                    "measure_field": measure_field.name
+                    if data_type != "count"
+                    else False,
+                    "domain": domain,
+                }
+            )
+        return sources
+
+    @api.model
+    def _is_rollup_field(self, model, field):
+        """
+        Whether the rollups can be maintained on a field, it must be stored
+        and only change through the writes of the records
+        """
+        if not field.store or model.model not in self.env:
+            return False
+        record_field = self.env[model.model]._fields.get(field.name)
+        return bool(record_field) and not record_field.compute
+
+    def _rebuild_rollups(self):
+        """
+        Recompute all the rollups of the charts
+        """
+        Rollup = self.env["dashboard.chart.rollup"].sudo()
+        for chart in self:
+            Rollup.search([("chart_id", "=", chart.id)]).unlink()
+            for source in chart._get_rollup_sources():
+                Rollup._refresh(chart, source)
+
+    @api.model
+    def _cron_rebuild_rollups(self):
+        """
+        Rebuild the rollups of the incremental charts, catching up with the
+        changes the write hooks cannot see, like SQL updates or the records
+        entering a domain through a related field
+        """
+        self.sudo().search([("use_rollup", "=", True)])._rebuild_rollups()
+
+    @api.constrains(
+        "use_rollup",
+        "chart_type",
+        "model_id",
+        "date_filter_field_id",
+        "date_filter_option",
+        "data_type",
+        "measurement_field_id",
+        "limit_record",
+        "domain",
+    )
+    def _check_use_rollup(self):
+        for chart in self:
+            if not chart.use_rollup:
+                continue
+            if chart.chart_type not in ("tile", "kpi") or not any(
+                source["measure"] == "main" for source in chart._get_rollup_sources()
+            ):
+                raise ValidationError(
+                    _(
+                        "Incremental KPI is only available for tiles and KPIs with stored date filter and measure fields that are not computed, no record limit and a domain without relative dates."
+                    )
+                )
+
     @api.constrains("limit_record")
     def _check_limit_record(self):
         for chart in self:
@@ -876,91 +1235,7 @@ class DashboardChart(models.Model):
             return {"error": True}
         output = io.StringIO()
         writer = csv.writer(output)
-        if chart_type in [
-            "area_chart",
-            "bar_chart",
-            "column_chart",
-            "doughnut_chart",
-            "line_chart",
-            "stackedcolumn_chart",
-            "radial_chart",
-            "scatter_chart",
-        ]:
-            all_metrics = set()
-            normalized_rows = []
-
-            for entry in data:
-                category = entry.get("category")
-                group_data = defaultdict(dict)
-                for key, value in entry.items():
-                    if key in ["category", "record_id"]:
-                        continue
-                    if " - " in key:
-                        group_name, metric = key.rsplit(" - ", 1)
-                    else:
-                        group_name = key
-                        metric = "Value"
-                    group_data[group_name][metric] = value
-                    all_metrics.add(metric)
-                normalized_rows.extend(
-                    [
-                        {"Category": category, "Name": group_name, **metrics}
-                        for group_name, metrics in group_data.items()
-                    ]
-                )
-            metric_list = sorted(all_metrics)
-
-            writer = csv.DictWriter(
-                output, fieldnames=["Category", "Name"] + metric_list
-            )
-            writer.writeheader()
-            for row in normalized_rows:
-                writer.writerow(row)
-        elif chart_type in [
-            "funnel_chart",
-            "pyramid_chart",
-            "pie_chart",
-            "radar_chart",
-            "map_chart",
-        ]:
-            if chart_type == "map_chart":
-                writer.writerow(["Name", "Value"])  # Header
-            else:
-                writer.writerow(["Category", "Value"])  # Header
-            for row in data:
-                if chart_type == "map_chart":
-                    writer.writerow([row["name"], row["value"]])
-                else:
-                    writer.writerow([row["category"], row["value"]])
-        elif chart_type == "list":
-            column_lists = list(map(lambda col: col.get("name"), data["columns"]))
-            writer.writerow(column_lists)
-            for record in data["records"]:
-                row_list = []
-                for col in data["columns"]:
-                    row_list.append(record.get(col["column_name"]))
-                writer.writerow(row_list)
-
-        elif chart_type == "to_do":
-            if self.todo_layout == "default":
-                writer.writerow(["Name", "Task"])
-                for record in data["records"]:
-                    for action in record.get("action_line_ids"):
-                        if action.get("active_record"):
-                            writer.writerow([record.get("name"), action.get("name")])
-            else:
-                writer.writerow(["Date", "Summary", "Name", "User", "Activity Type"])
-
-                for record in data["records"]:
-                    writer.writerow(
-                        [
-                            record["date"].strftime("%Y-%m-%d"),
-                            record["summary"] if record["summary"] else "",
-                            record["name"],
-                            record["username"],
-                            record["activity_type"],
-                        ]
-                    )
+        writer.writerows(self._get_export_rows(chart_type, data))
 
         file_name = name + ".csv"
         csv_bytes = output.getvalue().encode("utf-8")
@@ -1259,42 +1534,177 @@ class DashboardChart(models.Model):
             "file_name": f"{name}.xlsx",
         }
 
-    def evaluate_odoo_domain(self, domain_string):
-        class OdooSafeDatetime:
-            def __init__(self, dt):
-                self._dt = dt
-
-            def to_utc(self):
-                utc_dt = fields.Datetime.to_datetime(self._dt)
-                return OdooSafeDatetime(utc_dt)
-
-            def strftime(self, fmt):
-                return self._dt.strftime(fmt)
-
-        class OdooDatetimeClass:
-            @staticmethod
-            def combine(date_obj, time_obj):
-                combined = datetime.combine(date_obj, time_obj)
-                return OdooSafeDatetime(combined)
-
-        class DatetimeModule:
-            datetime = OdooDatetimeClass
-            time = time
-
-        def get_context_today():
-            return fields.Datetime.context_timestamp(self, datetime.now()).date()
-
-        eval_context = {
-            "datetime": DatetimeModule(),
-            "context_today": get_context_today,
-            "relativedelta": relativedelta,
-        }
+    def _get_export_rows(self, chart_type, data):
+        """
+        Yield the header and the rows of an export from the chart data
+        """
+        if chart_type in [
+            "area_chart",
+            "bar_chart",
+            "column_chart",
+            "doughnut_chart",
+            "line_chart",
+            "stackedcolumn_chart",
+            "radial_chart",
+            "scatter_chart",
+        ]:
+            all_metrics = set()
+            normalized_rows = []
+
+            for entry in data:
+                category = entry.get("category")
+                group_data = defaultdict(dict)
+                for key, value in entry.items():
+                    if key in ["category", "record_id"]:
+                        continue
+                    if " - " in key:
+                        group_name, metric = key.rsplit(" - ", 1)
+                    else:
+                        group_name = key
+                        metric = "Value"
+                    group_data[group_name][metric] = value
+                    all_metrics.add(metric)
+                normalized_rows.extend(
+                    [
+                        {"Category": category, "Name": group_name, **metrics}
+                        for group_name, metrics in group_data.items()
+                    ]
+                )
+            header = ["Category", "Name"] + sorted(all_metrics)
+            yield header
+            for row in normalized_rows:
+                yield [row.get(column, "") for column in header]
+        elif chart_type in [
+            "funnel_chart",
+            "pyramid_chart",
+            "pie_chart",
+            "radar_chart",
+            "map_chart",
+        ]:
+            if chart_type == "map_chart":
+                yield ["Name", "Value"]
+            else:
+                yield ["Category", "Value"]
+            for row in data:
+                if chart_type == "map_chart":
+                    yield [row["name"], row["value"]]
+                else:
+                    yield [row["category"], row["value"]]
+        elif chart_type == "list":
+            yield [col.get("name") for col in data["columns"]]
+            records = data["records"]
+            pager = data.get("pager")
+            offset = 0
+            while records:
+                for record in records:
+                    yield [record.get(col["column_name"]) for col in data["columns"]]
+                offset += len(records)
+                if not pager:
+                    break
+                # keep the memory bounded to one page of records
+                self.env.invalidate_all()
+                records = self._read_list_view_page(
+                    dict(pager, page_size=EXPORT_FETCH_SIZE), offset
+                )
+
+        elif chart_type == "to_do":
+            if self.todo_layout == "default":
+                yield ["Name", "Task"]
+                for record in data["records"]:
+                    for action in record.get("action_line_ids"):
+                        if action.get("active_record"):
+                            yield [record.get("name"), action.get("name")]
+            else:
+                yield ["Date", "Summary", "Name", "User", "Activity Type"]
+                for record in data["records"]:
+                    yield [
+                        record["date"].strftime("%Y-%m-%d"),
+                        record["summary"] if record["summary"] else "",
+                        record["name"],
+                        record["username"],
+                        record["activity_type"],
+                    ]
+
+    def _iter_export_rows(self, print_vals=False):
+        """
+        Yield the header and the rows of the chart export. Standard list
+        tiles are read by pages of EXPORT_FETCH_SIZE records instead of
+        being loaded at once.
+        """
+        self.ensure_one()
+        print_options = False
+        if print_vals and print_vals.get("breadcrump_ids"):
+            print_options = {
+                "breadcrump_ids": print_vals.get("breadcrump_ids")[-1:],
+                "domain": print_vals.get("prev_domains"),
+            }
+        data = self.get_chart_data(
+            self.chart_type, self.name, print_options=print_options
+        )
+        if isinstance(data, dict) and data.get("type") == "error":
+            return
+        yield from self._get_export_rows(self.chart_type, data)
+
+    def _write_export_file(self, file_type, path, print_vals=False):
+        """
+        Write the chart export into the file at the given path, one row at a
+        time, and return the number of rows written
+        """
+        rows = self._iter_export_rows(print_vals)
+        header = next(rows, None)
+        if header is None:
+            return 0
+        count = 0
+        if file_type == "csv":
+            with open(path, "w", newline="", encoding="utf-8") as file:
+                writer = csv.writer(file)
+                writer.writerow(header)
+                for row in rows:
+                    writer.writerow(row)
+                    count += 1
+            return count
+
+        if not XLSXWRITER_AVAILABLE:
+            raise ValidationError(
+                _("Excel export requires the Python package 'xlsxwriter'.")
+            )
+        # constant_memory flushes every row to disk once the next one starts
+        workbook = xlsxwriter.Workbook(path, {"constant_memory": True})
+        worksheet = workbook.add_worksheet(
+            re.sub(r"[\[\]:*?/\\]", "", self.name)[:31] or None
+        )
+        header_format = workbook.add_format(
+            {"bold": True, "bg_color": "#BDD7EE", "border": 1}
+        )
+        cell_format = workbook.add_format({"border": 1})
+        date_format = workbook.add_format({"num_format": "dd-mm-yyyy", "border": 1})
+        col_widths = {}
+        for col_idx, value in enumerate(header):
+            worksheet.write(0, col_idx, value, header_format)
+            col_widths[col_idx] = len(str(value))
+        for row_idx, row in enumerate(rows, start=1):
+            for col_idx, value in enumerate(row):
+                if isinstance(value, (date, datetime)):
+                    worksheet.write_datetime(row_idx, col_idx, value, date_format)
+                else:
+                    worksheet.write(row_idx, col_idx, value, cell_format)
+                col_widths[col_idx] = max(
+                    col_widths.get(col_idx, 0), len(str(value))
+                )
+            count += 1
+        for col_idx, width in col_widths.items():
+            worksheet.set_column(col_idx, col_idx, min(width, 80) + 2)
+        workbook.close()
+        return count
 
-        try:
-            return safe_eval(domain_string, eval_context)
-        except Exception as e:
-            _logger.warning(f"Failed to evaluate domain: {domain_string}, Error: {e}")
+    def evaluate_odoo_domain(self, domain_string):
+        if not isinstance(domain_string, str):
             return []
+        # only the relative dates depend on the call, on the user's today
+        today = None
+        if "context_today" in get_domain_names(domain_string):
+            today = fields.Datetime.context_timestamp(self, datetime.now()).date()
+        return copy.deepcopy(evaluate_domain_string(domain_string, today))
 
     def get_chart_data(
         self,
@@ -1304,6 +1714,7 @@ class DashboardChart(models.Model):
         data=False,
         extra_action=False,
         print_options=False,
+        query_cache=None,
     ):
         """
         this function is called from chart wrapper and form preview.
@@ -1313,6 +1724,7 @@ class DashboardChart(models.Model):
         each click on chart this function will redirect action or replace current chart
         """
         conf, domain = self._init_configuration()
+        conf.query_cache = query_cache
         if isDirty:
             self._handle_dirty_data(conf, data)
         conf.chart_type = chart_type
@@ -1371,6 +1783,116 @@ class DashboardChart(models.Model):
             prepared_data, domain, chart_type, view_item, extra_action
         )
 
+    def get_batch_chart_data(self, refresh=False):
+        """
+        Evaluate several charts at once. Charts sharing the same model, domain
+        and date window run their base query only once, the result being fanned
+        out to the tile, KPI and chart handlers.
+
+        :param refresh: recompute the charts even if a cached payload exists
+        """
+        ICP = self.env["ir.config_parameter"].sudo()
+        cache_ttl = int(ICP.get_param("ptt_dashboard.chart_cache_ttl", 300))
+        cache_size = int(ICP.get_param("ptt_dashboard.chart_cache_size", 1000))
+        query_cache = {}
+        result = {}
+        cache_keys = {}
+        if cache_ttl > 0:
+            cache_keys = {chart: chart._get_chart_cache_key() for chart in self}
+        # the generations are read in the transaction the charts are computed
+        # in, so that they match the state of the data the payloads show
+        all_generations = self.env["dashboard.chart.signal"]._get_generations(
+            {model for __, source_models in cache_keys.values() for model in source_models}
+        )
+        # the changes of the current transaction are not signaled yet
+        changed_models = self.env.cr.precommit.data.get(
+            "ptt_dashboard.changed_models", frozenset()
+        )
+        for chart in self:
+            cache_key, source_models = cache_keys.get(chart, (None, ()))
+            if cache_key is None or not changed_models.isdisjoint(source_models):
+                result[chart.id] = chart.get_chart_data(
+                    chart.chart_type, chart.name, query_cache=query_cache
+                )
+                continue
+            generations = tuple(all_generations[model] for model in source_models)
+            payload = None
+            if not refresh:
+                payload = chart_data_cache.get(cache_key, generations)
+            if payload is None:
+                payload = chart.get_chart_data(
+                    chart.chart_type, chart.name, query_cache=query_cache
+                )
+                chart_data_cache.set(
+                    cache_key, generations, payload, cache_ttl, cache_size
+                )
+            result[chart.id] = payload
+        return result
+
+    def _get_chart_cache_key(self):
+        """
+        Return the result cache key of the chart and the models it reads.
+
+        The key covers the chart configuration, the access groups, companies
+        and record rules of the user and the current day, so users seeing the
+        same data share the same payloads.
+        """
+        self.ensure_one()
+        source_models = tuple(
+            sorted({self.model_id.model, self.kpi_model_id.model} - {False, None})
+        )
+        rule_domains = tuple(
+            repr(self.env["ir.rule"]._compute_domain(model_name, "read"))
+            for model_name in source_models
+        )
+        cache_key = (
+            self.env.cr.dbname,
+            self.id,
+            self.write_date,
+            tuple(sorted(self.env.user.all_group_ids.ids)),
+            tuple(self.env.companies.ids),
+            self.env.lang,
+            fields.Date.context_today(self),
+            rule_domains,
+        )
+        return cache_key, source_models
+
+    def _search_chart_records(self, conf_obj, record_obj, domain, **kwargs):
+        """
+        Search the chart records, reusing the result of an identical query
+        already run for another chart of the same batch
+        """
+        query_cache = getattr(conf_obj, "query_cache", None)
+        if query_cache is None:
+            return record_obj.search(domain, **kwargs)
+        key = ("search", record_obj._name, repr(domain), repr(sorted(kwargs.items())))
+        if key not in query_cache:
+            query_cache[key] = record_obj.search(domain, **kwargs)
+        return query_cache[key]
+
+    def _read_group_chart_records(
+        self, conf_obj, record_obj, domain, groupby, aggregates, order=None
+    ):
+        """
+        ``_read_group`` counterpart of :meth:`_search_chart_records`
+        """
+        query_cache = getattr(conf_obj, "query_cache", None)
+        if query_cache is None:
+            return record_obj._read_group(domain, groupby, aggregates, order=order)
+        key = (
+            "read_group",
+            record_obj._name,
+            repr(domain),
+            tuple(groupby),
+            tuple(aggregates),
+            order,
+        )
+        if key not in query_cache:
+            query_cache[key] = record_obj._read_group(
+                domain, groupby, aggregates, order=order
+            )
+        return query_cache[key]
+
     def _init_configuration(self):
         """
         Configure global cong variable
@@ -1434,6 +1956,9 @@ class DashboardChart(models.Model):
             previous_period_duration=self.previous_period_duration,
             previous_period_type=self.previous_period_type,
             is_apply_multiplier=self.is_apply_multiplier,
+            rollup_measures=[
+                source["measure"] for source in self._get_rollup_sources()
+            ],
             todo_layout=self.todo_layout,
             todo_action_ids=[
                 {
@@ -1464,12 +1989,57 @@ class DashboardChart(models.Model):
         return conf, conf.domain.copy()
 
     def html_to_image(self):
+        return self.get_chart_snapshots()[self.id]
+
+    def get_chart_snapshots(self):
+        """
+        Return the snapshot image of each chart by chart id. The pages are
+        rendered by a bounded pool of wkhtmltoimage processes, identical
+        pages (e.g. the same chart mailed to several recipients) only once.
+        """
+        if not self:
+            return {}
         if not IMGKIT_AVAILABLE:
             raise ValidationError(_(
                 "PDF/Image export requires the 'imgkit' Python library. "
                 "Please install it with: pip install imgkit\n"
                 "Also requires wkhtmltopdf to be installed on the server."
             ))
+        # the pages are built here, the worker threads do not use the cursor
+        page_keys = {}
+        pages = {}
+        for chart in self:
+            html = chart._get_snapshot_html()
+            page_key = hashlib.sha256(html.encode()).hexdigest()
+            page_keys[chart.id] = page_key
+            pages[page_key] = html
+        images = {}
+        for page_key in pages:
+            image = snapshot_cache.get(page_key, ())
+            if image is not None:
+                images[page_key] = image
+        to_render = [page_key for page_key in pages if page_key not in images]
+        if to_render:
+            ICP = self.env["ir.config_parameter"].sudo()
+            max_workers = int(ICP.get_param("ptt_dashboard.snapshot_workers", 4))
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(max_workers, len(to_render)))
+            ) as executor:
+                rendered = executor.map(
+                    render_snapshot, [pages[page_key] for page_key in to_render]
+                )
+                for page_key, image in zip(to_render, rendered):
+                    images[page_key] = image
+                    snapshot_cache.set(
+                        page_key, (), image, SNAPSHOT_CACHE_TTL, SNAPSHOT_CACHE_SIZE
+                    )
+        return {chart_id: images[page_key] for chart_id, page_key in page_keys.items()}
+
+    def _get_snapshot_html(self):
+        """
+        Build the HTML page the snapshot image of the chart is rendered from
+        """
+        self.ensure_one()
         chart_data = self.get_chart_data(self.chart_type, self.name)
         recordsets = {
             "chart_id": self.id,
@@ -1646,15 +2216,7 @@ class DashboardChart(models.Model):
             </body>
         </html>
         """
-
-        options = {
-            "encoding": "UTF-8",
-            "zoom": "1",
-        }
-        img_binary = imgkit.from_string(full_html, False, options=options)
-        img_base64 = base64.b64encode(img_binary).decode("UTF-8")
-        img_data_url = f"data:image/jpeg;base64,{img_base64}"
-        return img_data_url
+        return full_html
 
     def _handle_dirty_data(self, conf, data):
         """
@@ -1712,6 +2274,8 @@ class DashboardChart(models.Model):
             if isinstance(data.get("measurement_field_id"), int)
             else data.get("measurement_field_id"),
             "is_apply_multiplier": data.get("is_apply_multiplier", False),
+            # the rollups only reflect the saved configuration
+            "rollup_measures": [],
             "chart_multiplier_ids": data.get("chart_multiplier_ids", []),
             "company": data.get("company_id"),
             "data_type": data.get("data_type", "sum"),
@@ -1792,6 +2356,7 @@ class DashboardChart(models.Model):
         record_obj = self.env[conf_obj.model]
         message = ""
         today_date = False
+        rollup_period = False
         domain = conf_obj.domain.copy()
         if conf_obj.company and "company_id" in record_obj._fields:
             domain.append(("company_id", "in", [conf_obj.company, False]))
@@ -1816,6 +2381,7 @@ class DashboardChart(models.Model):
                     start_date.strftime("%d %b, %y"),
                     end_date.strftime("%d %b, %y"),
                 )
+                rollup_period = (start_date.date(), end_date.date())
                 if (
                     start_date
                     and end_date
@@ -1827,45 +2393,45 @@ class DashboardChart(models.Model):
                 else:
                     today_date = start_date.date()
 
-        all_records = record_obj.search(domain)
-        if today_date:
-            all_records = all_records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+        if rollup_period and "main" in getattr(conf_obj, "rollup_measures", []):
+            count = self.env["dashboard.chart.rollup"]._get_period_value(
+                self, "main", conf_obj.data_type, *rollup_period
             )
+        else:
+            if today_date:
+                domain = domain + self._get_day_domain(
+                    record_obj, conf_obj.date_filter_field, today_date
+                )
+            all_records = self._search_chart_records(conf_obj, record_obj, domain)
 
-        if conf_obj.sort_order and conf_obj.sort_field:
-            sorted_record = all_records.filtered(
-                lambda arft: getattr(arft, conf_obj.sort_field)
-            ).sorted(
-                key=lambda sr: getattr(sr, conf_obj.sort_field).name
-                if isinstance(getattr(sr, conf_obj.sort_field), models.Model)
-                else getattr(sr, conf_obj.sort_field),
-                reverse=True if conf_obj.sort_order == "desc" else False,
-            )
-            sorted_record |= all_records.filtered(
-                lambda arft: not getattr(arft, conf_obj.sort_field)
-            )
-            all_records = sorted_record
-        if conf_obj.limit_record > 0:
-            all_records = all_records[: conf_obj.limit_record]
+            if conf_obj.sort_order and conf_obj.sort_field:
+                sorted_record = all_records.filtered(
+                    lambda arft: getattr(arft, conf_obj.sort_field)
+                ).sorted(
+                    key=lambda sr: getattr(sr, conf_obj.sort_field).name
+                    if isinstance(getattr(sr, conf_obj.sort_field), models.Model)
+                    else getattr(sr, conf_obj.sort_field),
+                    reverse=True if conf_obj.sort_order == "desc" else False,
+                )
+                sorted_record |= all_records.filtered(
+                    lambda arft: not getattr(arft, conf_obj.sort_field)
+                )
+                all_records = sorted_record
+            if conf_obj.limit_record > 0:
+                all_records = all_records[: conf_obj.limit_record]
+
+            count = 0
+            if conf_obj.data_type == "count":
+                count = len(all_records)
+            elif conf_obj.data_type in ["sum", "average"]:
+                count_list = [
+                    getattr(record, conf_obj.measurement_field_id.name)
+                    for record in all_records
+                ]
+                count = sum(count_list)
+                if conf_obj.data_type == "average" and count != 0:
+                    count /= len(count_list)
 
-        count = 0
-        if conf_obj.data_type == "count":
-            count = len(all_records)
-        elif conf_obj.data_type in ["sum", "average"]:
-            count_list = [
-                getattr(record, conf_obj.measurement_field_id.name)
-                for record in all_records
-            ]
-            count = sum(count_list)
-            if conf_obj.data_type == "average" and count != 0:
-                count /= len(count_list)
         if conf_obj.is_apply_multiplier and conf_obj.chart_multiplier_ids:
             if conf_obj.data_type in ["count", "sum", "average"]:
                 count *= conf_obj.chart_multiplier_ids[0].get("multiplier")
@@ -2044,6 +2610,7 @@ class DashboardChart(models.Model):
         record_obj = self.env[conf_obj.kpi_model]
         domain = conf_obj.kpi_domain[:]
         kpi_today_date = False
+        kpi_rollup_period = False
         if conf_obj.company and "company_id" in record_obj._fields:
             domain.append(("company_id", "in", [conf_obj.company, False]))
         if (
@@ -2061,7 +2628,7 @@ class DashboardChart(models.Model):
             if date_domain.get("domain"):
                 start_date = date_domain.get("start_date")
                 end_date = date_domain.get("end_date")
-
+                kpi_rollup_period = (start_date.date(), end_date.date())
                 if (
                     start_date
                     and end_date
@@ -2073,38 +2640,35 @@ class DashboardChart(models.Model):
                 else:
                     kpi_today_date = start_date.date()
 
-        all_records = record_obj.search(domain)
-        if kpi_today_date:
-            all_records = all_records.filtered(
-                lambda record: getattr(record, conf_obj.kpi_date_filter_field_id)
-                and (
-                    getattr(record, conf_obj.kpi_date_filter_field_id).date()
-                    if isinstance(
-                        getattr(record, conf_obj.kpi_date_filter_field_id), datetime
-                    )
-                    else getattr(record, conf_obj.kpi_date_filter_field_id)
-                )
-                == kpi_today_date
+        if kpi_rollup_period and "kpi" in getattr(conf_obj, "rollup_measures", []):
+            count2 = self.env["dashboard.chart.rollup"]._get_period_value(
+                self, "kpi", conf_obj.kpi_data_type, *kpi_rollup_period
             )
+        else:
+            if kpi_today_date:
+                domain = domain + self._get_day_domain(
+                    record_obj, conf_obj.kpi_date_filter_field_id, kpi_today_date
+                )
+            all_records = self._search_chart_records(conf_obj, record_obj, domain)
 
-        if conf_obj.sort_order and conf_obj.sort_field:
-            sorted_record = all_records.filtered(
-                lambda arft: getattr(arft, conf_obj.sort_field)
-            ).sorted(
-                key=lambda sr: getattr(sr, conf_obj.sort_field).name
-                if isinstance(getattr(sr, conf_obj.sort_field), models.Model)
-                else getattr(sr, conf_obj.sort_field),
-                reverse=conf_obj.sort_order == "desc",
-            )
-            sorted_record |= all_records.filtered(
-                lambda arft: not getattr(arft, conf_obj.sort_field)
-            )
-            all_records = sorted_record
-        if conf_obj.kpi_limit_record > 0:
-            all_records = all_records[: conf_obj.kpi_limit_record]
+            if conf_obj.sort_order and conf_obj.sort_field:
+                sorted_record = all_records.filtered(
+                    lambda arft: getattr(arft, conf_obj.sort_field)
+                ).sorted(
+                    key=lambda sr: getattr(sr, conf_obj.sort_field).name
+                    if isinstance(getattr(sr, conf_obj.sort_field), models.Model)
+                    else getattr(sr, conf_obj.sort_field),
+                    reverse=conf_obj.sort_order == "desc",
+                )
+                sorted_record |= all_records.filtered(
+                    lambda arft: not getattr(arft, conf_obj.sort_field)
+                )
+                all_records = sorted_record
+            if conf_obj.kpi_limit_record > 0:
+                all_records = all_records[: conf_obj.kpi_limit_record]
+            count2 = get_count2(all_records, conf_obj)
 
         count = prepared_data.get("calculated_count", 0)
-        count2 = get_count2(all_records, conf_obj)
         compute_count = 0
         symbol = ""
         if conf_obj.show_unit:
@@ -2232,19 +2796,11 @@ class DashboardChart(models.Model):
                 else:
                     today_date = start_date.date()
 
-        records = record_obj.search(
-            domain,
-        )
         if today_date:
-            records = records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
             )
+        records = self._search_chart_records(conf_obj, record_obj, domain)
 
         activities_domain.extend([("res_id", "in", records.ids)])
         if conf_obj.limit_record == 0:
@@ -2377,19 +2933,11 @@ class DashboardChart(models.Model):
             check_constraint = {"type": "error", "message": "Please Select Group by!"}
         return check_constraint
 
-    def get_list_view_data(self, conf_obj):
+    def _get_list_domain(self, conf_obj, record_obj):
         """
-        This function is used in preparing data for List view
+        Return the domain of the List view records and the day they are
+        restricted to, when the date filter covers a single day
         """
-        if not conf_obj.model:
-            return {"type": "error", "message": "Please Select Model!"}
-        if (conf_obj.list_type == "standard" and not conf_obj.list_field_ids) or (
-            conf_obj.list_type == "grouped" and not conf_obj.list_measure_ids
-        ):
-            return {"type": "error", "message": "Please configure fields to display!"}
-        if conf_obj.list_type == "grouped" and not conf_obj.group_by:
-            return {"type": "error", "message": "Please Select Group by!"}
-        record_obj = self.env[conf_obj.model]
         today_date = False
         domain = conf_obj.domain
         if conf_obj.company and "company_id" in record_obj._fields:
@@ -2419,18 +2967,68 @@ class DashboardChart(models.Model):
                     domain.extend(date_domain["domain"])
                 else:
                     today_date = start_date.date()
+        return domain, today_date
 
-        records = record_obj.search(domain)
+    def get_list_view_data(self, conf_obj):
+        """
+        This function is used in preparing data for List view
+        """
+        if not conf_obj.model:
+            return {"type": "error", "message": "Please Select Model!"}
+        if (conf_obj.list_type == "standard" and not conf_obj.list_field_ids) or (
+            conf_obj.list_type == "grouped" and not conf_obj.list_measure_ids
+        ):
+            return {"type": "error", "message": "Please configure fields to display!"}
+        if conf_obj.list_type == "grouped" and not conf_obj.group_by:
+            return {"type": "error", "message": "Please Select Group by!"}
+        record_obj = self.env[conf_obj.model]
+        domain, today_date = self._get_list_domain(conf_obj, record_obj)
+        if conf_obj.list_type == "standard":
+            return self._get_standard_list_view_data(
+                conf_obj, record_obj, domain, today_date
+            )
         if today_date:
-            records = records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
+            )
+        columns = []
+        ir_model_fields_obj = self.env["ir.model.fields"].sudo()
+        group_by_field = ir_model_fields_obj.search(
+            [("name", "=", conf_obj.group_by), ("model", "=", conf_obj.model)],
+            limit=1,
+        )
+        if group_by_field:
+            columns.append(
+                {
+                    "id": group_by_field.id,
+                    "column_name": group_by_field.name,
+                    "name": group_by_field.field_description,
+                }
+            )
+        for column in conf_obj.list_measure_ids:
+            column_rec = ir_model_fields_obj.browse(column.get("list_measure_id"))
+            columns.append(
+                {
+                    "id": column_rec.id,
+                    "column_name": column_rec.name,
+                    "name": column_rec.field_description,
+                    "value_type": column.get("value_type"),
+                }
+            )
+        if self._can_aggregate_grouped_list_data(conf_obj, record_obj, columns):
+            record_list = self._aggregate_grouped_list_data(
+                conf_obj, record_obj, domain, columns
             )
+            if not record_list:
+                return {"type": "error", "message": "No Data to display!"}
+            return {
+                "columns": columns,
+                "records": record_list,
+                "name": conf_obj.name,
+                "model": conf_obj.model,
+            }
+
+        records = self._search_chart_records(conf_obj, record_obj, domain)
 
         if not records:
             return {"type": "error", "message": "No Data to display!"}
@@ -2450,93 +3048,37 @@ class DashboardChart(models.Model):
             records = sorted_record
         if conf_obj.limit_record > 0:
             records = records[: conf_obj.limit_record]
-        columns = []
-        # column_names = []
         record_list = []
-        ir_model_fields_obj = self.env["ir.model.fields"].sudo()
-        if conf_obj.list_type == "standard":
-            list_field_ids = sorted(
-                conf_obj.list_field_ids, key=lambda x: x.get("sequence")
-            )
-            column_ids = [column.get("list_field_id") for column in list_field_ids]
-            for column in column_ids:
-                column_rec = ir_model_fields_obj.browse(column)
-                columns.append(
-                    {
-                        "id": column_rec.id,
-                        "column_name": column_rec.name,
-                        "name": column_rec.field_description,
-                    }
-                )
-            for record in records:
-                record_set = {"id": record.id}
-                for column in columns:
-                    record_column_value = getattr(record, column.get("column_name"))
-                    if isinstance(record_column_value, models.Model):
-                        record_column_value = record_column_value.display_name
-                    record_set.update(
-                        {column.get("column_name"): record_column_value or ""}
-                    )
-                record_set["currentIds"] = [record.id]
-                record_list.append(record_set)
-        else:
-            group_by_field = ir_model_fields_obj.search(
-                [("name", "=", conf_obj.group_by), ("model", "=", conf_obj.model)],
-                limit=1,
-            )
-            if group_by_field:
-                columns.append(
-                    {
-                        "id": group_by_field.id,
-                        "column_name": group_by_field.name,
-                        "name": group_by_field.field_description,
-                    }
-                )
-            for column in conf_obj.list_measure_ids:
-                column_rec = ir_model_fields_obj.browse(column.get("list_measure_id"))
-                columns.append(
-                    {
-                        "id": column_rec.id,
-                        "column_name": column_rec.name,
-                        "name": column_rec.field_description,
-                        "value_type": column.get("value_type"),
-                    }
-                )
-            grouped_by_records = groupby(
-                records,
-                key=lambda record: format_date_by_range(
-                    getattr(record, conf_obj.group_by), conf_obj.time_range
-                )
-                if (
-                    isinstance(getattr(record, conf_obj.group_by), (date, datetime))
-                    and conf_obj.time_range
+
+        def group_key(record):
+            value = getattr(record, conf_obj.group_by)
+            if isinstance(value, (date, datetime)) and conf_obj.time_range:
+                return self._get_date_bucket_label(
+                    record_obj, value, conf_obj.time_range
                 )
-                else getattr(record, conf_obj.group_by),
-            )
-            for group, grouped_records in grouped_by_records:
-                record_set = {"id": group}
-                for column in columns:
-                    if column.get("column_name") == conf_obj.group_by:
-                        record_value = group
-                        if isinstance(record_value, models.Model):
-                            record_value = group.display_name
-                        record_set.update({column.get("column_name"): record_value})
-                        continue
-                    final_value = 0
-                    for grouped_record in grouped_records:
-                        final_value += getattr(
-                            grouped_record, column.get("column_name")
-                        )
-                    if column.get("value_type") == "average" and final_value != 0:
-                        final_value = final_value / len(grouped_records)
-                    record_set.update(
-                        {column.get("column_name"): round(final_value, 2)}
-                    )
-                currentIds = []
-                for grouped_id in grouped_records:
-                    currentIds.append(grouped_id.id)
-                record_set["currentIds"] = currentIds
-                record_list.append(record_set)
+            return value
+
+        grouped_by_records = groupby(records, key=group_key)
+        for group, grouped_records in grouped_by_records:
+            record_set = {"id": group}
+            for column in columns:
+                if column.get("column_name") == conf_obj.group_by:
+                    record_value = group
+                    if isinstance(record_value, models.Model):
+                        record_value = group.display_name
+                    record_set.update({column.get("column_name"): record_value})
+                    continue
+                final_value = 0
+                for grouped_record in grouped_records:
+                    final_value += getattr(grouped_record, column.get("column_name"))
+                if column.get("value_type") == "average" and final_value != 0:
+                    final_value = final_value / len(grouped_records)
+                record_set.update({column.get("column_name"): round(final_value, 2)})
+            currentIds = []
+            for grouped_id in grouped_records:
+                currentIds.append(grouped_id.id)
+            record_set["currentIds"] = currentIds
+            record_list.append(record_set)
         return {
             "columns": columns,
             "records": record_list,
@@ -2544,6 +3086,131 @@ class DashboardChart(models.Model):
             "model": conf_obj.model,
         }
 
+    def _get_standard_list_view_data(self, conf_obj, record_obj, domain, today_date):
+        """
+        Prepare the first page of a standard List view, along with the pager
+        the view uses to load the next pages
+        """
+        columns, pager = self._get_list_view_pager(
+            conf_obj, record_obj, domain, today_date
+        )
+        if not pager["total"]:
+            return {"type": "error", "message": "No Data to display!"}
+        return {
+            "columns": columns,
+            "records": self._read_list_view_page(pager, 0),
+            "name": conf_obj.name,
+            "model": conf_obj.model,
+            "pager": pager,
+        }
+
+    def _get_list_view_pager(self, conf_obj, record_obj, domain, today_date):
+        """
+        Return the columns of a standard List view and the pager its pages
+        are read with
+        """
+        if today_date:
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
+            )
+        total = record_obj.search_count(domain, limit=conf_obj.limit_record or None)
+        ir_model_fields_obj = self.env["ir.model.fields"].sudo()
+        columns = []
+        for column in sorted(conf_obj.list_field_ids, key=lambda x: x.get("sequence")):
+            column_rec = ir_model_fields_obj.browse(column.get("list_field_id"))
+            field = record_obj._fields.get(column_rec.name)
+            columns.append(
+                {
+                    "id": column_rec.id,
+                    "column_name": column_rec.name,
+                    "name": column_rec.field_description,
+                    "sortable": bool(field and field.store),
+                }
+            )
+        order = None
+        if conf_obj.sort_order and conf_obj.sort_field:
+            order = f"{conf_obj.sort_field} {conf_obj.sort_order} NULLS LAST, id"
+        pager = {
+            "model": conf_obj.model,
+            "domain": domain,
+            "order": order,
+            "fields": [column["column_name"] for column in columns],
+            "total": total,
+            "page_size": LIST_PAGE_SIZE,
+        }
+        return columns, pager
+
+    def get_list_view_page(
+        self, offset, sort_column=False, sort_order="asc", domain=None
+    ):
+        """
+        Read the next page of the standard List view of the chart, as loaded
+        on scroll by the client. The pager is rebuilt from the configuration
+        of the chart, the client choosing the sorted column and sending the
+        domain of the first page, which includes its drill-downs and filters.
+        """
+        self.ensure_one()
+        self.check_access("read")
+        if self.dashboard_id and self not in self.dashboard_id._get_user_charts():
+            raise AccessError(_("You are not allowed to access this chart."))
+        conf, __ = self._init_configuration()
+        if (
+            self.chart_type != "list"
+            or conf.list_type != "standard"
+            or not conf.model
+            or not conf.list_field_ids
+        ):
+            return []
+        record_obj = self.env[conf.model]
+        if domain is None:
+            domain, today_date = self._get_list_domain(conf, record_obj)
+        else:
+            # the domain of the first page is already restricted to its day
+            domain, today_date = fields.Domain(domain), False
+        __, pager = self._get_list_view_pager(conf, record_obj, domain, today_date)
+        if sort_column:
+            field = self.env[pager["model"]]._fields.get(sort_column)
+            if (
+                sort_column not in pager["fields"]
+                or not field
+                or not field.store
+                or sort_order not in ("asc", "desc")
+            ):
+                raise ValidationError(_("The list cannot be sorted on this column."))
+            pager["order"] = f"{sort_column} {sort_order}, id"
+        return self._read_list_view_page(pager, offset)
+
+    def _read_list_view_page(self, pager, offset):
+        """
+        Read one page of a standard List view, only the displayed columns
+        being fetched
+        """
+        limit = min(pager["page_size"], pager["total"] - offset)
+        if limit <= 0:
+            return []
+        records = self.env[pager["model"]].search_fetch(
+            pager["domain"],
+            pager["fields"],
+            offset=offset,
+            limit=limit,
+            order=pager["order"],
+        )
+        for field_name in pager["fields"]:
+            if records._fields[field_name].relational:
+                # compute the display names of the page in one go
+                records.mapped(field_name).mapped("display_name")
+        record_list = []
+        for record in records:
+            record_set = {"id": record.id}
+            for field_name in pager["fields"]:
+                value = record[field_name]
+                if isinstance(value, models.Model):
+                    value = ", ".join(value.mapped("display_name"))
+                record_set[field_name] = value or ""
+            record_set["currentIds"] = [record.id]
+            record_list.append(record_set)
+        return record_list
+
     def get_measurement_group_data(self, conf_obj):
         """
         This function is used in preparing data for following charts
@@ -2592,17 +3259,19 @@ class DashboardChart(models.Model):
                 else:
                     today_date = start_date.date()
 
-        records = record_obj.search(domain)
+        if self._can_aggregate_measurement_data(conf_obj, record_obj):
+            result = self._aggregate_measurement_group_data(
+                conf_obj, record_obj, domain, today_date
+            )
+            if not result:
+                return {"type": "error", "message": "No Data to display!"}
+            return self._fill_measurement_rows(conf_obj, result)
+
         if today_date:
-            records = records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
             )
+        records = self._search_chart_records(conf_obj, record_obj, domain)
 
         if not records:
             return {"type": "error", "message": "No Data to display!"}
@@ -2637,11 +3306,9 @@ class DashboardChart(models.Model):
             record_group_by = getattr(record, conf_obj.group_by)
             record_group_id = getattr(record, conf_obj.group_by)
             if hasattr(record._fields[conf_obj.group_by], "selection"):
-                record_selections = record._fields[conf_obj.group_by].selection
-                if isinstance(record_selections, str):
-                    record_selections = dict(getattr(record, record_selections)())
-                else:
-                    record_selections = dict(record_selections)
+                record_selections = self._get_selection_labels(
+                    record, conf_obj.group_by
+                )
                 record_group_by = record_selections.get(
                     getattr(record, conf_obj.group_by)
                 )
@@ -2652,21 +3319,17 @@ class DashboardChart(models.Model):
                 record_group_by = record_group_by.display_name
                 record_group_id = record_group_id.id
             elif isinstance(record_group_by, (date, datetime)) and conf_obj.time_range:
-                record_group_by = format_date_by_range(
-                    record_group_by, conf_obj.time_range
-                )
-                record_group_id = format_date_by_range(
-                    record_group_by, conf_obj.time_range
+                record_group_by = self._get_date_bucket_label(
+                    record_obj, record_group_by, conf_obj.time_range
                 )
+                record_group_id = record_group_by
 
             if conf_obj.sub_group_by:
                 sub_groupby = getattr(record, conf_obj.sub_group_by)
                 if hasattr(record._fields[conf_obj.sub_group_by], "selection"):
-                    record_selections = record._fields[conf_obj.sub_group_by].selection
-                    if isinstance(record_selections, str):
-                        record_selections = dict(getattr(record, record_selections)())
-                    else:
-                        record_selections = dict(record_selections)
+                    record_selections = self._get_selection_labels(
+                        record, conf_obj.sub_group_by
+                    )
                     sub_groupby = record_selections.get(
                         getattr(record, conf_obj.sub_group_by)
                     )
@@ -2676,8 +3339,8 @@ class DashboardChart(models.Model):
                     isinstance(sub_groupby, (date, datetime))
                     and conf_obj.sub_time_range
                 ):
-                    sub_groupby = format_date_by_range(
-                        sub_groupby, conf_obj.sub_time_range
+                    sub_groupby = self._get_date_bucket_label(
+                        record_obj, sub_groupby, conf_obj.sub_time_range
                     )
 
                 if conf_obj.data_type == "count":
@@ -2735,7 +3398,12 @@ class DashboardChart(models.Model):
 
         if not result:
             return {"type": "error", "message": "No Data to display!"}
+        return self._fill_measurement_rows(conf_obj, result)
 
+    def _fill_measurement_rows(self, conf_obj, result):
+        """
+        Make sure every row carries every measure key, except for bar charts
+        """
         value_keys = set()
         for row in result:
             value_keys.update(k for k in row if k not in ("category", "record_id"))
@@ -2746,6 +3414,327 @@ class DashboardChart(models.Model):
                         row[key] = 0.0
         return result
 
+    def _get_aggregate_groupby_spec(self, record_obj, field_name, time_range):
+        """
+        Return the ``_read_group`` groupby spec of a chart group by field, or
+        False when the grouping can only be computed on the records
+        """
+        field = record_obj._fields.get(field_name)
+        if not field or not field.store or field.type not in AGGREGATE_GROUPBY_TYPES:
+            return False
+        if field.type in ("date", "datetime"):
+            return "%s:%s" % (field_name, time_range) if time_range else False
+        return field_name
+
+    def _can_aggregate_measurement_data(self, conf_obj, record_obj):
+        """
+        Check whether the chart configuration can be computed with a single
+        grouped SQL query instead of browsing every record
+        """
+        if not self._get_aggregate_groupby_spec(
+            record_obj, conf_obj.group_by, conf_obj.time_range
+        ):
+            return False
+        if conf_obj.sub_group_by and not self._get_aggregate_groupby_spec(
+            record_obj, conf_obj.sub_group_by, conf_obj.sub_time_range
+        ):
+            return False
+        if conf_obj.data_type in ("sum", "average"):
+            for measurement in conf_obj.measurement_field_ids:
+                field = record_obj._fields.get(measurement.name)
+                if not field or not field.store or field.type not in (
+                    "integer",
+                    "float",
+                    "monetary",
+                ):
+                    return False
+        if conf_obj.sort_order and conf_obj.sort_field:
+            sort_field = record_obj._fields.get(conf_obj.sort_field)
+            if not sort_field or not sort_field.store:
+                return False
+            # without a limit the groups are ordered on the min/max of the
+            # sort field, which only matches the record order for scalars
+            if conf_obj.limit_record <= 0 and sort_field.type not in (
+                "char",
+                "text",
+                "selection",
+                "integer",
+                "float",
+                "monetary",
+                "date",
+                "datetime",
+            ):
+                return False
+        if conf_obj.date_filter_field:
+            date_field = record_obj._fields.get(conf_obj.date_filter_field)
+            if not date_field or not date_field.store:
+                return False
+        return True
+
+    def _get_day_domain(self, record_obj, field_name, day):
+        """
+        Domain matching the records whose date field falls on the given day
+        """
+        if record_obj._fields[field_name].type == "datetime":
+            day_start = datetime.combine(day, time.min)
+            return [
+                (field_name, ">=", day_start),
+                (field_name, "<", day_start + timedelta(days=1)),
+            ]
+        return [(field_name, "=", day)]
+
+    def _get_bucket_model(self, record_obj):
+        """
+        Model used to truncate dates in SQL, with the timezone of the user
+        when the context does not carry one (e.g. scheduled emails)
+        """
+        tz = record_obj.env.context.get("tz") or self.env.user.tz
+        return record_obj.with_context(tz=tz) if tz else record_obj
+
+    def _get_date_bucket_label(self, record_obj, value, time_range):
+        """
+        Return the label of the ``time_range`` bucket of a date read on a
+        record, truncated like the ``field:time_range`` groups of
+        ``_read_group``: in the timezone of :meth:`_get_bucket_model` and
+        from the first day of the week of the user language
+        """
+        if isinstance(value, datetime):
+            tz = self._get_bucket_model(record_obj).env.context.get("tz")
+            if tz in pytz.all_timezones_set:
+                value = pytz.utc.localize(value).astimezone(pytz.timezone(tz))
+            value = value.date()
+        if time_range == "week":
+            first_week_day = int(get_lang(record_obj.env).week_start) - 1
+            value -= timedelta(days=(value.weekday() - first_week_day) % 7)
+        else:
+            value = date_utils.start_of(value, time_range)
+        return format_date_by_range(value, time_range)
+
+    def _can_aggregate_grouped_list_data(self, conf_obj, record_obj, columns):
+        """
+        Check whether a grouped List view on a date time range can be read
+        with a single ``_read_group``: its groups do not depend on the order
+        or the number of the records
+        """
+        field = record_obj._fields.get(conf_obj.group_by)
+        if not field or field.type not in ("date", "datetime"):
+            return False
+        if not self._get_aggregate_groupby_spec(
+            record_obj, conf_obj.group_by, conf_obj.time_range
+        ):
+            return False
+        if conf_obj.limit_record > 0 or (conf_obj.sort_order and conf_obj.sort_field):
+            return False
+        for column in columns:
+            if column["column_name"] == conf_obj.group_by:
+                continue
+            field = record_obj._fields.get(column["column_name"])
+            if not field or not field.store or field.type not in (
+                "integer",
+                "float",
+                "monetary",
+            ):
+                return False
+        return True
+
+    def _aggregate_grouped_list_data(self, conf_obj, record_obj, domain, columns):
+        """
+        Compute the rows of a grouped List view on a date time range with one
+        ``_read_group`` on the chart domain, the buckets being truncated by
+        ``date_trunc`` in SQL
+        """
+        measures = [
+            column["column_name"]
+            for column in columns
+            if column["column_name"] != conf_obj.group_by
+        ]
+        groupby_spec = self._get_aggregate_groupby_spec(
+            record_obj, conf_obj.group_by, conf_obj.time_range
+        )
+        groups = self._read_group_chart_records(
+            conf_obj,
+            self._get_bucket_model(record_obj),
+            domain,
+            [groupby_spec],
+            ["__count", "id:array_agg"] + ["%s:sum" % name for name in measures],
+        )
+        record_list = []
+        for bucket, count, record_ids, *sums in groups:
+            group = bucket and format_date_by_range(bucket, conf_obj.time_range)
+            totals = dict(zip(measures, sums))
+            record_set = {"id": group}
+            for column in columns:
+                if column["column_name"] == conf_obj.group_by:
+                    record_set[column["column_name"]] = group
+                    continue
+                final_value = totals[column["column_name"]] or 0
+                if column.get("value_type") == "average" and final_value != 0:
+                    final_value = final_value / count
+                record_set[column["column_name"]] = round(final_value, 2)
+            record_set["currentIds"] = record_ids
+            record_list.append(record_set)
+        return record_list
+
+    def _get_selection_labels(self, record_obj, field_name):
+        """
+        Return the labels of the values of a selection field, as the charts
+        display them
+        """
+        selection = record_obj._fields[field_name].selection
+        if isinstance(selection, str):
+            selection = getattr(record_obj, selection)()
+        elif callable(selection):
+            selection = selection(record_obj)
+        return dict(selection)
+
+    def _get_record_group_id(self, record_obj, record, field_name, time_range):
+        """
+        Return the record id :meth:`_get_aggregate_group_label` gives to the
+        group of a record
+        """
+        field = record_obj._fields[field_name]
+        value = record[field_name]
+        if field.type == "selection":
+            return self._get_selection_labels(record_obj, field_name).get(value)
+        if field.type == "many2one":
+            return value.id
+        if isinstance(value, (date, datetime)) and time_range:
+            return self._get_date_bucket_label(record_obj, value, time_range)
+        return value
+
+    def _get_aggregate_group_label(self, record_obj, field_name, value, time_range):
+        """
+        Return the (label, record id) pair the charts expect for a group value
+        """
+        field = record_obj._fields[field_name]
+        if field.type == "selection":
+            label = self._get_selection_labels(record_obj, field_name).get(value)
+            return label, label
+        if field.type == "many2one":
+            return value.display_name, value.id
+        if isinstance(value, (date, datetime)) and time_range:
+            label = format_date_by_range(value, time_range)
+            return label, label
+        return value, value
+
+    def _aggregate_measurement_group_data(
+        self, conf_obj, record_obj, domain, today_date=False
+    ):
+        """
+        Compute the measurement charts rows with one ``_read_group`` call.
+
+        Group by, sub group by, time range and the count/sum/average measures
+        are pushed into SQL so the cost depends on the number of groups rather
+        than the number of records.
+        """
+        domain = list(domain)
+        if today_date:
+            domain += self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
+            )
+        record_obj = self._get_bucket_model(record_obj)
+        if conf_obj.hide_false_value:
+            domain.append((conf_obj.group_by, "!=", False))
+            if conf_obj.sub_group_by:
+                domain.append((conf_obj.sub_group_by, "!=", False))
+        # The categories are listed in the order of the first record of each
+        # group, like the charts computed on the records do
+        group_order = None
+        group_rank = {}
+        if conf_obj.limit_record > 0:
+            order = None
+            if conf_obj.sort_order and conf_obj.sort_field:
+                order = "%s %s NULLS LAST" % (conf_obj.sort_field, conf_obj.sort_order)
+            records = self._search_chart_records(
+                conf_obj, record_obj, domain, order=order, limit=conf_obj.limit_record
+            )
+            domain = [("id", "in", records.ids)]
+            if order:
+                for record in records:
+                    group_rank.setdefault(
+                        self._get_record_group_id(
+                            record_obj, record, conf_obj.group_by, conf_obj.time_range
+                        ),
+                        len(group_rank),
+                    )
+        elif conf_obj.sort_order and conf_obj.sort_field:
+            group_order = "%s:%s %s NULLS LAST" % (
+                conf_obj.sort_field,
+                "max" if conf_obj.sort_order == "desc" else "min",
+                conf_obj.sort_order,
+            )
+
+        groupby = [
+            self._get_aggregate_groupby_spec(
+                record_obj, conf_obj.group_by, conf_obj.time_range
+            )
+        ]
+        if conf_obj.sub_group_by:
+            groupby.append(
+                self._get_aggregate_groupby_spec(
+                    record_obj, conf_obj.sub_group_by, conf_obj.sub_time_range
+                )
+            )
+        measurements = (
+            conf_obj.measurement_field_ids
+            if conf_obj.data_type in ("sum", "average")
+            else []
+        )
+        aggregates = ["__count"] + [
+            "%s:sum" % measurement.name for measurement in measurements
+        ]
+        multipliers = {}
+        if conf_obj.is_apply_multiplier:
+            multipliers = {
+                m.get("field_id"): m.get("multiplier", 1)
+                for m in conf_obj.chart_multiplier_ids
+            }
+
+        # Several SQL groups can share the same label (e.g. two partners with
+        # the same name in a sub group), so sums and counts are accumulated per
+        # label and averages are only computed once every group is merged.
+        grouped_data = defaultdict(lambda: defaultdict(float))
+        grouped_count = defaultdict(lambda: defaultdict(int))
+        for group in self._read_group_chart_records(
+            conf_obj, record_obj, domain, groupby, aggregates, order=group_order
+        ):
+            group_key = self._get_aggregate_group_label(
+                record_obj, conf_obj.group_by, group[0], conf_obj.time_range
+            )
+            prefix = ""
+            if conf_obj.sub_group_by:
+                prefix = self._get_aggregate_group_label(
+                    record_obj, conf_obj.sub_group_by, group[1], conf_obj.sub_time_range
+                )[0]
+            count, *sums = group[len(groupby) :]
+            if conf_obj.data_type == "count":
+                grouped_data[group_key][f"{prefix} - count"] += count
+                continue
+            for measurement, measure_sum in zip(measurements, sums):
+                key = f"{prefix} - {measurement.field_description}"
+                multiplier = multipliers.get(measurement.id, 1)
+                grouped_data[group_key][key] += (measure_sum or 0.0) * multiplier
+                grouped_count[group_key][key] += count
+
+        result = []
+        for group_key, metrics in grouped_data.items():
+            row = {
+                "category": group_key[0],
+                "isSubGroupBy": conf_obj.sub_group_by,
+                "record_id": group_key[1],
+            }
+            for key, value in metrics.items():
+                if conf_obj.data_type == "average":
+                    count = grouped_count[group_key][key]
+                    value = value / count if count else 0
+                row[key] = value
+            result.append(row)
+        if group_rank:
+            result.sort(
+                key=lambda row: group_rank.get(row["record_id"], len(group_rank))
+            )
+        return result
+
     def check_category_config_type(self, conf_obj, records):
         """
         Check datatype of the conf object
@@ -2809,18 +3798,11 @@ class DashboardChart(models.Model):
                 else:
                     today_date = start_date.date()
 
-        all_records = record_obj.search(domain)
-
         if today_date:
-            all_records = all_records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
             )
+        all_records = self._search_chart_records(conf_obj, record_obj, domain)
 
         if not all_records:
             return {"type": "error", "message": "No Data to display!"}
@@ -2936,17 +3918,11 @@ class DashboardChart(models.Model):
             else:
                 today_date = start_date.date()
 
-        all_records = record_obj.search(domain)
         if today_date:
-            all_records = all_records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
             )
+        all_records = self._search_chart_records(conf_obj, record_obj, domain)
 
         if not all_records:
             return {"type": "error", "message": "No Data to display!"}
@@ -3071,17 +4047,11 @@ class DashboardChart(models.Model):
             else:
                 today_date = start_date.date()
 
-        all_records = record_obj.search(domain)
         if today_date:
-            all_records = all_records.filtered(
-                lambda record: getattr(record, conf_obj.date_filter_field)
-                and (
-                    getattr(record, conf_obj.date_filter_field).date()
-                    if isinstance(getattr(record, conf_obj.date_filter_field), datetime)
-                    else getattr(record, conf_obj.date_filter_field)
-                )
-                == today_date
+            domain = domain + self._get_day_domain(
+                record_obj, conf_obj.date_filter_field, today_date
             )
+        all_records = self._search_chart_records(conf_obj, record_obj, domain)
 
         if not all_records:
             return {"type": "error", "message": "No Data to display!"}
@@ -3171,19 +4141,11 @@ class DashboardChart(models.Model):
                 else:
                     today_date = start_date.date()
 
-            all_records = record_obj.search(domain)
             if today_date:
-                all_records = all_records.filtered(
-                    lambda record: getattr(record, conf_obj.date_filter_field)
-                    and (
-                        getattr(record, conf_obj.date_filter_field).date()
-                        if isinstance(
-                            getattr(record, conf_obj.date_filter_field), datetime
-                        )
-                        else getattr(record, conf_obj.date_filter_field)
-                    )
-                    == today_date
+                domain = domain + self._get_day_domain(
+                    record_obj, conf_obj.date_filter_field, today_date
                 )
+            all_records = self._search_chart_records(conf_obj, record_obj, domain)
 
             if not all_records:
                 return {"type": "error", "message": "Target is not valid!"}
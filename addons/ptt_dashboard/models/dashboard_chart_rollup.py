@@ -0,0 +1,148 @@
+import logging
+from datetime import datetime
+
+from odoo import api, fields, models
+from odoo.fields import Domain
+from odoo.tools import SQL
+
+_logger = logging.getLogger(__name__)
+
+
+class DashboardChartRollup(models.Model):
+    _name = "dashboard.chart.rollup"
+    _description = "Dashboard Chart Daily Rollup"
+    _order = "chart_id, measure, day"
+
+    chart_id = fields.Many2one(
+        "dashboard.chart", required=True, ondelete="cascade", index=True
+    )
+    measure = fields.Selection(
+        [("main", "Data"), ("kpi", "Data2")], required=True, default="main"
+    )
+    day = fields.Date(required=True, index=True)
+    record_count = fields.Integer(string="Records")
+    value = fields.Float(string="Total")
+
+    _unique_chart_measure_day = models.Constraint(
+        "UNIQUE(chart_id, measure, day)",
+        "A chart can only have one rollup per measure and day.",
+    )
+
+    @api.model
+    def _refresh(self, chart, source, days=None):
+        """
+        Recompute the rollups of a chart source, for the given days or
+        for the whole history of the model when no days are given
+        """
+        rollup_domain = [
+            ("chart_id", "=", chart.id),
+            ("measure", "=", source["measure"]),
+        ]
+        domain = source["domain"]
+        # days are computed in UTC, like the date filters of the charts
+        record_obj = self.env[source["model"]].sudo().with_context(tz=False)
+        if days is not None:
+            if not days:
+                return
+            rollup_domain.append(("day", "in", list(days)))
+            domain = Domain.AND(
+                [
+                    domain,
+                    Domain.OR(
+                        chart._get_day_domain(record_obj, source["date_field"], day)
+                        for day in days
+                    ),
+                ]
+            )
+        aggregates = ["__count"]
+        if source["measure_field"]:
+            aggregates.append(f"{source['measure_field']}:sum")
+        groups = record_obj._read_group(
+            domain, [f"{source['date_field']}:day"], aggregates
+        )
+        rows = {}
+        for day, record_count, *value in groups:
+            if day:
+                day = day.date() if isinstance(day, datetime) else day
+                rows[day] = (record_count, value[0] if value else 0.0)
+        # the days without records anymore
+        self.sudo().search(rollup_domain + [("day", "not in", list(rows))]).unlink()
+        if not rows:
+            return
+        # upsert, the same days may be refreshed by concurrent transactions
+        self.flush_model()
+        self.env.cr.execute(
+            SQL(
+                """
+                INSERT INTO dashboard_chart_rollup (
+                    chart_id, measure, day, record_count, value,
+                    create_uid, write_uid, create_date, write_date
+                )
+                VALUES %s
+                ON CONFLICT (chart_id, measure, day) DO UPDATE
+                SET record_count = EXCLUDED.record_count,
+                    value = EXCLUDED.value,
+                    write_uid = EXCLUDED.write_uid,
+                    write_date = EXCLUDED.write_date
+                """,
+                SQL(", ").join(
+                    SQL(
+                        "(%s, %s, %s, %s, %s, %s, %s, NOW() AT TIME ZONE 'UTC', NOW() AT TIME ZONE 'UTC')",
+                        chart.id,
+                        source["measure"],
+                        day,
+                        record_count,
+                        value,
+                        self.env.uid,
+                        self.env.uid,
+                    )
+                    for day, (record_count, value) in rows.items()
+                ),
+            )
+        )
+        self.invalidate_model()
+
+    @api.model
+    def _refresh_marked_days(self):
+        """
+        Recompute the rollups of the days marked by the changes of the
+        current transaction
+        """
+        marked_days = self.env.cr.precommit.data.pop("ptt_dashboard.rollup_days", {})
+        if not marked_days:
+            return
+        charts = self.env["dashboard.chart"].sudo().search([("use_rollup", "=", True)])
+        for chart in charts:
+            # a broken chart must not prevent the changes from being committed,
+            # its rollups are caught up by the rebuild cron once fixed
+            try:
+                with self.env.cr.savepoint():
+                    for source in chart._get_rollup_sources():
+                        days = marked_days.get((source["model"], source["date_field"]))
+                        if days:
+                            self._refresh(chart, source, days)
+            except Exception:
+                _logger.exception(
+                    "Failed to refresh the rollups of dashboard chart %s", chart.id
+                )
+
+    @api.model
+    def _get_period_value(self, chart, measure, data_type, start_day, end_day):
+        """
+        Aggregate the rollups of a chart measure between two days, included
+        """
+        domain = [
+            ("chart_id", "=", chart.id),
+            ("measure", "=", measure),
+            ("day", ">=", start_day),
+            ("day", "<=", end_day),
+        ]
+        [(record_count, value)] = self.sudo()._read_group(
+            domain, [], ["record_count:sum", "value:sum"]
+        )
+        record_count, value = record_count or 0, value or 0.0
+        if data_type == "count":
+            return record_count
+        if data_type == "average":
+            return value / record_count if record_count else 0
+        return value
@@ -0,0 +1,86 @@
+from odoo import api, fields, models
+from odoo.tools import SQL
+
+
+class DashboardChartSignal(models.Model):
+    """
+    Insert only log of the changes of the models the dashboard charts are
+    computed from, shared by all the server processes.
+
+    The generation of a model is the id of its last row: the cached chart
+    payloads are stored with the generations of their source models and are
+    stale as soon as another transaction commits a change on one of them.
+    Rows are only ever inserted, so concurrent transactions changing the same
+    model never wait for each other.
+    """
+
+    _name = "dashboard.chart.signal"
+    _description = "Dashboard Chart Source Change"
+    _log_access = False
+
+    model = fields.Char(required=True)
+    date = fields.Datetime(required=True, default=fields.Datetime.now)
+
+    _model_id_idx = models.Index("(model, id)")
+
+    @api.model
+    def _signal_changes(self):
+        """
+        Record the changes of the source models marked by the current
+        transaction, visible to the other processes once it is committed
+        """
+        model_names = self.env.cr.precommit.data.pop(
+            "ptt_dashboard.changed_models", set()
+        )
+        if not model_names:
+            return
+        self.env.cr.execute(
+            SQL(
+                "INSERT INTO dashboard_chart_signal (model, date) VALUES %s",
+                SQL(", ").join(
+                    SQL("(%s, NOW() AT TIME ZONE 'UTC')", model_name)
+                    for model_name in sorted(model_names)
+                ),
+            )
+        )
+
+    @api.model
+    def _get_generations(self, model_names):
+        """
+        Return the generation of each of the given models, by model name
+        """
+        model_names = list(model_names)
+        if not model_names:
+            return {}
+        self.env.cr.execute(
+            SQL(
+                """
+                SELECT model, MAX(id)
+                FROM dashboard_chart_signal
+                WHERE model = ANY(%s)
+                GROUP BY model
+                """,
+                model_names,
+            )
+        )
+        generations = dict.fromkeys(model_names, 0)
+        generations.update(self.env.cr.fetchall())
+        return generations
+
+    @api.autovacuum
+    def _gc_signals(self):
+        """
+        Delete the rows older than a day, but the last one of each model
+        """
+        self.env.cr.execute(
+            SQL(
+                """
+                DELETE FROM dashboard_chart_signal s
+                WHERE date < NOW() AT TIME ZONE 'UTC' - INTERVAL '1 day'
+                  AND id < (
+                    SELECT MAX(id) FROM dashboard_chart_signal
+                    WHERE model = s.model
+                  )
+                """
+            )
+        )
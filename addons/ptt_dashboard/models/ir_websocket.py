@@ -0,0 +1,29 @@
+import re
+
+from odoo import models
+
+DASHBOARD_CHANNEL_REGEX = re.compile(r"ptt_dashboard_(\d+)$")
+
+
+class IrWebsocket(models.AbstractModel):
+    _inherit = "ir.websocket"
+
+    def _build_bus_channel_list(self, channels):
+        """
+        Subscribe the clients of live dashboards to the dashboard channel,
+        provided the user can read the dashboard
+        """
+        if self.env.uid:
+            channels = list(channels)
+            for channel in list(channels):
+                if not isinstance(channel, str):
+                    continue
+                match = DASHBOARD_CHANNEL_REGEX.match(channel)
+                if not match:
+                    continue
+                dashboard = (
+                    self.env["dashboard.dashboard"].browse(int(match[1])).exists()
+                )
+                if dashboard and dashboard.has_access("read"):
+                    channels.append(dashboard)
+        return super()._build_bus_channel_list(channels)
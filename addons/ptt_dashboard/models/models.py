@@ -0,0 +1,89 @@
+from collections import defaultdict
+from datetime import datetime
+from functools import partial
+
+from odoo import api, models
+
+
+class Base(models.AbstractModel):
+    _inherit = "base"
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._notify_dashboard_source_change()
+        records._mark_dashboard_rollup_days()
+        return records
+
+    def write(self, vals):
+        # the days the records leave and the days they move to
+        self._mark_dashboard_rollup_days()
+        res = super().write(vals)
+        self._mark_dashboard_rollup_days()
+        return res
+
+    def _write(self, vals):
+        # the stored computed fields are only written here, once recomputed
+        super()._write(vals)
+        self._notify_dashboard_source_change()
+
+    def unlink(self):
+        self._notify_dashboard_source_change()
+        self._mark_dashboard_rollup_days()
+        return super().unlink()
+
+    def _notify_dashboard_source_change(self):
+        """
+        Invalidate the cached dashboard payloads computed from this model, in
+        all the processes, once the transaction is committed.
+
+        Only the changes of the records of the source models themselves are
+        seen: a chart whose domain goes through another model, or through a
+        non-stored computed field, may show stale data until its cached
+        payload expires.
+        """
+        if not self or self._name not in self.env[
+            "dashboard.chart"
+        ]._get_dashboard_source_models():
+            return
+        precommit = self.env.cr.precommit
+        changed_models = precommit.data.setdefault(
+            "ptt_dashboard.changed_models", set()
+        )
+        if not changed_models:
+            precommit.add(self.env["dashboard.chart.signal"]._signal_changes)
+        changed_models.add(self._name)
+        # live dashboards are notified once per transaction for all the models
+        live_models = precommit.data.setdefault("ptt_dashboard.live_models", set())
+        if not live_models:
+            precommit.add(
+                partial(
+                    self.env["dashboard.dashboard"]._notify_live_dashboards,
+                    live_models,
+                )
+            )
+        live_models.add(self._name)
+
+    def _mark_dashboard_rollup_days(self):
+        """
+        Mark the days of the incremental chart rollups affected by a change
+        of the records, they are recomputed once before the commit
+        """
+        if not self:
+            return
+        date_fields = (
+            self.env["dashboard.chart"]._get_rollup_source_models().get(self._name)
+        )
+        if not date_fields:
+            return
+        precommit = self.env.cr.precommit
+        if "ptt_dashboard.rollup_days" not in precommit.data:
+            precommit.data["ptt_dashboard.rollup_days"] = defaultdict(set)
+            precommit.add(self.env["dashboard.chart.rollup"]._refresh_marked_days)
+        rollup_days = precommit.data["ptt_dashboard.rollup_days"]
+        for field_name in date_fields:
+            for value in self.sudo().mapped(field_name):
+                if value:
+                    rollup_days[self._name, field_name].add(
+                        value.date() if isinstance(value, datetime) else value
+                    )
@@ -17,6 +17,7 @@ export class ListView extends Component {
 
   setup() {
     this.action = useService("action");
+    this.orm = useService("orm");
     this.state = useState({
       columns: [],
       data: [],
@@ -24,13 +25,18 @@ export class ListView extends Component {
       errorMessage: false,
       chartName: "",
       columns_order: {},
-      currentRecords: [],
-      currentPage: 1,
       totalRecords: 0,
-      totalPages: 0,
       dataModel: "",
+      pager: false,
+      sort: false,
+      loading: false,
     });
-    this.sortTable = (ev, column) => {
+    this.sortTable = async (ev, column) => {
+      // Only part of the records are loaded, the server has to sort them
+      const serverSort = this.hasMore();
+      if (serverSort && !column.sortable) {
+        return;
+      }
       let current_order = this.state.columns_order[column["column_name"]];
       this.state.columns_order = this.state.columns.reduce((acc, item) => {
         acc[item.column_name] = undefined;
@@ -42,6 +48,21 @@ export class ListView extends Component {
           : current_order == "desc"
             ? "asc"
             : "asc";
+      if (serverSort) {
+        this.state.sort = {
+          column: column.column_name,
+          order: this.state.columns_order[column.column_name],
+        };
+        this.state.data = [];
+        await this.loadMore();
+      }
+    };
+
+    this.onScroll = (ev) => {
+      const el = ev.target;
+      if (el.scrollTop + el.clientHeight >= el.scrollHeight - 50) {
+        this.loadMore();
+      }
     };
 
     this.openRecords = async (ev, currentIds) => {
@@ -55,14 +76,6 @@ export class ListView extends Component {
       });
     };
 
-    this.goToPage = (ev) => {
-      this.state.currentPage = parseInt(ev.target.value);
-    };
-
-    this.changePage = (updateIndex) => {
-      this.state.currentPage = this.state.currentPage + updateIndex;
-    };
-
     useEffect(
       () => {
         this.render_list_view();
@@ -77,6 +90,9 @@ export class ListView extends Component {
 
     useEffect(
       () => {
+        if (this.hasMore()) {
+          return;
+        }
         const sortKeys = Object.entries(this.state.columns_order).filter(
           ([_, dir]) => dir === "asc" || dir === "desc",
         );
@@ -92,15 +108,6 @@ export class ListView extends Component {
       () => [...Object.values(this.state.columns_order)],
     );
 
-    useEffect(
-      () => {
-        const start = (this.state.currentPage - 1) * 10;
-        const end = start + 10;
-        this.state.currentRecords = this.state.data.slice(start, end);
-      },
-      () => [this.state.currentPage, ...this.state.data],
-    );
-
     onMounted(() => {
       this.render_list_view();
     });
@@ -129,8 +136,50 @@ export class ListView extends Component {
     }, {});
 
     this.state.data = data.records;
-    this.state.totalRecords = data.records.length;
-    this.state.totalPages = Math.ceil(data.records.length / 10);
+    this.state.sort = false;
+    // the next pages are read from the saved chart, not from the unsaved
+    // changes of a preview
+    this.state.pager = (!this.props.isDirty && data.pager) || false;
+    this.state.totalRecords = this.state.pager
+      ? this.state.pager.total
+      : data.records.length;
     this.state.dataModel = data.model;
   }
+
+  hasMore() {
+    return this.state.data.length < this.state.totalRecords;
+  }
+
+  get recordChartId() {
+    // the previews of the chart form use "edit_<id>"
+    return parseInt(String(this.props.chartId).replace("edit_", ""));
+  }
+
+  async loadMore() {
+    if (
+      !this.state.pager ||
+      this.state.loading ||
+      !this.hasMore() ||
+      !this.recordChartId
+    ) {
+      return;
+    }
+    this.state.loading = true;
+    try {
+      const records = await this.orm.call(
+        "dashboard.chart",
+        "get_list_view_page",
+        [[this.recordChartId], this.state.data.length],
+        {
+          sort_column: this.state.sort ? this.state.sort.column : false,
+          sort_order: this.state.sort ? this.state.sort.order : "asc",
+          // keep the drill-downs and filters the first page was read with
+          domain: this.state.pager.domain,
+        },
+      );
+      this.state.data = [...this.state.data, ...records];
+    } finally {
+      this.state.loading = false;
+    }
+  }
 }
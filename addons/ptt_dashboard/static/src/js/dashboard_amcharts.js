@@ -1,6 +1,13 @@
 /** @odoo-module **/
 
-import { Component, onWillStart, onMounted, useState, useRef } from "@odoo/owl";
+import {
+  Component,
+  onWillStart,
+  onMounted,
+  onWillUnmount,
+  useState,
+  useRef,
+} from "@odoo/owl";
 import { registry } from "@web/core/registry";
 import { _t } from "@web/core/l10n/translation";
 import { useService } from "@web/core/utils/hooks";
@@ -13,13 +20,17 @@ export class DashboardAmcharts extends Component {
   setup() {
     this.auto_reload_duration = 15000;
     this.dashboard_user = false;
+    this.live_refresh = false;
     this.timer = false;
+    this.liveTimer = false;
+    this.changedChartIds = new Set();
     this.ui = useService("ui");
     this.editLayout = false;
     this.fileInputRef = useRef("fileInput");
     this.orm = useService("orm");
     this.action = useService("action");
     this.dialog = useService("dialog");
+    this.busService = useService("bus_service");
     this.state = useState({
       editMode: false,
       charts: [],
@@ -50,9 +61,35 @@ export class DashboardAmcharts extends Component {
       if (isMobileOS()) {
         this.grid.column(1);
       }
-      this.update_timer();
+      if (this.live_refresh) {
+        this.start_live_refresh();
+      } else {
+        this.update_timer();
+      }
     });
 
+    onWillUnmount(() => {
+      clearTimeout(this.timer);
+      clearTimeout(this.liveTimer);
+      if (this.live_refresh) {
+        this.busService.unsubscribe(
+          "ptt_dashboard/charts_changed",
+          this.onChartsChanged,
+        );
+        this.busService.deleteChannel(this.liveChannel);
+      }
+    });
+
+    this.onChartsChanged = (payload) => {
+      // Changes usually come in bursts: wait a bit and reload every chart
+      // announced in the meantime with a single call.
+      for (const chartId of payload.chart_ids) {
+        this.changedChartIds.add(chartId);
+      }
+      clearTimeout(this.liveTimer);
+      this.liveTimer = setTimeout(() => this.reload_changed_charts(), 1000);
+    };
+
     this.onUpdateExport = (chartId, chartDetails) => {
       this.state.downloadDetails[chartId] = chartDetails;
     };
@@ -314,11 +351,39 @@ export class DashboardAmcharts extends Component {
       this.state.charts,
       this.state.name,
       this.dashboard_user,
+      this.live_refresh,
     ] = await this.orm.call("dashboard.dashboard", "get_charts_details", [
       this.props.action.params.record,
     ]);
   }
 
+  start_live_refresh() {
+    this.liveChannel = `ptt_dashboard_${this.props.action.params.record}`;
+    this.busService.subscribe(
+      "ptt_dashboard/charts_changed",
+      this.onChartsChanged,
+    );
+    this.busService.addChannel(this.liveChannel);
+  }
+
+  async reload_changed_charts() {
+    if (this.editLayout || !this.changedChartIds.size) {
+      return;
+    }
+    const chartIds = [...this.changedChartIds];
+    this.changedChartIds.clear();
+    const chartsData = await this.orm.call(
+      "dashboard.dashboard",
+      "get_live_charts_data",
+      [this.props.action.params.record, chartIds],
+    );
+    for (const chart of this.state.charts) {
+      if (chart.id in chartsData) {
+        chart.recordset = chartsData[chart.id];
+      }
+    }
+  }
+
   update_timer() {
     var self = this;
     self.timer = setTimeout(() => {
@@ -2,6 +2,7 @@
 
 import { Component, useState, onWillUpdateProps } from "@odoo/owl";
 import { useService } from "@web/core/utils/hooks";
+import { download } from "@web/core/network/download";
 import { AreaChart } from "../components/AreaChart/AreaChart";
 import { BarChart } from "../components/BarChart/BarChart";
 import { ColumnChart } from "../components/ColumnChart/ColumnChart";
@@ -67,6 +68,16 @@ export class DashboardChartWrapper extends Component {
     this.action = useService("action");
     this.dialog = useService("dialog");
     onWillUpdateProps((nextprops) => {
+      if (
+        nextprops.reloadKey === this.props.reloadKey &&
+        nextprops.recordSets !== this.props.recordSets
+      ) {
+        // Data pushed by a live dashboard, keep any drill down in place
+        if (!this.state.breadcrump_ids.length) {
+          this.set_record_sets(nextprops.chart_type, nextprops.recordSets);
+        }
+        return;
+      }
       this.update_record_sets(
         nextprops.chartId,
         nextprops.chart_type,
@@ -91,51 +102,29 @@ export class DashboardChartWrapper extends Component {
       }
     };
 
-    this.onDownloadCSV = (ev) => {
-      return this.orm
-        .call("dashboard.chart", "export_csv", [
-          parseInt(this.state.chartId),
-          this.state.name,
-          this.state.chart_type,
-          {
+    this.downloadExport = (fileType) => {
+      // Streamed by the server, whatever the number of rows
+      return download({
+        url: "/ptt_dashboard/export",
+        data: {
+          chart_id: parseInt(this.state.chartId),
+          file_type: fileType,
+          print_vals: JSON.stringify({
             breadcrump_ids: this.state.breadcrump_ids,
             prev_domains: this.state.prev_domains,
-          },
-        ])
-        .then((response) => {
-          if (response.error) {
-            return this.dialog.add(WarningDialog, {
-              title: _t("Warning"),
-              message:
-                _t(
-                  "No data is available for downloading the CSV file at this time!",
-                ) || "",
-            });
-          }
-          const base64Content = response.file_content;
-          const fileName = response.file_name || "download.csv";
-
-          const byteCharacters = atob(base64Content);
-          const byteArray = new Uint8Array(byteCharacters.length);
-          for (let i = 0; i < byteCharacters.length; i++) {
-            byteArray[i] = byteCharacters.charCodeAt(i);
-          }
-
-          const blob = new Blob([byteArray], {
-            type: "text/csv;charset=utf-8;",
-          });
+          }),
+        },
+      });
+    };
 
-          const link = document.createElement("a");
-          link.href = URL.createObjectURL(blob);
-          link.download = fileName;
-          link.click();
-        })
-        .catch((error) => {
-          console.error("Error downloading CSV:", error);
-        });
+    this.onDownloadCSV = (ev) => {
+      return this.downloadExport("csv");
     };
 
     this.onDownloadExcel = (ev) => {
+      if (this.state.chart_type === "list") {
+        return this.downloadExport("xlsx");
+      }
       return this.orm
         .call("dashboard.chart", "export_excel", [
           parseInt(this.state.chartId),
@@ -330,6 +319,21 @@ export class DashboardChartWrapper extends Component {
     };
   }
 
+  set_record_sets(chart_type, recordSets) {
+    if (
+      ["kpi", "tile"].includes(chart_type) &&
+      typeof recordSets === "object" &&
+      recordSets !== null &&
+      !Array.isArray(recordSets) &&
+      "type" in recordSets
+    ) {
+      this.state.isKpiError = true;
+    } else {
+      this.state.isKpiError = false;
+    }
+    this.state.recordSets = recordSets;
+  }
+
   dataUrlToBlob(dataUrl) {
     const parts = dataUrl.split(",");
     const mimeMatch = parts[0].match(/:(.*?);/);
@@ -349,18 +353,7 @@ export class DashboardChartWrapper extends Component {
       [parseInt(recordId)],
       { chart_type, name, isDirty, data },
     );
-    if (
-      ["kpi", "tile"].includes(chart_type) &&
-      typeof recordSets === "object" &&
-      recordSets !== null &&
-      !Array.isArray(recordSets) &&
-      "type" in recordSets
-    ) {
-      this.state.isKpiError = true;
-    } else {
-      this.state.isKpiError = false;
-    }
-    this.state.recordSets = recordSets;
+    this.set_record_sets(chart_type, recordSets);
     let chart_color_id = await this.orm.searchRead(
       "dashboard.chart",
       [["id", "=", parseInt(recordId)]],
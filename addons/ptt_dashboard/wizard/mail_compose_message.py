@@ -69,12 +69,17 @@ class MailComposeMessage(models.TransientModel):
         charts = charts._origin.filtered(
             lambda cid: cid._origin.id not in chart_id_list
         )
+        charts = charts.filtered(
+            lambda cid: cid.chart_type != "to_do" or cid.todo_layout == "activity"
+        )
+        # rendered together, in parallel
+        images = charts.filtered(
+            lambda cid: cid.chart_type in ["kpi", "tile", "to_do", "list"]
+        ).get_chart_snapshots()
         for chart in charts:
             chart_dict = {}
-            if chart.chart_type == "to_do" and chart.todo_layout != "activity":
-                continue
             if chart.chart_type in ["kpi", "tile", "to_do", "list"]:
-                image = chart.html_to_image()
+                image = images[chart.id]
                 chart_dict = {"chart_id": chart.id, "name": chart.name, "image": image}
             else:
                 chart_data = chart.get_chart_data(chart.chart_type, chart.name)
@@ -108,12 +113,17 @@ class MailComposeMessage(models.TransientModel):
                 chart_dict.update(value)
                 items.append(chart_dict)
         charts = charts.filtered(lambda cid: cid._origin.id not in chart_id_list)
+        charts = charts.filtered(
+            lambda cid: cid.chart_type != "to_do" or cid.todo_layout == "activity"
+        )
+        # rendered together, in parallel
+        images = charts.filtered(
+            lambda cid: cid.chart_type in ["kpi", "tile", "to_do", "list"]
+        ).get_chart_snapshots()
         for chart in charts:
             chart_dict = {}
-            if chart.chart_type == "to_do" and chart.todo_layout != "activity":
-                continue
             if chart.chart_type in ["kpi", "tile", "to_do", "list"]:
-                image = chart.html_to_image()
+                image = images[chart.id]
                 chart_dict = {"chart_id": chart.id, "name": chart.name, "image": image}
             else:
                 chart_data = chart.get_chart_data(chart.chart_type, chart.name)
@@ -488,11 +488,9 @@ class SaleOrder(models.Model):
         if not kickoff_code:
             return
         
-        # Find the Event Kickoff product (use product.product for variants)
-        kickoff_product = self.env['product.product'].search([
-            ('default_code', '=', kickoff_code),
-            ('active', '=', True),
-        ], limit=1)
+        # Find the Event Kickoff product (use product.product for variants),
+        # resolved once per registry instead of on every onchange
+        kickoff_product = self.env['ptt.native.data.registry'].get_product_by_code(kickoff_code)
         
         if not kickoff_product:
             # Product not found - may not be installed yet, skip silently
@@ -554,10 +552,7 @@ class SaleOrder(models.Model):
             return
         
         # Find the Event Kickoff product
-        kickoff_product = self.env['product.product'].search([
-            ('default_code', '=', kickoff_code),
-            ('active', '=', True),
-        ], limit=1)
+        kickoff_product = self.env['ptt.native.data.registry'].get_product_by_code(kickoff_code)
         
         if not kickoff_product:
             # Product not found - may not be installed yet, skip silently
@@ -3,91 +3,135 @@ Vendor Portal Controller - Work Order Access + Vendor Application
 
 Reference: https://www.odoo.com/documentation/19.0/developer/reference/backend/http.html
 """
-import base64
 import logging
 
 from odoo import http, fields, _
 from odoo.http import request
 from odoo.addons.portal.controllers.portal import CustomerPortal, pager as portal_pager
-from odoo.exceptions import AccessError
+from odoo.exceptions import AccessError, MissingError
+from odoo.fields import Domain
+from odoo.tools import SQL
 
 _logger = logging.getLogger(__name__)
 
+VENDOR_PORTAL_COUNTERS = [
+    'work_order_count',
+    'upcoming_event_count',
+    'vendor_task_count',
+    'application_count',
+    'rfq_count',
+]
+
+# Fields rendered by the portal list pages, loaded for the whole page at
+# once (nested dicts follow the relational fields, like a web_read spec)
+WORK_ORDER_LIST_FIELDS = {
+    'project_id': {'name': {}, 'ptt_event_date': {}},
+    'service_type': {},
+    'actual_cost': {},
+    'status': {},
+    'access_token': {},
+}
+VENDOR_TASK_LIST_FIELDS = {
+    'name': {},
+    'description': {},
+    'due_date': {},
+    'priority': {},
+    'state': {},
+    'assignment_id': {
+        'access_token': {},
+        'event_date': {},
+        'project_id': {'name': {}},
+    },
+}
+VENDOR_RFQ_LIST_FIELDS = {
+    'name': {},
+    'product_id': {'name': {}},
+    'quantity': {},
+    'quote_date': {},
+    'closing_date': {},
+    'state': {},
+}
+
 
 class VendorPortal(CustomerPortal):
     """Extend portal for vendor work order access and vendor application."""
     
     def _prepare_home_portal_values(self, counters):
-        """Add work order count and application count to portal home."""
+        """Add work order count and application count to portal home.
+        
+        PERFORMANCE: all the vendor counters are computed by a single SQL
+        query (one COUNT sub-select per counter), i.e. one round-trip per
+        portal home render whatever the number of counters requested.
+        """
         values = super()._prepare_home_portal_values(counters)
         
+        values.update(dict.fromkeys(
+            [name for name in VENDOR_PORTAL_COUNTERS if name in counters], 0
+        ))
+        try:
+            queries = self._get_vendor_counter_queries(counters)
+            if queries:
+                with request.env.cr.savepoint():
+                    [row] = request.env.execute_query(SQL(
+                        "SELECT %s",
+                        SQL(", ").join(query.subselect("COUNT(*)") for query in queries.values()),
+                    ))
+                values.update(zip(queries, row))
+        except Exception:
+            _logger.exception("Failed to compute the vendor portal counters")
+        
+        return values
+    
+    def _get_vendor_counter_queries(self, counters):
+        """Return the queries of the requested vendor portal counters.
+        
+        Returns:
+            Dict {counter name: Query selecting the records to count}
+        """
         partner = request.env.user.partner_id
         Assignment = request.env['ptt.project.vendor.assignment']
         today = fields.Date.today()
+        queries = {}
         
-        if 'work_order_count' in counters:
-            domain = [('vendor_id', '=', partner.id)]
-            try:
-                count = Assignment.search_count(domain) \
-                    if Assignment.check_access_rights('read', raise_exception=False) else 0
-            except Exception:
-                count = 0
-            values['work_order_count'] = count
+        if 'work_order_count' in counters and Assignment.has_access('read'):
+            queries['work_order_count'] = Assignment._search([('vendor_id', '=', partner.id)])
         
         # Upcoming events count (accepted assignments with future event dates)
         if 'upcoming_event_count' in counters:
-            try:
-                count = Assignment.sudo().search_count([
-                    ('vendor_id', '=', partner.id),
-                    ('status', '=', 'confirmed'),
-                    ('event_date', '>=', today),
-                ])
-            except Exception:
-                count = 0
-            values['upcoming_event_count'] = count
+            queries['upcoming_event_count'] = Assignment.sudo()._search([
+                ('vendor_id', '=', partner.id),
+                ('status', '=', 'confirmed'),
+                ('event_date', '>=', today),
+            ])
         
         # Task count
         if 'vendor_task_count' in counters:
-            try:
-                count = request.env['ptt.vendor.task'].sudo().search_count([
-                    ('vendor_id', '=', partner.id),
-                    ('state', 'in', ['todo', 'in_progress']),
-                ])
-            except Exception:
-                count = 0
-            values['vendor_task_count'] = count
-        
-        # Add vendor application count
+            queries['vendor_task_count'] = request.env['ptt.vendor.task'].sudo()._search([
+                ('vendor_id', '=', partner.id),
+                ('state', 'in', ['todo', 'in_progress']),
+            ])
+        
+        # Vendor application count: vendor records this user created or is portal user for
         if 'application_count' in counters:
-            try:
-                # Find all vendor records this user created or is portal user for
-                domain = [
-                    '|',
-                    ('ptt_portal_user_id', '=', request.env.user.id),
-                    ('create_uid', '=', request.env.user.id),
-                    ('supplier_rank', '>', 0),
-                ]
-                count = request.env['res.partner'].sudo().search_count(domain)
-            except Exception:
-                count = 0
-            values['application_count'] = count
-        
-        # Add RFQ count for vendors
+            queries['application_count'] = request.env['res.partner'].sudo()._search([
+                '|',
+                ('ptt_portal_user_id', '=', request.env.user.id),
+                ('create_uid', '=', request.env.user.id),
+                ('supplier_rank', '>', 0),
+            ])
+        
+        # RFQ count for vendors
         if 'rfq_count' in counters:
-            try:
-                count = request.env['ptt.vendor.rfq'].sudo().search_count([
-                    ('vendor_ids', 'in', partner.ids),
-                    ('state', 'not in', ['draft']),
-                ])
-            except Exception:
-                count = 0
-            values['rfq_count'] = count
+            queries['rfq_count'] = request.env['ptt.vendor.rfq'].sudo()._search([
+                ('vendor_ids', 'in', partner.ids),
+                ('state', 'not in', ['draft']),
+            ])
         
-        return values
+        return queries
     
     @http.route(['/my/work-orders', '/my/work-orders/page/<int:page>'], 
                 type='http', auth="user", website=True)
-    def portal_my_work_orders(self, page=1, sortby=None, filterby=None, **kw):
+    def portal_my_work_orders(self, page=1, sortby=None, filterby=None, after=None, **kw):
         """Display vendor's work orders list."""
         values = self._prepare_portal_layout_values()
         Assignment = request.env['ptt.project.vendor.assignment']
@@ -98,14 +142,23 @@ class VendorPortal(CustomerPortal):
         
         # Sorting
         searchbar_sortings = {
-            'date': {'label': _('Event Date'), 'order': 'event_date desc'},
+            'date': {
+                'label': _('Event Date'),
+                'order': 'event_date desc',
+                'keyset': [('event_date', 'desc'), ('id', 'desc')],
+            },
             'name': {'label': _('Event Name'), 'order': 'project_id asc'},
-            'status': {'label': _('Status'), 'order': 'status asc'},
+            'status': {
+                'label': _('Status'),
+                'order': 'status asc',
+                'keyset': [('status', 'asc'), ('id', 'asc')],
+            },
         }
         
         if not sortby:
             sortby = 'date'
         order = searchbar_sortings[sortby]['order']
+        keyset = searchbar_sortings[sortby].get('keyset')
         
         # Filters
         searchbar_filters = {
@@ -131,11 +184,9 @@ class VendorPortal(CustomerPortal):
             step=10
         )
         
-        assignments = Assignment.search(
-            domain, 
-            limit=10,
-            offset=pager_values['offset'],
-            order=order,
+        assignments = self._search_portal_page(
+            Assignment, domain, order, pager_values, 10,
+            keyset=keyset, after=after, fields_spec=WORK_ORDER_LIST_FIELDS,
         )
         
         values.update({
@@ -150,6 +201,83 @@ class VendorPortal(CustomerPortal):
         
         return request.render("ptt_vendor_management.portal_my_work_orders", values)
     
+    def _search_portal_page(self, Model, domain, order, pager_values, step,
+                            keyset=None, after=None, fields_spec=None):
+        """Search the records of a page of a portal list.
+        
+        PERFORMANCE: when the sorting has a ``keyset`` (its fields and
+        directions, ending with ``id``) and ``after`` is the id of the last
+        row of the previous page, the page is searched from that row
+        instead of skipping ``offset`` rows: deep pages cost the same as the
+        first one. The "next" links of the pager carry that cursor; other
+        page links (and stale cursors) fall back to the offset.
+        
+        The fields of ``fields_spec`` are fetched for the whole page, one
+        query per model, instead of row by row while rendering.
+        """
+        fields_spec = fields_spec or {}
+        records = None
+        if keyset:
+            order = ', '.join(
+                f"{field_name} {direction} nulls last" for field_name, direction in keyset
+            )
+            anchor = Model.browse()
+            if after and str(after).isdigit():
+                anchor = Model.search_fetch(
+                    Domain.AND([domain, [('id', '=', int(after))]]),
+                    [field_name for field_name, direction in keyset],
+                )
+            if anchor:
+                records = Model.search_fetch(
+                    Domain.AND([domain, self._get_keyset_domain(anchor, keyset)]),
+                    list(fields_spec),
+                    order=order,
+                    limit=step,
+                )
+        if records is None:
+            records = Model.search_fetch(
+                domain, list(fields_spec), order=order, limit=step, offset=pager_values['offset'],
+            )
+        self._fetch_portal_fields(records, fields_spec)
+        
+        if keyset and records and pager_values['page_next']['num'] > pager_values['page']['num']:
+            next_page = pager_values['page_next']
+            separator = '&' if '?' in next_page['url'] else '?'
+            next_page['url'] = f"{next_page['url']}{separator}after={records[-1].id}"
+            for page_link in pager_values['pages']:
+                if page_link['num'] == next_page['num']:
+                    page_link['url'] = next_page['url']
+        return records
+    
+    def _get_keyset_domain(self, anchor, keyset):
+        """Domain of the records sorted after ``anchor`` in the ``keyset`` order.
+        
+        Null values are sorted last, as in the order built from the keyset.
+        """
+        domains = []
+        equal_domain = Domain.TRUE
+        for field_name, direction in keyset:
+            value = anchor[field_name]
+            nullable = field_name != 'id' and not anchor._fields[field_name].required
+            if value is False and nullable:
+                # only other null values can follow a null one
+                equal_domain &= Domain(field_name, '=', False)
+                continue
+            after_domain = Domain(field_name, '<' if direction == 'desc' else '>', value)
+            if nullable:
+                after_domain |= Domain(field_name, '=', False)
+            domains.append(equal_domain & after_domain)
+            equal_domain &= Domain(field_name, '=', value)
+        return Domain.OR(domains)
+    
+    def _fetch_portal_fields(self, records, fields_spec):
+        """Fetch the fields of ``fields_spec`` on the relational fields of ``records``."""
+        for field_name, sub_spec in fields_spec.items():
+            if sub_spec:
+                related = records.mapped(field_name)
+                related.fetch(list(sub_spec))
+                self._fetch_portal_fields(related, sub_spec)
+    
     @http.route(['/my/upcoming-events'], type='http', auth="user", website=True)
     def portal_upcoming_events(self, **kw):
         """Display vendor's upcoming confirmed events."""
@@ -172,7 +300,7 @@ class VendorPortal(CustomerPortal):
     
     @http.route(['/my/vendor-tasks', '/my/vendor-tasks/page/<int:page>'], 
                 type='http', auth="user", website=True)
-    def portal_vendor_tasks(self, page=1, filterby=None, **kw):
+    def portal_vendor_tasks(self, page=1, filterby=None, after=None, **kw):
         """Display vendor's assigned tasks."""
         values = self._prepare_portal_layout_values()
         partner = request.env.user.partner_id
@@ -202,18 +330,19 @@ class VendorPortal(CustomerPortal):
             step=20
         )
         
-        tasks = Task.search(
-            domain,
-            limit=20,
-            offset=pager_values['offset'],
-            order='due_date asc, priority desc, sequence asc',
+        tasks = self._search_portal_page(
+            Task, domain, 'due_date asc, priority desc, sequence asc', pager_values, 20,
+            keyset=[('due_date', 'asc'), ('priority', 'desc'), ('sequence', 'asc'), ('id', 'asc')],
+            after=after, fields_spec=VENDOR_TASK_LIST_FIELDS,
         )
         
         values.update({
             'tasks': tasks,
+            'vendor_tasks': tasks,
             'pager': pager_values,
             'searchbar_filters': searchbar_filters,
             'filterby': filterby,
+            'filter': filterby,
             'page_name': 'vendor_tasks',
         })
         
@@ -528,9 +657,6 @@ class VendorPortal(CustomerPortal):
             
             if uploaded_file and uploaded_file.filename:
                 try:
-                    file_content = uploaded_file.read()
-                    file_b64 = base64.b64encode(file_content)
-                    
                     # Get validity date if provided
                     validity_field = f"doc_{doc_type.id}_validity"
                     validity = False
@@ -540,17 +666,17 @@ class VendorPortal(CustomerPortal):
                         except Exception:
                             pass
                     
-                    # Create document record
+                    # Create document record, the file is streamed to the
+                    # filestore instead of being loaded and base64-encoded
                     doc_vals = {
                         'vendor_id': vendor.id,
                         'document_type_id': doc_type.id,
-                        'attached_document': file_b64,
-                        'document_filename': uploaded_file.filename,
                         'status': 'non_compliant',
                         'validity': validity,
                     }
                     
-                    request.env['ptt.vendor.document'].sudo().create(doc_vals)
+                    document = request.env['ptt.vendor.document'].sudo().create(doc_vals)
+                    document._attach_document_stream(uploaded_file.stream, uploaded_file.filename)
                     _logger.info("Document uploaded for vendor %s: %s", vendor.id, doc_type.name)
                     
                 except Exception as e:
@@ -618,24 +744,23 @@ class VendorPortal(CustomerPortal):
         if document.vendor_id.id != vendor.id:
             return request.redirect(f'/my/application/{application_id}')
         
-        if not document.attached_document:
-            return request.redirect(f'/my/application/{application_id}')
-        
         filename = document.document_filename or f"document_{document_id}"
         
-        return request.make_response(
-            base64.b64decode(document.attached_document),
-            headers=[
-                ('Content-Type', 'application/octet-stream'),
-                ('Content-Disposition', f'attachment; filename="{filename}"'),
-            ]
-        )
+        # Served from the filestore (X-Sendfile when enabled), no base64 round-trip
+        try:
+            stream = request.env['ir.binary']._get_stream_from(
+                document, 'attached_document', filename=filename,
+            )
+        except MissingError:
+            return request.redirect(f'/my/application/{application_id}')
+        
+        return stream.get_response(as_attachment=True)
     
     # ==================== VENDOR RFQ PORTAL ROUTES ====================
     
     @http.route(['/my/vendor_rfqs', '/my/vendor_rfqs/page/<int:page>'], 
                 type='http', auth="user", website=True)
-    def portal_my_vendor_rfqs(self, page=1, sortby=None, filterby=None, **kw):
+    def portal_my_vendor_rfqs(self, page=1, sortby=None, filterby=None, after=None, **kw):
         """Display RFQs the vendor is invited to."""
         values = self._prepare_portal_layout_values()
         partner = request.env.user.partner_id
@@ -646,15 +771,30 @@ class VendorPortal(CustomerPortal):
         ]
         
         # Sorting
+        # create_date is only read back to the second, newest RFQs are
+        # paged on their id instead
         searchbar_sortings = {
-            'date': {'label': _('Newest'), 'order': 'create_date desc'},
-            'name': {'label': _('Reference'), 'order': 'name asc'},
-            'closing': {'label': _('Closing Date'), 'order': 'closing_date asc'},
+            'date': {
+                'label': _('Newest'),
+                'order': 'create_date desc',
+                'keyset': [('id', 'desc')],
+            },
+            'name': {
+                'label': _('Reference'),
+                'order': 'name asc',
+                'keyset': [('name', 'asc'), ('id', 'asc')],
+            },
+            'closing': {
+                'label': _('Closing Date'),
+                'order': 'closing_date asc',
+                'keyset': [('closing_date', 'asc'), ('id', 'asc')],
+            },
         }
         
         if not sortby:
             sortby = 'date'
         order = searchbar_sortings[sortby]['order']
+        keyset = searchbar_sortings[sortby].get('keyset')
         
         # Filtering
         searchbar_filters = {
@@ -679,11 +819,9 @@ class VendorPortal(CustomerPortal):
             step=10
         )
         
-        rfqs = RFQ.search(
-            domain,
-            order=order,
-            limit=10,
-            offset=pager_values['offset']
+        rfqs = self._search_portal_page(
+            RFQ, domain, order, pager_values, 10,
+            keyset=keyset, after=after, fields_spec=VENDOR_RFQ_LIST_FIELDS,
         )
         
         values.update({
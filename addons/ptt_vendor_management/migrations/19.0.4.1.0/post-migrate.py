@@ -0,0 +1,57 @@
+"""
+Post-migration script for PTT Vendor Management 19.0.4.1.0
+
+Fills the new expiry_alert_stage of vendor documents from the alerts the
+previous expiry crons already raised, so the first run of the new engine
+does not schedule them again:
+- expired required documents already non-compliant -> expired
+- documents expiring within 7 days, marked expiring soon, with an open
+  URGENT to-do for their type on the vendor -> urgent
+- other documents expiring within 30 days, marked expiring soon -> warning
+"""
+import logging
+
+_logger = logging.getLogger(__name__)
+
+
+def migrate(cr, version):
+    """Set the expiry alert stage of the documents already alerted."""
+    if not version:
+        return
+
+    _logger.info("PTT Vendor Management 19.0.4.1.0: Filling document expiry alert stages...")
+
+    cr.execute("""
+        UPDATE ptt_vendor_document doc
+        SET expiry_alert_stage = 'expired'
+        FROM ptt_document_type doc_type
+        WHERE doc_type.id = doc.document_type_id
+          AND doc_type.has_expiry
+          AND doc_type.required
+          AND doc.validity < CURRENT_DATE
+          AND doc.status = 'non_compliant'
+    """)
+    _logger.info("  %d documents already alerted as expired", cr.rowcount)
+
+    cr.execute("""
+        UPDATE ptt_vendor_document doc
+        SET expiry_alert_stage = CASE
+            WHEN doc.validity <= CURRENT_DATE + 7 AND EXISTS (
+                SELECT 1
+                FROM mail_activity activity
+                WHERE activity.res_model = 'res.partner'
+                  AND activity.res_id = doc.vendor_id
+                  AND activity.summary ILIKE '%URGENT%'
+                  AND activity.summary ILIKE '%' || doc_type.name || '%'
+            ) THEN 'urgent'
+            ELSE 'warning'
+        END
+        FROM ptt_document_type doc_type
+        WHERE doc_type.id = doc.document_type_id
+          AND doc_type.has_expiry
+          AND doc.validity BETWEEN CURRENT_DATE AND CURRENT_DATE + 30
+          AND doc.status = 'expiring_soon'
+    """)
+    _logger.info("  %d documents already alerted as expiring soon", cr.rowcount)
+
+    _logger.info("PTT Vendor Management 19.0.4.1.0: Migration complete")
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# Part of Party Time Texas Event Management System
+# Streamed uploads - copy files to the filestore chunk by chunk
+
+import os
+import shutil
+
+from odoo import api, models
+
+# Size of the chunks read from an uploaded file
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class IrAttachment(models.Model):
+    """Create attachments from file streams, used by the vendor portal."""
+    _inherit = "ir.attachment"
+
+    @api.model
+    def _ptt_create_from_stream(self, stream, vals):
+        """Create an attachment from a file-like object.
+
+        The stream is copied chunk by chunk to a temporary file of the
+        filestore, which ir.attachment then moves in place: the memory used
+        does not depend on the file size and the content is never
+        base64-encoded.
+
+        Args:
+            stream: Binary file-like object (e.g. an uploaded file stream)
+            vals: Values of the attachment (name, res_model, res_id, ...)
+
+        Returns:
+            The created ir.attachment record
+        """
+        path = self._file_temp_path()
+        try:
+            with open(path, "wb") as tmp_file:
+                shutil.copyfileobj(stream, tmp_file, STREAM_CHUNK_SIZE)
+        except Exception:
+            os.unlink(path)
+            raise
+        return self._create_from_file(path, vals)
@@ -17,6 +17,9 @@ class ProjectVendorAssignment(models.Model):
     
     _inherit = 'ptt.project.vendor.assignment'
     
+    # Work orders portal list, paged on (event_date, id) per vendor
+    _vendor_event_date_id_idx = models.Index("(vendor_id, event_date DESC NULLS LAST, id DESC)")
+    
     # === VENDOR RESPONSE FIELDS ===
     vendor_signature = fields.Binary(
         string="Vendor Signature",
@@ -80,6 +83,52 @@ class ProjectVendorAssignment(models.Model):
         readonly=True,
     )
     
+    @api.model
+    def _get_stats_fields(self):
+        return super()._get_stats_fields() | {"vendor_id", "status"}
+
+    @api.model
+    def _get_stats_targets(self):
+        return dict(super()._get_stats_targets(), **{
+            "res.partner": {
+                "ptt_assignment_count",
+                "ptt_completed_assignment_count",
+                "ptt_active_assignment_count",
+                "ptt_total_paid",
+            },
+        })
+
+    def _get_stats_contributions(self):
+        """Add the vendor work order statistics to the project ones."""
+        contributions = super()._get_stats_contributions()
+        for record in self:
+            if not record.vendor_id:
+                continue
+            completed = record.status == "completed"
+            vendor_stats = contributions[("res.partner", record.vendor_id.id)]
+            vendor_stats["ptt_assignment_count"] += 1
+            vendor_stats["ptt_completed_assignment_count"] += int(completed)
+            vendor_stats["ptt_active_assignment_count"] += int(record.status in ("pending", "confirmed"))
+            vendor_stats["ptt_total_paid"] += (record.actual_cost or 0.0) if completed else 0.0
+        return contributions
+
+    @api.model
+    def _get_expected_stats(self):
+        expected = super()._get_expected_stats()
+        for vendor, status, count, actual in self.sudo()._read_group(
+            [("vendor_id", "!=", False)], ["vendor_id", "status"], ["__count", "actual_cost:sum"]
+        ):
+            vendor_stats = expected[("res.partner", vendor.id)]
+            for fname in self._get_stats_targets()["res.partner"]:
+                vendor_stats.setdefault(fname, 0)
+            vendor_stats["ptt_assignment_count"] += count
+            if status == "completed":
+                vendor_stats["ptt_completed_assignment_count"] += count
+                vendor_stats["ptt_total_paid"] += actual or 0.0
+            elif status in ("pending", "confirmed"):
+                vendor_stats["ptt_active_assignment_count"] += count
+        return expected
+
     @api.depends("vendor_task_ids")
     def _compute_vendor_task_count(self):
         for record in self:
@@ -87,25 +136,33 @@ class ProjectVendorAssignment(models.Model):
 
     @api.depends("vendor_id", "service_type")
     def _compute_vendor_pricing_hint(self):
-        Pricing = self.env["ptt.vendor.service.pricing"]
+        """Resolve the pricing of all (vendor, service type) pairs at once.
+        
+        Service codes are mapped to service types through a cached lookup and
+        the pricing of the whole recordset is read with a single search.
+        """
         ServiceType = self.env["ptt.vendor.service.type"]
-        for record in self:
-            record.vendor_pricing_hint = False
-            if not record.vendor_id or not record.service_type:
-                continue
-            service_type = ServiceType.search([("code", "=", record.service_type)], limit=1)
-            if not service_type:
-                label = dict(record._fields["service_type"].selection).get(
-                    record.service_type, record.service_type
+        labels = dict(self._fields["service_type"].selection)
+        service_type_ids = {
+            code: ServiceType._ptt_resolve_code(code, labels.get(code, code))
+            for code in set(self.mapped("service_type"))
+            if code
+        }
+        prices = {}
+        vendor_ids = self.vendor_id.ids
+        if vendor_ids and any(service_type_ids.values()):
+            pricings = self.env["ptt.vendor.service.pricing"].search_fetch([
+                ("vendor_id", "in", vendor_ids),
+                ("service_type_id", "in", [st_id for st_id in service_type_ids.values() if st_id]),
+            ], ["vendor_id", "service_type_id", "price_detail"])
+            for pricing in pricings:
+                prices.setdefault(
+                    (pricing.vendor_id.id, pricing.service_type_id.id), pricing.price_detail
                 )
-                service_type = ServiceType.search([("name", "ilike", label)], limit=1)
-            if not service_type:
-                continue
-            pricing = Pricing.search([
-                ("vendor_id", "=", record.vendor_id.id),
-                ("service_type_id", "=", service_type.id),
-            ], limit=1)
-            record.vendor_pricing_hint = pricing.price_detail if pricing else False
+        for record in self:
+            record.vendor_pricing_hint = prices.get(
+                (record.vendor_id.id, service_type_ids.get(record.service_type))
+            ) or False
     
     def _get_access_token(self):
         """Generate access token for portal link."""
@@ -280,10 +337,11 @@ class ProjectVendorAssignment(models.Model):
             "ptt_vendor_management.email_template_vendor_work_order_reminder",
             raise_if_not_found=False,
         )
-        for assignment in pending:
-            if template and assignment.vendor_id and assignment.vendor_id.email:
-                template.send_mail(assignment.id, force_send=True)
-                assignment.last_reminder_date = now
+        if not template:
+            return
+        to_remind = pending.filtered(lambda a: a.vendor_id.email)
+        template._ptt_queue_mail_batch(to_remind.ids)
+        to_remind.write({"last_reminder_date": now})
 
     def action_view_tasks(self):
         """Open the list of vendor tasks for this assignment."""
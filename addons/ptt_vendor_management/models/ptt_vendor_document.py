@@ -1,6 +1,11 @@
 from odoo import models, fields, api, _
 from odoo.exceptions import ValidationError
 from datetime import timedelta
+from markupsafe import Markup
+
+# Alerts raised on an expiring document, from the least to the most urgent
+EXPIRY_ALERT_STAGES = [False, "warning", "urgent", "expired"]
+EXPIRY_WARNING_DAYS = {"warning": 30, "urgent": 7}
 
 
 class PttVendorDocument(models.Model):
@@ -97,6 +102,35 @@ class PttVendorDocument(models.Model):
                         _("Contact must belong to the selected vendor company.")
                     )
     
+    def write(self, vals):
+        # A new expiry date starts a new round of alerts
+        if "validity" in vals and "expiry_alert_stage" not in vals:
+            vals = dict(vals, expiry_alert_stage=False)
+        return super().write(vals)
+
+    def _attach_document_stream(self, stream, filename):
+        """Store an uploaded file stream as the document file.
+
+        The file is streamed to the filestore by ir.attachment instead of
+        going through the Binary field, which needs the whole file in
+        memory, base64-encoded.
+        """
+        self.ensure_one()
+        Attachment = self.env["ir.attachment"].sudo()
+        Attachment.search([
+            ("res_model", "=", self._name),
+            ("res_field", "=", "attached_document"),
+            ("res_id", "=", self.id),
+        ]).unlink()
+        Attachment._ptt_create_from_stream(stream, {
+            "name": filename,
+            "res_model": self._name,
+            "res_field": "attached_document",
+            "res_id": self.id,
+        })
+        self.write({"document_filename": filename})
+        self.invalidate_recordset(["attached_document"])
+
     @api.onchange("contact_id")
     def _onchange_contact_id(self):
         """Auto-set vendor when contact is selected."""
@@ -143,6 +177,19 @@ class PttVendorDocument(models.Model):
         help="Additional notes about this document",
     )
     
+    expiry_alert_stage = fields.Selection(
+        [
+            ("warning", "30-Day Warning"),
+            ("urgent", "7-Day Warning"),
+            ("expired", "Expired"),
+        ],
+        string="Expiry Alert",
+        index=True,
+        copy=False,
+        readonly=True,
+        help="Last expiry alert raised for the current expiry date",
+    )
+    
     # NOTE: Status is now manual. This computed method is kept for future automation.
     # To re-enable automated status, change status field to compute="_compute_status", store=True
     # and uncomment this method:
@@ -198,109 +245,109 @@ class PttVendorDocument(models.Model):
     
     @api.model
     def _cron_check_document_expiry_30day(self):
-        """Alert vendors with documents expiring in 30 days.
-        
-        PERFORMANCE: Only searches documents in the 30-day expiry window.
-        """
-        today = fields.Date.today()
-        warning_date = today + timedelta(days=30)
-        
-        # Find documents expiring in 30 days
-        expiring_docs = self.search([
-            ("document_type_id.has_expiry", "=", True),
-            ("validity", ">=", today),
-            ("validity", "<=", warning_date),
-        ])
-        
-        todo_activity_type = self.env.ref("mail.mail_activity_type_todo", raise_if_not_found=False)
-        
-        for doc in expiring_docs:
-            # Auto-update status to expiring_soon
-            if doc.status == "compliant":
-                doc.status = "expiring_soon"
-            
-            if doc.vendor_id.email and todo_activity_type:
-                user_id = self.env.ref("base.user_admin").id
-                existing_activity = self.env["mail.activity"].search([
-                    ("res_model", "=", "res.partner"),
-                    ("res_id", "=", doc.vendor_id.id),
-                    ("activity_type_id", "=", todo_activity_type.id),
-                    ("summary", "ilike", doc.document_type_id.name),
-                ], limit=1)
-                
-                if not existing_activity:
-                    doc.vendor_id.activity_schedule(
-                        activity_type_id=todo_activity_type.id,
-                        summary=_("Document Expiring Soon: %s", doc.document_type_id.name),
-                        note=_("Vendor %s: Document '%s' expires on %s. Please request a renewed document.",
-                               doc.vendor_id.name, doc.document_type_id.name, doc.validity),
-                        user_id=user_id,
-                    )
+        """Alert vendors with documents expiring in 30 days."""
+        self._run_expiry_engine(["warning"])
     
     @api.model
     def _cron_check_document_expiry_7day(self):
         """Alert vendors with documents expiring in 7 days (urgent)."""
-        today = fields.Date.today()
-        warning_date = today + timedelta(days=7)
-        
-        expiring_docs = self.search([
-            ("document_type_id.has_expiry", "=", True),
-            ("validity", ">=", today),
-            ("validity", "<=", warning_date),
-        ])
-        
-        todo_activity_type = self.env.ref("mail.mail_activity_type_todo", raise_if_not_found=False)
-        
-        for doc in expiring_docs:
-            # Auto-update status to expiring_soon
-            if doc.status == "compliant":
-                doc.status = "expiring_soon"
-            
-            if doc.vendor_id.email and todo_activity_type:
-                user_id = self.env.ref("base.user_admin").id
-                existing_activity = self.env["mail.activity"].search([
-                    ("res_model", "=", "res.partner"),
-                    ("res_id", "=", doc.vendor_id.id),
-                    ("activity_type_id", "=", todo_activity_type.id),
-                    ("summary", "ilike", "URGENT"),
-                    ("summary", "ilike", doc.document_type_id.name),
-                ], limit=1)
-                
-                if not existing_activity:
-                    doc.vendor_id.activity_schedule(
-                        activity_type_id=todo_activity_type.id,
-                        summary=_("URGENT: Document Expiring Soon: %s", doc.document_type_id.name),
-                        note=_("Vendor %s: Document '%s' expires on %s. Please request a renewed document immediately.",
-                               doc.vendor_id.name, doc.document_type_id.name, doc.validity),
-                        user_id=user_id,
-                    )
+        self._run_expiry_engine(["urgent"])
     
     @api.model
     def _cron_check_document_expired(self):
         """Handle expired documents - auto-set to non-compliant and alert."""
-        today = fields.Date.today()
-        
-        expired_docs = self.search([
+        self._run_expiry_engine(["expired"])
+    
+    @api.model
+    def _get_expiry_stage_domain(self, stage, today):
+        """Domain of the documents falling in the window of an expiry stage."""
+        if stage == "expired":
+            return [
+                ("document_type_id.has_expiry", "=", True),
+                ("document_type_id.required", "=", True),
+                ("validity", "<", today),
+            ]
+        return [
             ("document_type_id.has_expiry", "=", True),
-            ("document_type_id.required", "=", True),
-            ("validity", "<", today),
-            ("status", "!=", "non_compliant"),  # Only update if not already non-compliant
-        ])
+            ("validity", ">=", today),
+            ("validity", "<=", today + timedelta(days=EXPIRY_WARNING_DAYS[stage])),
+        ]
+    
+    @api.model
+    def _run_expiry_engine(self, stages=("warning", "urgent", "expired")):
+        """Classify documents into expiry windows and alert on them in batch.
         
-        for doc in expired_docs:
-            # Auto-update status to non-compliant
-            doc.status = "non_compliant"
-            
-            vendor = doc.vendor_id
-            today_str = today.strftime("%Y-%m-%d")
-            recent_messages = vendor.message_ids.filtered(
-                lambda m: m.date.strftime("%Y-%m-%d") == today_str and 
-                         doc.document_type_id.name in (m.body or "")
-            )
-            
-            if not recent_messages:
-                vendor.message_post(
-                    body=_("Warning: Required document '%s' expired on %s. Vendor compliance status affected.",
-                           doc.document_type_id.name, doc.validity),
-                    message_type="notification",
+        PERFORMANCE: each window is one search, statuses are updated with one
+        write per window and the alerts are created in batch. The alert
+        already raised for a document is kept on ``expiry_alert_stage`` (reset
+        when the expiry date changes), so no activity or chatter is searched
+        to avoid duplicates.
+        """
+        today = fields.Date.today()
+        for stage in stages:
+            domain = self._get_expiry_stage_domain(stage, today)
+            # Documents not alerted yet at this stage or a more urgent one
+            previous_stages = EXPIRY_ALERT_STAGES[: EXPIRY_ALERT_STAGES.index(stage)]
+            pending_alert = [("expiry_alert_stage", "in", previous_stages)]
+            if stage == "expired":
+                # Only documents still counted as compliant are handled
+                docs = self.search(domain + [("status", "!=", "non_compliant")])
+                to_alert = docs.filtered_domain(pending_alert)
+                docs.write({"status": "non_compliant"})
+                self._post_expired_alerts(to_alert)
+            else:
+                self.search(domain + [("status", "=", "compliant")]).write(
+                    {"status": "expiring_soon"}
+                )
+                to_alert = self.search(
+                    domain + pending_alert + [("vendor_id.email", "!=", False)]
                 )
+                to_alert = self._schedule_expiry_activities(to_alert, stage)
+            to_alert.write({"expiry_alert_stage": stage})
+    
+    def _schedule_expiry_activities(self, docs, stage):
+        """Create the expiry to-do activities of the vendors in one batch.
+        
+        Returns the documents an activity was created for.
+        """
+        todo_activity_type = self.env.ref("mail.mail_activity_type_todo", raise_if_not_found=False)
+        if not docs or not todo_activity_type:
+            return self.browse()
+        user_id = self.env.ref("base.user_admin").id
+        partner_model_id = self.env["ir.model"]._get_id("res.partner")
+        # same defaults as activity_schedule, deadline from the type's delay
+        date_deadline = todo_activity_type._get_date_deadline()
+        vals_list = []
+        for doc in docs:
+            if stage == "urgent":
+                summary = _("URGENT: Document Expiring Soon: %s", doc.document_type_id.name)
+                note = _("Vendor %s: Document '%s' expires on %s. Please request a renewed document immediately.",
+                         doc.vendor_id.name, doc.document_type_id.name, doc.validity)
+            else:
+                summary = _("Document Expiring Soon: %s", doc.document_type_id.name)
+                note = _("Vendor %s: Document '%s' expires on %s. Please request a renewed document.",
+                         doc.vendor_id.name, doc.document_type_id.name, doc.validity)
+            vals_list.append({
+                "res_model_id": partner_model_id,
+                "res_id": doc.vendor_id.id,
+                "activity_type_id": todo_activity_type.id,
+                "summary": summary,
+                "note": note,
+                "user_id": user_id,
+                "date_deadline": date_deadline,
+                "automated": True,
+            })
+        self.env["mail.activity"].create(vals_list)
+        return docs
+    
+    def _post_expired_alerts(self, docs):
+        """Log one chatter warning per vendor for its expired documents."""
+        bodies = {}
+        for vendor, vendor_docs in docs.grouped("vendor_id").items():
+            bodies[vendor.id] = Markup("<br/>").join(
+                _("Warning: Required document '%s' expired on %s. Vendor compliance status affected.",
+                  doc.document_type_id.name, doc.validity)
+                for doc in vendor_docs
+            )
+        if bodies:
+            self.env["res.partner"].browse(bodies)._message_log_batch(bodies)
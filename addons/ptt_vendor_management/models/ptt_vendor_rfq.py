@@ -246,12 +246,8 @@ class PTTVendorRFQ(models.Model):
         )
         
         if template:
-            for vendor in self.vendor_ids:
-                template.send_mail(
-                    self.id,
-                    force_send=True,
-                    email_values={"email_to": vendor.email},
-                )
+            # Rendered once and queued for every vendor
+            template._ptt_queue_mail_recipients(self.id, self.vendor_ids.mapped("email"))
         
         self.state = "in_progress"
         self.message_post(
@@ -53,21 +53,27 @@ class ResPartner(models.Model):
         help="All work orders assigned to this vendor",
     )
     
+    # Work order statistics are stored aggregates maintained by the vendor
+    # assignments (delta on create/write/unlink), see
+    # ptt.project.vendor.assignment._apply_stats_delta
     ptt_assignment_count = fields.Integer(
         string="Work Orders",
-        compute="_compute_vendor_assignment_stats",
+        readonly=True,
+        copy=False,
         help="Total number of work orders assigned to this vendor",
     )
     
     ptt_completed_assignment_count = fields.Integer(
         string="Completed",
-        compute="_compute_vendor_assignment_stats",
+        readonly=True,
+        copy=False,
         help="Number of completed work orders",
     )
 
     ptt_active_assignment_count = fields.Integer(
         string="Active Work Orders",
-        compute="_compute_vendor_assignment_stats",
+        readonly=True,
+        copy=False,
         help="Number of active work orders (pending/confirmed)",
     )
 
@@ -79,7 +85,8 @@ class ResPartner(models.Model):
     
     ptt_total_paid = fields.Monetary(
         string="Total Paid",
-        compute="_compute_vendor_assignment_stats",
+        readonly=True,
+        copy=False,
         currency_field="currency_id",
         help="Total amount paid to this vendor across all assignments",
     )
@@ -87,6 +94,7 @@ class ResPartner(models.Model):
     ptt_average_cost = fields.Monetary(
         string="Average Cost",
         compute="_compute_vendor_assignment_stats",
+        store=True,
         currency_field="currency_id",
         help="Average cost per completed assignment",
     )
@@ -205,21 +213,13 @@ class ResPartner(models.Model):
         compute="_compute_primary_vendor_contact",
     )
 
-    @api.depends("ptt_vendor_assignment_ids", "ptt_vendor_assignment_ids.status", 
-                 "ptt_vendor_assignment_ids.actual_cost")
+    @api.depends("ptt_total_paid", "ptt_completed_assignment_count")
     def _compute_vendor_assignment_stats(self):
-        """Compute vendor work order statistics."""
+        """Compute the average cost from the stored work order statistics."""
         for partner in self:
-            assignments = partner.ptt_vendor_assignment_ids
-            completed = assignments.filtered(lambda a: a.status == 'completed')
-            active = assignments.filtered(lambda a: a.status in ('pending', 'confirmed'))
-            
-            partner.ptt_assignment_count = len(assignments)
-            partner.ptt_completed_assignment_count = len(completed)
-            partner.ptt_active_assignment_count = len(active)
-            partner.ptt_total_paid = sum(completed.mapped('actual_cost'))
             partner.ptt_average_cost = (
-                partner.ptt_total_paid / len(completed) if completed else 0.0
+                partner.ptt_total_paid / partner.ptt_completed_assignment_count
+                if partner.ptt_completed_assignment_count else 0.0
             )
 
     @api.depends("ptt_portal_user_id")
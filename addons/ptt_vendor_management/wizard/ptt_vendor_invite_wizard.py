@@ -177,14 +177,13 @@ class PTTVendorInviteWizard(models.TransientModel):
             }
             
             try:
-                template.with_context(**ctx).send_mail(
-                    self.id,
-                    force_send=True,
+                template.with_context(**ctx)._ptt_queue_mail_batch(
+                    [self.id],
                     email_values={
                         "email_to": self.recipient_email,
                     }
                 )
-                _logger.info("Vendor invitation email sent to: %s", self.recipient_email)
+                _logger.info("Vendor invitation email queued for: %s", self.recipient_email)
             except Exception as e:
                 _logger.error("Error sending vendor invite to %s: %s", self.recipient_email, str(e))
                 raise UserError(_("Failed to send invitation email: %s") % str(e))
@@ -192,7 +191,7 @@ class PTTVendorInviteWizard(models.TransientModel):
             # Fallback: Send portal welcome email
             portal_template = self.env.ref("portal.mail_template_data_portal_welcome", raise_if_not_found=False)
             if portal_template:
-                portal_template.sudo().send_mail(user.id, force_send=True)
+                portal_template.sudo()._ptt_queue_mail_batch([user.id])
                 _logger.info("Sent portal welcome email as fallback for vendor invite: %s", self.recipient_email)
     
     def action_send_multiple(self):
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import bisect
 import contextlib
 import datetime
 import json
@@ -23,6 +24,12 @@ _logger = logging.getLogger(__name__)
 TIMEOUT = 50
 DEFAULT_GC_RETENTION_SECONDS = 60 * 60 * 24  # 24 hours
 
+# number of notifications kept in memory per database by the dispatcher
+NOTIFICATION_BUFFER_SIZE = 1000
+# time (in seconds) during which a fetched notification id is excluded from
+# the next fetches, see ``Websocket.MAX_NOTIFICATION_HISTORY_SEC``
+NOTIFICATION_BUFFER_HISTORY_SEC = 10
+
 # custom function to call instead of default PostgreSQL's `pg_notify`
 ODOO_NOTIFY_FUNCTION = os.getenv('ODOO_NOTIFY_FUNCTION', 'pg_notify')
 
@@ -201,10 +208,94 @@ class BusSubscription:
         self.channels = channels
 
 
+class NotificationBuffer:
+    """
+    Last notifications of a database, fetched once by the dispatcher for all
+    the websockets of the process. The notifications are fetched the same way
+    the websockets poll them: the ids fetched during the last
+    ``NOTIFICATION_BUFFER_HISTORY_SEC`` seconds are excluded from the next
+    fetches instead of only fetching higher ids, so that notifications of
+    concurrent transactions committed out of order are not missed.
+    """
+    def __init__(self, size=NOTIFICATION_BUFFER_SIZE):
+        self.size = size
+        self._lock = threading.Lock()
+        # (id, channel, message) sorted by id, messages must not be modified
+        self._notifications = []
+        # every notification with a higher id is in the buffer (None until
+        # the first fetch)
+        self._floor = None
+        # notifications are fetched above this id, ignoring ``_history``
+        self._last_id = 0
+        # (id, fetch time) of the last fetched notifications, sorted by id
+        self._history = []
+        self._fetch_time = 0
+
+    def fetch(self, cr):
+        """ Add the new notifications of the database to the buffer. """
+        now = time.monotonic()
+        if self._floor is None or now - self._fetch_time > TIMEOUT:
+            # (re)start from the last notification, the websockets will poll
+            # the database until they caught up with it
+            cr.execute("SELECT COALESCE(MAX(id), 0) FROM bus_bus")
+            [last_id] = cr.fetchone()
+            with self._lock:
+                self._notifications = []
+                self._floor = self._last_id = last_id
+                self._history = []
+        self._fetch_time = now
+        cr.execute(SQL(
+            "SELECT id, channel, message FROM bus_bus WHERE id > %s AND id != ALL(%s) ORDER BY id",
+            self._last_id, [notif_id for notif_id, _ in self._history],
+        ))
+        rows = cr.fetchall()
+        with self._lock:
+            for notif_id, channel, message in rows:
+                bisect.insort(self._history, (notif_id, now), key=lambda x: x[0])
+                bisect.insort(
+                    self._notifications,
+                    (notif_id, hashable(json.loads(channel)), json.loads(message)),
+                    key=lambda x: x[0],
+                )
+            # see ``Websocket._dispatch_bus_notifications``
+            last_index = -1
+            for i, (_, fetch_time) in enumerate(self._history):
+                if now - fetch_time > NOTIFICATION_BUFFER_HISTORY_SEC:
+                    last_index = i
+                else:
+                    break
+            if last_index != -1:
+                self._last_id = self._history[last_index][0]
+                self._history = self._history[last_index + 1:]
+            if len(self._notifications) > self.size:
+                evicted = self._notifications[:-self.size]
+                self._notifications = self._notifications[-self.size:]
+                self._floor = max(self._floor, evicted[-1][0])
+
+    def get(self, channels, last, ignore_ids):
+        """
+        Return the buffered notifications of the given channels, like
+        ``bus.bus._poll()``, or ``None`` if some of them might not be in
+        the buffer.
+        """
+        with self._lock:
+            if not last or self._floor is None or last < self._floor:
+                return None
+            ignore_ids = set(ignore_ids)
+            start = bisect.bisect_right(self._notifications, last, key=lambda x: x[0])
+            return [
+                {'id': notif_id, 'message': message}
+                for notif_id, channel, message in self._notifications[start:]
+                if notif_id not in ignore_ids and channel in channels
+            ]
+
+
 class ImDispatch(threading.Thread):
     def __init__(self):
         super().__init__(daemon=True, name=f'{__name__}.Bus')
         self._channels_to_ws = {}
+        # {db: NotificationBuffer}, filled by the dispatcher loop
+        self._buffers = {}
 
     def subscribe(self, channels, last, db, websocket):
         """
@@ -252,8 +343,32 @@ class ImDispatch(threading.Thread):
                     websockets = set()
                     for channel in channels:
                         websockets.update(self._channels_to_ws.get(hashable(channel), []))
+                    # fetch the new notifications once for all the websockets
+                    for db in {websocket._db for websocket in websockets}:
+                        self._fetch_notifications(db)
                     for websocket in websockets:
-                        websocket.trigger_notification_dispatching()
+                        websocket.trigger_notification_dispatching(buffered=True)
+
+    def _fetch_notifications(self, db):
+        buffer = self._buffers.get(db) or NotificationBuffer()
+        try:
+            with odoo.sql_db.db_connect(db).cursor() as cr:
+                buffer.fetch(cr)
+        except Exception:
+            _logger.warning("Bus: cannot fetch the notifications of %s, polling them instead", db, exc_info=True)
+            self._buffers.pop(db, None)
+        else:
+            self._buffers[db] = buffer
+
+    def get_buffered_notifications(self, db, channels, last, ignore_ids):
+        """
+        Return the notifications of the given channels fetched by the
+        dispatcher, or ``None`` if they have to be polled from the database.
+        """
+        buffer = self._buffers.get(db)
+        if buffer is None:
+            return None
+        return buffer.get(channels, last, ignore_ids)
 
     def run(self):
         while not stop_event.is_set():
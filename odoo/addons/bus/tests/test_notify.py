@@ -7,7 +7,9 @@ import threading
 import odoo
 from odoo.tests import TransactionCase
 
-from ..models.bus import json_dump, get_notify_payloads, NOTIFY_PAYLOAD_MAX_LENGTH, ODOO_NOTIFY_FUNCTION
+from ..models.bus import (
+    json_dump, get_notify_payloads, NotificationBuffer, NOTIFY_PAYLOAD_MAX_LENGTH, ODOO_NOTIFY_FUNCTION,
+)
 
 
 class NotifyTests(TransactionCase):
@@ -105,3 +107,41 @@ class NotifyTests(TransactionCase):
         self.assertEqual(
             channels, [[self.env.cr.dbname, "channel 1"], [self.env.cr.dbname, "channel 2"]]
         )
+
+    def test_notification_buffer(self):
+        """Asserts the buffer returns the notifications like ``_poll`` as long
+        as it holds all of them."""
+        Bus = self.env["bus.bus"]
+        channels = {(self.env.cr.dbname, "channel 1")}
+        buffer = NotificationBuffer(size=3)
+        self.assertIsNone(buffer.get(channels, 1, []), "nothing was fetched yet")
+
+        Bus._sendone("channel 1", "test 0", {})
+        self.env.cr.precommit.run()
+        buffer.fetch(self.env.cr)
+        last = Bus._bus_last_id()
+        self.assertIsNone(buffer.get(channels, last - 1, []), "older notifications are not buffered")
+        self.assertEqual(buffer.get(channels, last, []), [])
+
+        Bus._sendone("channel 1", "test 1", {})
+        Bus._sendone("channel 2", "test 2", {})
+        Bus._sendone("channel 1", "test 3", {})
+        self.env.cr.precommit.run()
+        buffer.fetch(self.env.cr)
+        notifications = buffer.get(channels, last, [])
+        self.assertEqual([n["message"]["type"] for n in notifications], ["test 1", "test 3"])
+        self.assertEqual(notifications, Bus._poll(["channel 1"], last))
+        self.assertEqual(
+            buffer.get(channels, last, [notifications[0]["id"]]),
+            Bus._poll(["channel 1"], last, [notifications[0]["id"]]),
+        )
+
+        # the oldest notification is evicted
+        Bus._sendone("channel 1", "test 4", {})
+        self.env.cr.precommit.run()
+        buffer.fetch(self.env.cr)
+        self.assertIsNone(buffer.get(channels, last, []))
+        self.assertEqual(
+            [n["message"]["type"] for n in buffer.get(channels, notifications[0]["id"], [])],
+            ["test 3", "test 4"],
+        )
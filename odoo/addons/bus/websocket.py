@@ -316,6 +316,9 @@ class Websocket:
         # as triggering notification dispatching or terminating the connection.
         self.__cmd_queue = PollablePriorityQueue()
         self._waiting_for_dispatch = False
+        # whether the planned dispatch was only triggered by the dispatcher,
+        # once it fetched the new notifications (see ``ImDispatch.loop``)
+        self._buffered_dispatch = False
         self._channels = set()
         # For ``_last_notif_sent_id and ``_notif_history``, see
         # ``MAX_NOTIFICATION_HISTORY_SEC`` for more details.
@@ -397,13 +400,22 @@ class Websocket:
         # Dispatch past notifications if there are any.
         self.trigger_notification_dispatching()
 
-    def trigger_notification_dispatching(self):
+    def trigger_notification_dispatching(self, buffered=False):
         """
         Warn the socket that notifications are available. Ignore if a
         dispatch is already planned or if the socket is already in the
         closing state.
+
+        :param bool buffered: whether the notifications are in the buffer of
+            the dispatcher. Other dispatches, like the one following a
+            subscription, poll the database.
         """
-        if self.state is not ConnectionState.OPEN or self._waiting_for_dispatch:
+        if self.state is not ConnectionState.OPEN:
+            return
+        self._buffered_dispatch = buffered and (
+            self._buffered_dispatch or not self._waiting_for_dispatch
+        )
+        if self._waiting_for_dispatch:
             return
         self._waiting_for_dispatch = True
         # Ignore if the socket was closed in the meantime.
@@ -764,13 +776,23 @@ class Websocket:
             return self._dispatch_bus_notifications()
          # Mark the notification request as processed.
         self._waiting_for_dispatch = False
+        buffered, self._buffered_dispatch = self._buffered_dispatch, False
         with acquire_cursor(session.db) as cr:
             env = self.new_env(cr, session)
             if session.uid is not None and not check_session(session, env):
                 raise SessionExpiredException()
-            notifications = env["bus.bus"]._poll(
-                self._channels, self._last_notif_sent_id, [n[0] for n in self._notif_history]
-            )
+            ignore_ids = [n[0] for n in self._notif_history]
+            # notifications already fetched for all the websockets of the
+            # process, unless this one lags behind them
+            notifications = None
+            if buffered:
+                notifications = dispatch.get_buffered_notifications(
+                    session.db, self._channels, self._last_notif_sent_id, ignore_ids
+                )
+            if notifications is None:
+                notifications = env["bus.bus"]._poll(
+                    self._channels, self._last_notif_sent_id, ignore_ids
+                )
         if not notifications:
             return
         for notif in notifications:
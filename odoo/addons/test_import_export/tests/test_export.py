@@ -5,6 +5,7 @@ from unittest.mock import patch
 from odoo import Command, http
 from odoo.tests import common, tagged, warmup
 from odoo.tools.misc import get_lang
+from odoo.addons.web.controllers import export as export_controller
 from odoo.addons.web.controllers.export import ExportXlsxWriter
 
 
@@ -105,6 +106,51 @@ class TestExport(XlsxCreatorCase):
             ],
         )
 
+    def test_export_chunks(self):
+        self.make([{'int_sum': i} for i in range(5)])
+        with patch.object(export_controller, 'EXPORT_CHUNK_SIZE', 2), patch.object(
+            self.env.registry[self.model_name],
+            'export_data',
+            autospec=True,
+            side_effect=self.env.registry[self.model_name].export_data,
+        ) as mock:
+            export = self.export(fields=['int_sum'])
+        self.assertEqual(mock.call_count, 3, "the records should be exported by chunks")
+        self.assertExportEqual(export, [['Int Sum'], ['0'], ['1'], ['2'], ['3'], ['4']])
+
+    def test_export_csv_stream(self):
+        self.make([{'int_sum': 1}, {'int_sum': 2}])
+        res = self.url_open(
+            '/web/export/csv',
+            data={
+                'data': json.dumps(dict(self.default_params, fields=[{'name': 'int_sum', 'label': 'Int Sum'}])),
+                'csrf_token': http.Request.csrf_token(self),
+            },
+        )
+        self.assertEqual(res.status_code, 200)
+        self.assertIn('attachment', res.headers['Content-Disposition'])
+        self.assertEqual(res.content, b'"Int Sum"\r\n"1"\r\n"2"\r\n')
+
+    def test_export_background(self):
+        self.make([{'int_sum': 1}, {'int_sum': 2}])
+        with patch.object(export_controller, 'EXPORT_BACKGROUND_THRESHOLD', 1):
+            res = self.url_open(
+                '/web/export/csv',
+                data={
+                    'data': json.dumps(dict(self.default_params, fields=[{'name': 'int_sum', 'label': 'Int Sum'}])),
+                    'csrf_token': http.Request.csrf_token(self),
+                },
+            )
+        self.assertEqual(res.status_code, 202)
+        self.assertEqual(res.json()['type'], 'background_export')
+
+        job = self.env['web.export.job'].search([], order='id desc', limit=1)
+        self.assertEqual(job.state, 'pending')
+        self.assertEqual(job.create_uid, self.env.ref('base.user_admin'))
+        job._run()
+        self.assertEqual(job.state, 'done')
+        self.assertEqual(job.attachment_id.raw, b'"Int Sum"\r\n"1"\r\n"2"\r\n')
+
     def test_export_template(self):
         def get_namelist(export_id):
             res = self.url_open(
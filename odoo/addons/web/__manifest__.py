@@ -26,6 +26,7 @@ This module provides the core of the Odoo Web Client.
         'views/neutralize_views.xml',
         'views/ir_ui_view_views.xml',
         'data/ir_attachment.xml',
+        'data/ir_cron.xml',
         'data/report_layout.xml',
     ],
     'assets': {
@@ -7,6 +7,8 @@ import itertools
 import json
 import logging
 import operator
+import os
+import tempfile
 from collections import defaultdict, OrderedDict
 
 from werkzeug.exceptions import InternalServerError
@@ -14,11 +16,17 @@ from werkzeug.exceptions import InternalServerError
 from odoo import http
 from odoo.exceptions import UserError
 from odoo.http import content_disposition, request
-from odoo.tools import osutil
+from odoo.tools import osutil, split_every
 
 
 _logger = logging.getLogger(__name__)
 
+# Number of records given at once to `export_data` by a non-grouped export
+EXPORT_CHUNK_SIZE = 1000
+
+# Non-grouped exports of more records are prepared by a background job
+EXPORT_BACKGROUND_THRESHOLD = 100000
+
 
 def none_values_filtered(func):
     @functools.wraps(func)
@@ -44,6 +52,18 @@ def allow_empty_iterable(func):
     return wrap
 
 
+def iter_export_data(records, field_names, chunk_size=None):
+    """ Generate the rows of ``records.export_data(field_names)``.
+
+    The records are exported by chunks of ``chunk_size`` (``EXPORT_CHUNK_SIZE``
+    by default), in their order, and the cache is cleared after each chunk:
+    the memory used does not depend on the number of records.
+    """
+    for ids in split_every(chunk_size or EXPORT_CHUNK_SIZE, records.ids):
+        yield from records.browse(ids).export_data(field_names).get('datas', [])
+        records.env.invalidate_all()
+
+
 OPERATOR_MAPPING = {
     'max': none_values_filtered(allow_empty_iterable(max)),
     'min': none_values_filtered(allow_empty_iterable(min)),
@@ -162,12 +182,22 @@ class GroupsTreeNode:
 
 class ExportXlsxWriter:
 
-    def __init__(self, fields, columns_headers, row_count):
+    def __init__(self, fields, columns_headers, row_count, path=None, env=None):
+        """ Write an export in memory, or in the file at ``path``. In the
+        latter case, the rows are written in constant memory mode: each row
+        is flushed to a temporary file once the next one starts, they must
+        be written in order.
+        """
         import xlsxwriter  # noqa: PLC0415
+        self.env = env if env is not None else request.env
         self.fields = fields
         self.columns_headers = columns_headers
-        self.output = io.BytesIO()
-        self.workbook = xlsxwriter.Workbook(self.output, {'in_memory': True})
+        if path:
+            self.output = None
+            self.workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+        else:
+            self.output = io.BytesIO()
+            self.workbook = xlsxwriter.Workbook(self.output, {'in_memory': True})
         self.header_style = self.workbook.add_format({'bold': True})
         self.date_style = self.workbook.add_format({'text_wrap': True, 'num_format': 'yyyy-mm-dd'})
         self.datetime_style = self.workbook.add_format({'text_wrap': True, 'num_format': 'yyyy-mm-dd hh:mm:ss'})
@@ -176,7 +206,7 @@ class ExportXlsxWriter:
         self.float_style = self.workbook.add_format({'text_wrap': True, 'num_format': '#,##0.00'})
 
         # FIXME: Should depends of the currency field for each row (also maybe add the currency symbol)
-        decimal_places = request.env['res.currency']._read_group([], aggregates=['decimal_places:max'])[0][0]
+        decimal_places = self.env['res.currency']._read_group([], aggregates=['decimal_places:max'])[0][0]
         self.monetary_style = self.workbook.add_format({'text_wrap': True, 'num_format': f'#,##0.{(decimal_places or 2) * "0"}'})
 
         header_bold_props = {'text_wrap': True, 'bold': True, 'bg_color': '#e9ecef'}
@@ -188,7 +218,7 @@ class ExportXlsxWriter:
         self.value = False
 
         if row_count > self.worksheet.xls_rowmax:
-            raise UserError(request.env._('There are too many rows (%(count)s rows, limit: %(limit)s) to export as Excel 2007-2013 (.xlsx) format. Consider splitting the export.', count=row_count, limit=self.worksheet.xls_rowmax))
+            raise UserError(self.env._('There are too many rows (%(count)s rows, limit: %(limit)s) to export as Excel 2007-2013 (.xlsx) format. Consider splitting the export.', count=row_count, limit=self.worksheet.xls_rowmax))
 
     def __enter__(self):
         self.write_header()
@@ -205,8 +235,9 @@ class ExportXlsxWriter:
 
     def close(self):
         self.workbook.close()
-        with self.output:
-            self.value = self.output.getvalue()
+        if self.output is not None:
+            with self.output:
+                self.value = self.output.getvalue()
 
     def write(self, row, column, cell_value, style=None):
         self.worksheet.write(row, column, cell_value, style)
@@ -222,13 +253,13 @@ class ExportXlsxWriter:
                 # fails note that you can't export
                 cell_value = cell_value.decode()
             except UnicodeDecodeError:
-                raise UserError(request.env._("Binary fields can not be exported to Excel unless their content is base64-encoded. That does not seem to be the case for %s.", self.columns_headers[column])) from None
+                raise UserError(self.env._("Binary fields can not be exported to Excel unless their content is base64-encoded. That does not seem to be the case for %s.", self.columns_headers[column])) from None
         elif isinstance(cell_value, (list, tuple, dict)):
             cell_value = str(cell_value)
 
         if isinstance(cell_value, str):
             if len(cell_value) > self.worksheet.xls_strmax:
-                cell_value = request.env._("The content of this cell is too long for an XLSX file (more than %s characters). Please use the CSV format for this export.", self.worksheet.xls_strmax)
+                cell_value = self.env._("The content of this cell is too long for an XLSX file (more than %s characters). Please use the CSV format for this export.", self.worksheet.xls_strmax)
             else:
                 cell_value = cell_value.replace("\r", " ")
         elif isinstance(cell_value, datetime.datetime):
@@ -246,7 +277,7 @@ class GroupExportXlsxWriter(ExportXlsxWriter):
     def write_group(self, row, column, group_name, group, group_depth=0):
         group_name = group_name[1] if isinstance(group_name, tuple) and len(group_name) > 1 else group_name
         if group._groupby_type[group_depth] != 'boolean':
-            group_name = group_name or request.env._("Undefined")
+            group_name = group_name or self.env._("Undefined")
         row, column = self._write_group_header(row, column, group_name, group, group_depth)
 
         # Recursively write sub-groups
@@ -547,12 +578,29 @@ class ExportFormat(object):
     def from_group_data(self, fields, columns_headers, groups):
         raise NotImplementedError()
 
-    def base(self, data):
-        params = json.loads(data)
+    def write_file(self, env, fields, columns_headers, rows, row_count, path):
+        """ Write the export of ``rows`` to the file at ``path``, consuming
+        them one by one so that they are never all kept in memory.
+
+        :param env: the environment used to format the export
+        :param list fields: the fields to export
+        :param list columns_headers: the headers of the columns
+        :param rows: an iterable of exported rows
+        :param int row_count: the number of exported records
+        :param str path: the path of the file to write
+        """
+        raise NotImplementedError()
+
+    def get_export_records(self, env, params):
+        """ Return the records to export and the exported fields from the
+        parameters of an export.
+
+        :returns: tuple ``(records, fields, field_names, columns_headers)``
+        """
         model, fields, ids, domain, import_compat = \
             operator.itemgetter('model', 'fields', 'ids', 'domain', 'import_compat')(params)
 
-        Model = request.env[model].with_context(import_compat=import_compat, **params.get('context', {}))
+        Model = env[model].with_context(import_compat=import_compat, **params.get('context', {}))
         if not Model._is_an_ordinary_table():
             fields = [field for field in fields if field['name'] != 'id']
 
@@ -563,6 +611,26 @@ class ExportFormat(object):
             columns_headers = [val['label'].strip() for val in fields]
 
         records = Model.browse(ids) if ids else Model.search(domain)
+        return records, fields, field_names, columns_headers
+
+    def base(self, data):
+        params = json.loads(data)
+        model, ids, domain, import_compat = \
+            operator.itemgetter('model', 'ids', 'domain', 'import_compat')(params)
+
+        records, fields, field_names, columns_headers = self.get_export_records(request.env, params)
+        Model = records.browse()
+
+        _logger.info(
+            "User %d exported %d %r records from %s. Fields: %s. %s: %s",
+            request.env.user.id, len(records.ids), records._name, request.httprequest.environ['REMOTE_ADDR'],
+            ','.join(field_names),
+            'IDs sample' if ids else 'Domain',
+            records.ids[:10] if ids else domain,
+        )
+
+        # TODO: call `clean_filename` directly in `content_disposition`?
+        filename = osutil.clean_filename(self.filename(model) + self.extension)
 
         groupby = params.get('groupby')
         if not import_compat and groupby:
@@ -606,25 +674,57 @@ class ExportFormat(object):
                 tree.insert_leaf(group_info, group_rows)
 
             response_data = self.from_group_data(fields, columns_headers, tree)
-        else:
-            export_data = records.export_data(field_names).get('datas', [])
-            response_data = self.from_data(fields, columns_headers, export_data)
+            return request.make_response(response_data,
+                headers=[('Content-Disposition', content_disposition(filename)),
+                         ('Content-Type', self.content_type)],
+            )
 
-        _logger.info(
-            "User %d exported %d %r records from %s. Fields: %s. %s: %s",
-            request.env.user.id, len(records.ids), records._name, request.httprequest.environ['REMOTE_ADDR'],
-            ','.join(field_names),
-            'IDs sample' if ids else 'Domain',
-            records.ids[:10] if ids else domain,
-        )
+        if len(records) > EXPORT_BACKGROUND_THRESHOLD:
+            return self.export_in_background(filename, params, len(records))
+        return self.stream_export(filename, fields, columns_headers, records, field_names)
 
-        # TODO: call `clean_filename` directly in `content_disposition`?
-        return request.make_response(response_data,
-            headers=[('Content-Disposition',
-                            content_disposition(
-                                osutil.clean_filename(self.filename(model) + self.extension))),
-                     ('Content-Type', self.content_type)],
-        )
+    def stream_export(self, filename, fields, columns_headers, records, field_names):
+        """ Write the export of ``records`` by chunks to a temporary file, and
+        stream it to the client. """
+        fd, path = tempfile.mkstemp(prefix='odoo_export_', suffix=self.extension)
+        os.close(fd)
+        try:
+            rows = iter_export_data(records, field_names)
+            self.write_file(records.env, fields, columns_headers, rows, len(records), path)
+            # the response keeps the file open, it can be removed right away
+            return http.Stream(
+                type='path',
+                path=path,
+                mimetype=self.content_type,
+                download_name=filename,
+                size=os.path.getsize(path),
+                etag=False,
+                conditional=False,
+            ).get_response(as_attachment=True)
+        finally:
+            os.unlink(path)
+
+    def export_in_background(self, filename, params, record_count):
+        """ Queue the export to a background job producing an attachment,
+        the user is notified when it is ready.
+
+        :returns: a ``202 Accepted`` JSON response with the message to show
+            to the user, instead of the file
+        """
+        request.env['web.export.job'].create({
+            'name': filename,
+            'export_format': self.extension.lstrip('.'),
+            'params': params,
+        })
+        request.env.ref('web.ir_cron_web_export_job')._trigger()
+        return request.make_json_response({
+            'type': 'background_export',
+            'message': request.env._(
+                "There are too many records (%(count)s) to export them at once. The file is being "
+                "prepared in the background, you will be notified when it is ready.",
+                count=record_count,
+            ),
+        }, status=202)
 
 class CSVExport(ExportFormat, http.Controller):
 
@@ -654,6 +754,14 @@ class CSVExport(ExportFormat, http.Controller):
 
     def from_data(self, fields, columns_headers, rows):
         fp = io.StringIO()
+        self._write_rows(fp, columns_headers, rows)
+        return fp.getvalue()
+
+    def write_file(self, env, fields, columns_headers, rows, row_count, path):
+        with open(path, 'w', encoding='utf-8', newline='') as fp:
+            self._write_rows(fp, columns_headers, rows)
+
+    def _write_rows(self, fp, columns_headers, rows):
         writer = csv.writer(fp, quoting=1)
 
         writer.writerow(columns_headers)
@@ -672,8 +780,6 @@ class CSVExport(ExportFormat, http.Controller):
                 row.append(d)
             writer.writerow(row)
 
-        return fp.getvalue()
-
 class ExcelExport(ExportFormat, http.Controller):
 
     @http.route('/web/export/xlsx', type='http', auth='user')
@@ -707,8 +813,21 @@ class ExcelExport(ExportFormat, http.Controller):
 
     def from_data(self, fields, columns_headers, rows):
         with ExportXlsxWriter(fields, columns_headers, len(rows)) as xlsx_writer:
-            for row_index, row in enumerate(rows):
-                for cell_index, cell_value in enumerate(row):
-                    xlsx_writer.write_cell(row_index + 1, cell_index, cell_value)
+            self._write_rows(xlsx_writer, rows)
 
         return xlsx_writer.value
+
+    def write_file(self, env, fields, columns_headers, rows, row_count, path):
+        with ExportXlsxWriter(fields, columns_headers, row_count, path=path, env=env) as xlsx_writer:
+            self._write_rows(xlsx_writer, rows)
+
+    def _write_rows(self, xlsx_writer, rows):
+        # one2many fields export several rows per record: the row count is
+        # only known once they are written, and xlsxwriter silently drops the
+        # rows past the limit
+        row_max = xlsx_writer.worksheet.xls_rowmax
+        for row_index, row in enumerate(rows):
+            if row_index + 1 >= row_max:
+                raise UserError(xlsx_writer.env._('There are too many rows (more than %(limit)s rows) to export as Excel 2007-2013 (.xlsx) format. Consider splitting the export.', limit=row_max - 1))
+            for cell_index, cell_value in enumerate(row):
+                xlsx_writer.write_cell(row_index + 1, cell_index, cell_value)
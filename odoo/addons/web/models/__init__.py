@@ -14,3 +14,4 @@ from . import res_users_settings_embedded_action
 from . import res_users_settings
 from . import res_users
 from . import properties_base_definition
+from . import web_export_job
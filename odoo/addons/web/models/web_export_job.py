@@ -0,0 +1,105 @@
+# Part of Odoo. See LICENSE file for full copyright and licensing details.
+import logging
+import os
+
+from odoo import api, fields, models
+from odoo.addons.web.controllers.export import CSVExport, ExcelExport, iter_export_data
+
+_logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = {
+    'csv': CSVExport,
+    'xlsx': ExcelExport,
+}
+
+
+class WebExportJob(models.Model):
+    """ Export too large to be done during a request, prepared by a cron as
+    an attachment of the job. """
+    _name = 'web.export.job'
+    _description = 'Background Export'
+    _order = 'id'
+
+    name = fields.Char('File Name', required=True)
+    export_format = fields.Selection([('csv', 'CSV'), ('xlsx', 'XLSX')], required=True)
+    params = fields.Json('Export Parameters', required=True)
+    state = fields.Selection(
+        [('pending', 'Pending'), ('done', 'Done'), ('failed', 'Failed')],
+        default='pending', required=True, index=True,
+    )
+    attachment_id = fields.Many2one('ir.attachment', readonly=True, ondelete='set null')
+
+    @api.model
+    def _process_pending_jobs(self):
+        jobs = self.search([('state', '=', 'pending')])
+        self.env['ir.cron']._commit_progress(remaining=len(jobs))
+        for job in jobs:
+            try:
+                job._run()
+            except Exception:
+                _logger.exception("Background export %s failed", job.id)
+                self.env.cr.rollback()
+                job.state = 'failed'
+            job._notify_user()
+            if not self.env['ir.cron']._commit_progress(1):
+                break
+
+    def _run(self):
+        self.ensure_one()
+        export_format = EXPORT_FORMATS[self.export_format]()
+        env = self.env(user=self.create_uid, su=False)
+        records, fields, field_names, columns_headers = export_format.get_export_records(env, self.params)
+        # written in the filestore, so that it can be moved in place
+        path = self.env['ir.attachment']._file_temp_path(suffix=export_format.extension)
+        try:
+            rows = iter_export_data(records, field_names)
+            export_format.write_file(env, fields, columns_headers, rows, len(records), path)
+            attachment = self.env['ir.attachment'].sudo()._create_from_file(path, {
+                'name': self.name,
+                'mimetype': export_format.content_type,
+                'res_model': self._name,
+                'res_id': self.id,
+            })
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+        self.write({'state': 'done', 'attachment_id': attachment.id})
+        _logger.info(
+            "User %d exported %d %r records in the background. Fields: %s",
+            self.create_uid.id, len(records), records._name, ','.join(field_names),
+        )
+
+    def _notify_user(self):
+        self.ensure_one()
+        user = self.create_uid
+        if not hasattr(user, '_bus_send'):
+            # the bus is not installed
+            return
+        if self.state == 'done':
+            user._bus_send('simple_notification', {
+                'type': 'success',
+                'sticky': True,
+                'title': self.env._("Export ready"),
+                'message': self.env._(
+                    "%(name)s can be downloaded from %(url)s",
+                    name=self.name,
+                    url=f'/web/content/{self.attachment_id.id}?download=true',
+                ),
+            })
+        else:
+            user._bus_send('simple_notification', {
+                'type': 'danger',
+                'sticky': True,
+                'title': self.env._("Export failed"),
+                'message': self.env._("%(name)s could not be exported.", name=self.name),
+            })
+
+    @api.autovacuum
+    def _gc_jobs(self):
+        """ Delete the jobs of more than a week, with their file. """
+        jobs = self.search([
+            ('state', '!=', 'pending'),
+            ('create_date', '<', fields.Datetime.subtract(fields.Datetime.now(), days=7)),
+        ])
+        jobs.attachment_id.unlink()
+        jobs.unlink()
@@ -500,7 +500,7 @@ download._download = (options) => {
             data.append("csrf_token", odoo.csrf_token);
         }
         configureBlobDownloadXHR(xhr, {
-            onSuccess: resolve,
+            onSuccess: (filename, result) => resolve(result || filename),
             onFailure: reject,
             url: options.url,
         });
@@ -513,9 +513,12 @@ download._download = (options) => {
  * (onload, onerror, responseType), with hooks when the download succeeds or
  * fails.
  *
+ * A ``202 Accepted`` JSON response means that the file will be produced
+ * later on: nothing is downloaded, ``onSuccess`` receives the response.
+ *
  * @param {XMLHttpRequest} xhr
  * @param {object} [options]
- * @param {(filename: string) => void} [options.onSuccess]
+ * @param {(filename: string, result?: object) => void} [options.onSuccess]
  * @param {(Error) => void} [options.onFailure]
  * @param {string} [options.url]
  */
@@ -534,6 +537,8 @@ export function configureBlobDownloadXHR(
         if (xhr.status === 200 && (mimetype !== "text/html" || filename)) {
             _download(xhr.response, filename, mimetype);
             onSuccess(filename);
+        } else if (xhr.status === 202 && mimetype.startsWith("application/json")) {
+            xhr.response.text().then((contents) => onSuccess(null, JSON.parse(contents)));
         } else if (xhr.status === 502) {
             // If Odoo is behind another server (nginx)
             onFailure(new ConnectionLostError(url));
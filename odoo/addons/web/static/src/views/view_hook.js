@@ -125,6 +125,7 @@ export function useBounceButton(containerRef, shouldBounce) {
 
 export function useExportRecords(env, context, getDefaultExportList) {
     const { model, searchModel } = env;
+    const notification = useService("notification");
     useBus(searchModel, "direct-export-data", async () => {
         _downloadExport(getDefaultExportList(), false, "xlsx");
     });
@@ -157,7 +158,7 @@ export function useExportRecords(env, context, getDefaultExportList) {
                 label: _t("External ID"),
             });
         }
-        await download({
+        const result = await download({
             data: {
                 data: JSON.stringify({
                     import_compat,
@@ -174,6 +175,10 @@ export function useExportRecords(env, context, getDefaultExportList) {
             },
             url: `/web/export/${format}`,
         });
+        if (result?.type === "background_export") {
+            // too many records, the file is prepared by a scheduled action
+            notification.add(result.message, { type: "info", sticky: true });
+        }
     };
 
     return () => {
@@ -3,6 +3,7 @@
 import base64
 import binascii
 import contextlib
+import filecmp
 import hashlib
 import logging
 import mimetypes
@@ -40,6 +41,11 @@ from odoo.tools.misc import limited_field_access_token
 
 _logger = logging.getLogger(__name__)
 SECURITY_FIELDS = ('res_model', 'res_id', 'create_uid', 'public', 'res_field')
+# size of the chunks files are hashed by when moved into the filestore
+FILE_CHUNK_SIZE = 64 * 1024
+# files moved into the filestore are only indexed up to this size, as the
+# indexation needs their whole content in memory
+FILE_INDEX_MAX_SIZE = 16 * 1024 * 1024
 
 
 def condition_values(model, field_name, domain):
@@ -174,6 +180,49 @@ class IrAttachment(models.Model):
         # simply add fname to checklist, it will be garbage-collected later
         self._mark_for_gc(fname)
 
+    @api.model
+    def _file_temp_path(self, suffix=''):
+        """ Create an empty file in the filestore directory and return its
+        path. Content written to it can be turned into an attachment by
+        :meth:`_create_from_file`, which moves the file in place instead of
+        copying it.
+        """
+        assert isinstance(self, IrAttachment)
+        filestore = self._filestore()
+        os.makedirs(filestore, exist_ok=True)
+        path = os.path.join(filestore, f'.tmp-{uuid.uuid4().hex}{suffix}')
+        # same permissions as the files of _file_write, unlike tempfile.mkstemp
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        return path
+
+    @api.model
+    def _file_move(self, path):
+        """ Move the file at ``path`` into the filestore, hashing it by chunks
+        rather than loading it in memory.
+
+        :return: the store name and the checksum of the file
+        """
+        assert isinstance(self, IrAttachment)
+        sha = hashlib.sha1()
+        with open(path, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(FILE_CHUNK_SIZE), b''):
+                sha.update(chunk)
+        checksum = sha.hexdigest()
+        # same location as _get_path
+        fname = checksum[:2] + '/' + checksum
+        full_path = self._full_path(fname)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        if os.path.isfile(full_path):
+            # prevent sha-1 collision
+            if not filecmp.cmp(path, full_path, shallow=False):
+                raise UserError(_("The attachment collides with an existing file."))
+            os.unlink(path)
+        else:
+            os.replace(path, full_path)
+            # add fname to checklist, in case the transaction aborts
+            self._mark_for_gc(fname)
+        return fname, checksum
+
     def _mark_for_gc(self, fname):
         """ Add ``fname`` in a checklist for the filestore garbage collection. """
         assert isinstance(self, IrAttachment)
@@ -893,6 +942,50 @@ class IrAttachment(models.Model):
             **vals,
         })
 
+    @api.model
+    def _create_from_file(self, path, vals):
+        """
+        Create an attachment with the content of the file at ``path``, which
+        is removed. With the filestore storage, the file is moved in place
+        rather than loaded in memory, it should come from
+        :meth:`_file_temp_path` to be on the same file system.
+
+        The mimetype is guessed from the head of the file when ``vals`` does
+        not give it. Images are loaded to be resized like on :meth:`create`,
+        and only the files up to ``FILE_INDEX_MAX_SIZE`` are indexed.
+        """
+        try:
+            with open(path, 'rb') as fp:
+                head = fp.read(MIMETYPE_HEAD_SIZE)
+            mimetype = self.with_context(image_no_postprocess=True)._check_contents(
+                dict(vals, raw=head)
+            )['mimetype']
+            if self._storage() == 'db' or mimetype.startswith('image/'):
+                with open(path, 'rb') as fp:
+                    return self.create(dict(vals, raw=fp.read()))
+
+            # created before touching the filestore, to prevent the GC from
+            # running until the end of the transaction
+            attachment = self.create(dict(vals, mimetype=mimetype))
+            file_size = os.path.getsize(path)
+            fname, checksum = self._file_move(path)
+        finally:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(path)
+
+        index_content = None
+        if file_size <= FILE_INDEX_MAX_SIZE:
+            index_content = self._index(self._file_read(fname), mimetype, checksum=checksum)
+        # write as superuser, as user probably does not have write access
+        super(IrAttachment, attachment.sudo()).write({
+            'file_size': file_size,
+            'checksum': checksum,
+            'index_content': index_content,
+            'store_fname': fname,
+            'db_datas': False,
+        })
+        return attachment
+
     def _to_http_stream(self):
         """ Create a :class:`~Stream`: from an ir.attachment record. """
         self.ensure_one()
@@ -99,6 +99,8 @@ class TestConfigManager(TransactionCase):
             'http_enable': True,
             'proxy_mode': False,
             'x_sendfile': False,
+            'session_store': 'filesystem',
+            'session_db': '',
 
             # web
             'dbfilter': '',
@@ -139,6 +141,7 @@ class TestConfigManager(TransactionCase):
             'db_sslmode': 'prefer',
             'db_maxconn': 64,
             'db_maxconn_gevent': None,
+            'db_signaling_notify': False,
             'db_template': 'template0',
             'db_replica_host': None,
             'db_replica_port': None,
@@ -216,6 +219,8 @@ class TestConfigManager(TransactionCase):
             'http_enable': False,
             'proxy_mode': True,
             'x_sendfile': True,
+            'session_store': 'filesystem',
+            'session_db': '',
 
             # web
             'dbfilter': '.*',
@@ -256,6 +261,7 @@ class TestConfigManager(TransactionCase):
             'db_sslmode': 'verify-full',
             'db_maxconn': 42,
             'db_maxconn_gevent': 100,
+            'db_signaling_notify': False,
             'db_template': 'backup1706',
             'db_replica_host': 'db2.localhost',
             'db_replica_port': 2038,
@@ -414,7 +420,10 @@ class TestConfigManager(TransactionCase):
 
             # new options since 14.0
             'db_maxconn_gevent': None,
+            'db_signaling_notify': False,
             'db_replica_host': None,
+            'session_store': 'filesystem',
+            'session_db': '',
             'db_replica_port': None,
             'db_app_name': 'odoo-{pid}',
             'geoip_country_db': '/usr/share/GeoIP/GeoLite2-Country.mmdb',
@@ -515,6 +524,8 @@ class TestConfigManager(TransactionCase):
             'http_enable': False,
             'proxy_mode': True,
             'x_sendfile': True,
+            'session_store': 'filesystem',
+            'session_db': '',
 
             # web
             'dbfilter': '.*',
@@ -560,6 +571,7 @@ class TestConfigManager(TransactionCase):
             'db_sslmode': 'verify-full',
             'db_maxconn': 42,
             'db_maxconn_gevent': 100,
+            'db_signaling_notify': False,
             'db_template': 'backup1706',
             'db_replica_host': 'db2.localhost',
             'db_replica_port': 2038,
@@ -643,6 +655,8 @@ class TestConfigManager(TransactionCase):
             'http_enable': False,
             'proxy_mode': True,
             'x_sendfile': True,
+            'session_store': 'filesystem',
+            'session_db': '',
 
             # web
             'dbfilter': '.*',
@@ -686,6 +700,7 @@ class TestConfigManager(TransactionCase):
             'db_sslmode': 'verify-full',
             'db_maxconn': 42,
             'db_maxconn_gevent': 100,
+            'db_signaling_notify': False,
             'db_template': 'backup1706',
             'db_replica_host': 'db2.localhost',
             'db_replica_port': 2038,
@@ -2,15 +2,17 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 import json
 import logging
+import threading
 from functools import partial
 from unittest.mock import patch
 
 import psycopg2
 from psycopg2.extensions import ISOLATION_LEVEL_REPEATABLE_READ
+from psycopg2.pool import PoolError
 
 from odoo import api
 from odoo.modules.registry import Registry
-from odoo.sql_db import db_connect
+from odoo.sql_db import ConnectionPool, connection_info_for, db_connect
 from odoo.tests import common
 from odoo.tests.common import BaseCase, HttpCase
 from odoo.tests.test_cursor import TestCursor
@@ -65,6 +67,28 @@ class TestRealCursor(BaseCase):
             self.assertEqual(cr.fetchone(), ('on',))
             self.assertTrue(cr._cnx.readonly)
 
+    def test_connection_pool_wait(self):
+        """ An exhausted pool waits for a connection to be given back """
+        pool = ConnectionPool(maxconn=1, timeout=0.2)
+        connection_info = connection_info_for(common.get_db_name())[1]
+        try:
+            cnx = pool.borrow(connection_info)
+            with self.assertRaises(PoolError):
+                pool.borrow(connection_info)
+            self.assertEqual(pool.stats()['timeouts'], 1)
+
+            timer = threading.Timer(0.05, pool.give_back, [cnx])
+            timer.start()
+            self.assertIs(pool.borrow(connection_info), cnx)
+            timer.join()
+            stats = pool.stats()
+            self.assertEqual(stats['saturated'], 2)
+            self.assertEqual(stats['timeouts'], 1)
+            self.assertEqual(stats['created'], 1)
+            self.assertEqual(stats['used'], 1)
+        finally:
+            pool.close_all()
+
 
 class TestHTTPCursor(HttpCase):
     def test_cursor_keeps_readwriteness(self):
@@ -282,6 +282,35 @@ class TestIrAttachment(TransactionCaseWithUserDemo):
             )
             self.assertEqual(patch_file_read.call_count, 0)
 
+    def test_16_create_from_file(self):
+        content = b'line one\nline two\n' + os.urandom(16).hex().encode()
+        path = self.Attachment._file_temp_path(suffix='.txt')
+        self.assertEqual(os.path.dirname(path), self.filestore)
+        with open(path, 'wb') as fp:
+            fp.write(content)
+
+        a1 = self.Attachment._create_from_file(path, {'name': 'a1.txt'})
+        self.assertFalse(os.path.exists(path), 'the file is moved into the filestore')
+        self.assertEqual(a1.raw, content)
+        self.assertEqual(a1.mimetype, 'text/plain')
+        self.assertEqual(a1.file_size, len(content))
+        self.assertEqual(a1.checksum, hashlib.sha1(content).hexdigest())
+        self.assertIn('line two', a1.index_content)
+        a2 = self.Attachment.create({'name': 'a2', 'raw': self.blob1})
+        self.assertEqual(
+            os.stat(os.path.join(self.filestore, a1.store_fname)).st_mode & 0o777,
+            os.stat(os.path.join(self.filestore, a2.store_fname)).st_mode & 0o777,
+            'the file has the permissions of the other files of the filestore',
+        )
+
+        # same content, the file is already in the filestore
+        path = self.Attachment._file_temp_path()
+        with open(path, 'wb') as fp:
+            fp.write(content)
+        a3 = self.Attachment._create_from_file(path, {'name': 'a3.txt'})
+        self.assertEqual(a3.store_fname, a1.store_fname)
+        self.assertFalse(os.path.exists(path))
+
 
 class TestPermissions(TransactionCaseWithUserDemo):
     def setUp(self):
@@ -1,5 +1,7 @@
 # Part of Odoo. See LICENSE file for full copyright and licensing details.
 
+from unittest.mock import patch
+
 from odoo.tests.common import TransactionCase, tagged
 from odoo.tools.cache import get_cache_key_counter
 from threading import Thread, Barrier
@@ -197,6 +199,37 @@ class TestOrmCache(TransactionCase):
             ["INFO:odoo.registry:Invalidating caches after database signaling: ['assets', 'default', 'templates.cached_values']"],
         )
 
+    def test_signaling_notify(self):
+        """ With a signaling listener, the sequences are only read when a
+        change was announced since the last check. """
+        registry = self.registry
+        self.patch(registry, '_signaling_token', None)
+        self.patch(registry, '_signaling_checked', 0.0)
+
+        class Listener:
+            token_value = (1, 0)
+
+            def token(self, db_name):
+                return self.token_value
+
+        listener = Listener()
+        get_sequences = registry.get_sequences
+        with patch('odoo.orm.registry._get_signaling_listener', return_value=listener), \
+             patch.object(registry, 'get_sequences', side_effect=get_sequences) as mock_get_sequences:
+            registry.check_signaling()
+            self.assertEqual(mock_get_sequences.call_count, 1)
+            registry.check_signaling()
+            self.assertEqual(mock_get_sequences.call_count, 1, "Nothing was announced, nothing to read")
+
+            listener.token_value = (1, 1)
+            registry.check_signaling()
+            self.assertEqual(mock_get_sequences.call_count, 2, "A change was announced")
+
+            listener.token_value = None
+            registry.check_signaling()
+            registry.check_signaling()
+            self.assertEqual(mock_get_sequences.call_count, 4, "Not listening, the sequences are always read")
+
     def test_signaling_gc(self):
         cr = self.env.cr
         cr.execute('SELECT last_value FROM orm_signaling_registry_id_seq')
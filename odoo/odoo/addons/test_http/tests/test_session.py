@@ -4,6 +4,8 @@ import datetime
 import glob
 import json
 import os
+import threading
+import time
 from tempfile import TemporaryDirectory
 from unittest.mock import patch
 from urllib.parse import urlencode
@@ -462,3 +464,108 @@ class TestSessionRotation(HttpCase):
         self.logout()
         root.session_store.delete_from_identifiers([session_three[:STORED_SESSION_BYTES]])
         self.assertEqual(get_amount_sessions(session_three), 0)
+
+
+class TestPostgresqlSessionStore(HttpCase):
+    def setUp(self):
+        super().setUp()
+        reset_cached_properties(odoo.http.root)
+        self.addCleanup(reset_cached_properties, odoo.http.root)
+        patcher = patch.dict(config.options, {'session_store': 'postgresql', 'session_db': get_db_name()})
+        self.startPatcher(patcher)
+        self.addCleanup(self.drop_session_table)
+
+    def drop_session_table(self):
+        with odoo.sql_db.db_connect(get_db_name()).cursor() as cr:
+            cr.execute("DROP TABLE IF EXISTS http_session")
+
+    def get_amount_sessions(self, sid):
+        with odoo.sql_db.db_connect(get_db_name()).cursor() as cr:
+            cr.execute("SELECT COUNT(*) FROM http_session WHERE identifier = %s", [sid[:STORED_SESSION_BYTES]])
+            return cr.fetchone()[0]
+
+    def test_session_store_postgresql(self):
+        self.assertIsInstance(root.session_store, odoo.http.PostgresqlSessionStore)
+        self.authenticate('admin', 'admin')
+        self.url_open('/odoo')
+        session_one = self.opener.cookies['session_id']
+        self.assertEqual(root.session_store.get(session_one).uid, self.env.ref('base.user_admin').id)
+        self.assertEqual(self.get_amount_sessions(session_one), 1)
+
+        # the previous session is kept along with the rotated one
+        session_one_obj = root.session_store.get(session_one)
+        session_one_obj['create_time'] -= SESSION_ROTATION_INTERVAL
+        root.session_store.save(session_one_obj)
+        self.url_open('/odoo')
+        session_two = self.opener.cookies['session_id']
+        self.assertNotEqual(session_one, session_two)
+        self.assertEqual(root.session_store.get(session_one)['next_sid'], session_two)
+        self.assertEqual(self.get_amount_sessions(session_two), 2)
+
+        identifier = session_two[:STORED_SESSION_BYTES]
+        self.assertEqual(root.session_store.get_missing_session_identifiers([identifier, 'x' * STORED_SESSION_BYTES]),
+                         {'x' * STORED_SESSION_BYTES})
+
+        # inactive sessions are reaped
+        root.session_store.vacuum(max_lifetime=SESSION_LIFETIME)
+        self.assertEqual(self.get_amount_sessions(session_two), 2)
+        with odoo.sql_db.db_connect(get_db_name()).cursor() as cr:
+            cr.execute("UPDATE http_session SET write_date = write_date - INTERVAL '1 day' WHERE sid = %s", [session_one])
+        root.session_store.vacuum(max_lifetime=3600)
+        self.assertEqual(self.get_amount_sessions(session_two), 1)
+
+        self.logout()
+        root.session_store.delete_from_identifiers([identifier])
+        self.assertEqual(self.get_amount_sessions(session_two), 0)
+
+    def test_session_store_postgresql_concurrent_rotation(self):
+        store = root.session_store
+        session = store.new()
+        store.save(session)
+        sessions = [store.get(session.sid), store.get(session.sid)]
+
+        # the first rotation holds the lock on the previous session until the
+        # second one is waiting for it
+        locked, release = threading.Event(), threading.Event()
+        write = store._write
+
+        def _write(cr, sessions_data):
+            write(cr, sessions_data)
+            if threading.current_thread().name == 'rotation-0':
+                locked.set()
+                release.wait(10)
+
+        errors = []
+
+        def rotate(session):
+            try:
+                store.rotate(session, None, soft=True)
+            except Exception as e:  # noqa: BLE001
+                errors.append(e)
+
+        threads = [
+            threading.Thread(target=rotate, args=(sess,), name=f'rotation-{index}')
+            for index, sess in enumerate(sessions)
+        ]
+        with patch.object(store, '_write', _write):
+            threads[0].start()
+            self.assertTrue(locked.wait(10))
+            threads[1].start()
+            for _ in range(100):
+                with odoo.sql_db.db_connect(get_db_name()).cursor() as cr:
+                    cr.execute("""
+                        SELECT 1 FROM pg_stat_activity
+                        WHERE datname = current_database() AND wait_event_type = 'Lock'
+                    """)
+                    if cr.fetchone():
+                        break
+                time.sleep(0.1)
+            release.set()
+            for thread in threads:
+                thread.join(10)
+
+        self.assertFalse(errors)
+        self.assertNotEqual(sessions[0].sid, session.sid)
+        self.assertEqual(sessions[1].sid, sessions[0].sid)
+        self.assertEqual(store.get(session.sid)['next_sid'], sessions[0].sid)
+        self.assertEqual(self.get_amount_sessions(session.sid), 2)
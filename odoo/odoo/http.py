@@ -202,7 +202,8 @@ from .modules import module as module_manager
 from .modules.registry import Registry
 from .service import security, model as service_model
 from .service.server import thread_local
-from .tools import (config, consteq, file_path, get_lang, json_default,
+from .sql_db import db_connect
+from .tools import (SQL, config, consteq, file_path, get_lang, json_default,
                     parse_version, profiler, unique, exception_to_unicode)
 from .tools.facade import Proxy, ProxyAttr, ProxyFunc
 from .tools.func import filter_kwargs
@@ -942,24 +943,20 @@ _base64_urlsafe_re = re.compile(r'^[A-Za-z0-9_-]{84}$')
 _session_identifier_re = re.compile(r'^[A-Za-z0-9_-]{%s}$' % STORED_SESSION_BYTES)
 
 
-class FilesystemSessionStore(sessions.FilesystemSessionStore):
-    """ Place where to load and save session objects. """
-    def get_session_filename(self, sid):
-        # scatter sessions across 4096 (64^2) directories
-        if not self.is_valid_key(sid):
-            raise ValueError(f'Invalid session id {sid!r}')
-        sha_dir = sid[:2]
-        dirname = os.path.join(self.path, sha_dir)
-        session_path = os.path.join(dirname, sid)
-        return session_path
+class BaseSessionStore(sessions.SessionStore):
+    """ Place where to load and save session objects.
 
-    def save(self, session):
-        session_path = self.get_session_filename(session.sid)
-        dirname = os.path.dirname(session_path)
-        if not os.path.isdir(dirname):
-            with contextlib.suppress(OSError):
-                os.mkdir(dirname, 0o0755)
-        super().save(session)
+    The store used by the server is selected with the ``session_store``
+    configuration option, among the stores registered in
+    :data:`SESSION_STORES`. Besides the methods of
+    :class:`~odoo.tools._vendor.sessions.SessionStore`, a store implements
+    :meth:`vacuum`, :meth:`get_missing_session_identifiers` and
+    :meth:`delete_from_identifiers`.
+    """
+    @classmethod
+    def from_config(cls, session_class):
+        """ Return the store configured in :data:`odoo.tools.config`. """
+        raise NotImplementedError
 
     def delete_old_sessions(self, session):
         if 'gc_previous_sessions' in session:
@@ -968,20 +965,6 @@ class FilesystemSessionStore(sessions.FilesystemSessionStore):
                 del session['gc_previous_sessions']
                 self.save(session)
 
-    def get(self, sid):
-        # retro compatibility
-        old_path = super().get_session_filename(sid)
-        session_path = self.get_session_filename(sid)
-        if os.path.isfile(old_path) and not os.path.isfile(session_path):
-            dirname = os.path.dirname(session_path)
-            if not os.path.isdir(dirname):
-                with contextlib.suppress(OSError):
-                    os.mkdir(dirname, 0o0755)
-            with contextlib.suppress(OSError):
-                os.rename(old_path, session_path)
-        session = super().get(sid)
-        return session
-
     def rotate(self, session, env, soft=False):
         # With a soft rotation, things like the CSRF token will still work. It's used for rotating
         # the session in a way that half the bytes remain to identify the user and the other half
@@ -1017,12 +1000,8 @@ class FilesystemSessionStore(sessions.FilesystemSessionStore):
         self.save(session)
 
     def vacuum(self, max_lifetime=SESSION_LIFETIME):
-        threshold = time.time() - max_lifetime
-        for fname in glob.iglob(os.path.join(root.session_store.path, '*', '*')):
-            path = os.path.join(root.session_store.path, fname)
-            with contextlib.suppress(OSError):
-                if os.path.getmtime(path) < threshold:
-                    os.unlink(path)
+        """ Delete the sessions inactive for more than ``max_lifetime`` seconds. """
+        raise NotImplementedError
 
     def generate_key(self, salt=None):
         # The generated key is case sensitive (base64) and the length is 84 chars.
@@ -1046,6 +1025,68 @@ class FilesystemSessionStore(sessions.FilesystemSessionStore):
     def is_valid_key(self, key):
         return _base64_urlsafe_re.match(key) is not None
 
+    def get_missing_session_identifiers(self, identifiers):
+        """
+            :param identifiers: session identifiers whose existence must be checked
+                                identifiers are a part session sid (first 42 chars)
+            :type identifiers: iterable
+            :return: the identifiers which are not present in the store
+            :rtype: set
+        """
+        raise NotImplementedError
+
+    def delete_from_identifiers(self, identifiers: list):
+        """ Delete the sessions whose sid starts with one of ``identifiers``. """
+        raise NotImplementedError
+
+
+class FilesystemSessionStore(BaseSessionStore, sessions.FilesystemSessionStore):
+    """ Sessions stored as files in the sessions directory of the data dir. """
+    @classmethod
+    def from_config(cls, session_class):
+        path = config.session_dir
+        _logger.debug('HTTP sessions stored in: %s', path)
+        return cls(path, session_class=session_class, renew_missing=True)
+
+    def get_session_filename(self, sid):
+        # scatter sessions across 4096 (64^2) directories
+        if not self.is_valid_key(sid):
+            raise ValueError(f'Invalid session id {sid!r}')
+        sha_dir = sid[:2]
+        dirname = os.path.join(self.path, sha_dir)
+        session_path = os.path.join(dirname, sid)
+        return session_path
+
+    def save(self, session):
+        session_path = self.get_session_filename(session.sid)
+        dirname = os.path.dirname(session_path)
+        if not os.path.isdir(dirname):
+            with contextlib.suppress(OSError):
+                os.mkdir(dirname, 0o0755)
+        super().save(session)
+
+    def get(self, sid):
+        # retro compatibility
+        old_path = super().get_session_filename(sid)
+        session_path = self.get_session_filename(sid)
+        if os.path.isfile(old_path) and not os.path.isfile(session_path):
+            dirname = os.path.dirname(session_path)
+            if not os.path.isdir(dirname):
+                with contextlib.suppress(OSError):
+                    os.mkdir(dirname, 0o0755)
+            with contextlib.suppress(OSError):
+                os.rename(old_path, session_path)
+        session = super().get(sid)
+        return session
+
+    def vacuum(self, max_lifetime=SESSION_LIFETIME):
+        threshold = time.time() - max_lifetime
+        for fname in glob.iglob(os.path.join(self.path, '*', '*')):
+            path = os.path.join(self.path, fname)
+            with contextlib.suppress(OSError):
+                if os.path.getmtime(path) < threshold:
+                    os.unlink(path)
+
     def get_missing_session_identifiers(self, identifiers):
         """
             :param identifiers: session identifiers whose file existence must be checked
@@ -1084,6 +1125,170 @@ class FilesystemSessionStore(sessions.FilesystemSessionStore):
                 os.unlink(fn)
 
 
+class PostgresqlSessionStore(BaseSessionStore):
+    """ Sessions stored in the ``http_session`` table of a database, shared
+    by all the servers connected to it without a shared sessions directory.
+
+    The table is indexed on the session identifier (the static part of the
+    sid) and on the last write date, so that checking or deleting sessions
+    from their identifiers and reaping the expired sessions are single
+    indexed queries.
+    """
+    def __init__(self, dbname, session_class=None, renew_missing=False):
+        super().__init__(session_class)
+        self.dbname = dbname
+        self.renew_missing = renew_missing
+        self._table_checked = False
+
+    @classmethod
+    def from_config(cls, session_class):
+        dbname = config['session_db']
+        if not dbname:
+            raise ValueError("The postgresql session store requires the database of the sessions (--session-db)")
+        _logger.debug('HTTP sessions stored in database: %s', dbname)
+        return cls(dbname, session_class=session_class, renew_missing=True)
+
+    def _cursor(self):
+        if not self._table_checked:
+            with db_connect(self.dbname).cursor() as cr:
+                cr.execute(SQL("""
+                    CREATE TABLE IF NOT EXISTS http_session (
+                        sid VARCHAR PRIMARY KEY,
+                        identifier VARCHAR NOT NULL,
+                        data JSONB NOT NULL,
+                        write_date TIMESTAMP NOT NULL
+                    );
+                    CREATE INDEX IF NOT EXISTS http_session_identifier_index ON http_session (identifier);
+                    CREATE INDEX IF NOT EXISTS http_session_write_date_index ON http_session (write_date);
+                """))
+            self._table_checked = True
+        return db_connect(self.dbname).cursor()
+
+    def _write(self, cr, sessions_data):
+        """ Insert or update the given sessions in a single query.
+
+        :param sessions_data: list of pairs ``(sid, data)``
+        """
+        cr.execute(SQL(
+            """
+            INSERT INTO http_session (sid, identifier, data, write_date)
+            VALUES %s
+            ON CONFLICT (sid) DO UPDATE
+            SET data = EXCLUDED.data, write_date = EXCLUDED.write_date
+            """,
+            SQL(", ").join(
+                SQL("(%s, %s, %s::jsonb, NOW() AT TIME ZONE 'UTC')",
+                    sid, sid[:STORED_SESSION_BYTES], json.dumps(data))
+                for sid, data in sessions_data
+            ),
+        ))
+
+    def save(self, session):
+        with self._cursor() as cr:
+            self._write(cr, [(session.sid, dict(session))])
+
+    def delete(self, session):
+        with self._cursor() as cr:
+            cr.execute(SQL("DELETE FROM http_session WHERE sid = %s", session.sid))
+
+    def get(self, sid):
+        if not self.is_valid_key(sid):
+            return self.new()
+        with self._cursor() as cr:
+            cr.execute(SQL("SELECT data FROM http_session WHERE sid = %s", sid))
+            row = cr.fetchone()
+        if row is None:
+            if self.renew_missing:
+                return self.new()
+            return self.session_class({}, sid, False)
+        return self.session_class(row[0], sid, False)
+
+    def rotate(self, session, env, soft=False):
+        # Same as BaseSessionStore.rotate(), but the previous session is
+        # marked and the new one written in a single transaction.
+        with self._cursor() as cr:
+            sessions_data = []
+            if soft:
+                # Concurrent requests rotating the same session race on the
+                # conditional update below: at READ COMMITTED the losers wait
+                # for the winner to commit, then update no row and adopt its
+                # new session instead of failing to serialize.
+                cr.execute(SQL("SET TRANSACTION ISOLATION LEVEL READ COMMITTED"))
+                static = session.sid[:STORED_SESSION_BYTES]
+                next_sid = static + self.generate_key()[STORED_SESSION_BYTES:]
+                previous_data = dict(
+                    session,
+                    next_sid=next_sid,
+                    deletion_time=time.time() + SESSION_DELETION_TIMER,
+                )
+                cr.execute(SQL(
+                    """
+                    UPDATE http_session
+                    SET data = %s::jsonb, write_date = NOW() AT TIME ZONE 'UTC'
+                    WHERE sid = %s AND NOT data ? 'next_sid'
+                    RETURNING sid
+                    """,
+                    json.dumps(previous_data), session.sid,
+                ))
+                if not cr.fetchone():
+                    cr.execute(SQL("SELECT data->>'next_sid' FROM http_session WHERE sid = %s", session.sid))
+                    row = cr.fetchone()
+                    if row and row[0]:
+                        # A new session has already been saved by a concurrent request
+                        session.sid = row[0]
+                        return
+                    # The previous session was never saved
+                    sessions_data.append((session.sid, previous_data))
+                session['gc_previous_sessions'] = True
+                session.sid = next_sid
+            else:
+                cr.execute(SQL("DELETE FROM http_session WHERE sid = %s", session.sid))
+                session.sid = self.generate_key()
+            if session.uid:
+                assert env, "saving this session requires an environment"
+                session.session_token = security.compute_session_token(session, env)
+            session.should_rotate = False
+            session['create_time'] = time.time()
+            sessions_data.append((session.sid, dict(session)))
+            self._write(cr, sessions_data)
+
+    def vacuum(self, max_lifetime=SESSION_LIFETIME):
+        with self._cursor() as cr:
+            cr.execute(SQL(
+                "DELETE FROM http_session WHERE write_date < NOW() AT TIME ZONE 'UTC' - %s * INTERVAL '1 second'",
+                max_lifetime,
+            ))
+
+    def get_missing_session_identifiers(self, identifiers):
+        identifiers = set(identifiers)
+        if not identifiers:
+            return identifiers
+        with self._cursor() as cr:
+            cr.execute(SQL(
+                "SELECT DISTINCT identifier FROM http_session WHERE identifier = ANY(%s)",
+                list(identifiers),
+            ))
+            identifiers.difference_update(identifier for [identifier] in cr.fetchall())
+        return identifiers
+
+    def delete_from_identifiers(self, identifiers: list):
+        for identifier in identifiers:
+            if not _session_identifier_re.match(identifier):
+                raise ValueError("Identifier format incorrect, did you pass in a string instead of a list?")
+        if not identifiers:
+            return
+        with self._cursor() as cr:
+            cr.execute(SQL("DELETE FROM http_session WHERE identifier = ANY(%s)", list(identifiers)))
+
+
+# The stores of the HTTP sessions, selected with the ``session_store``
+# configuration option. Server-wide modules can register their own store.
+SESSION_STORES = {
+    'filesystem': FilesystemSessionStore,
+    'postgresql': PostgresqlSessionStore,
+}
+
+
 class Session(collections.abc.MutableMapping):
     """ Structure containing data persisted across requests. """
     __slots__ = ('can_save', '_Session__data', 'is_dirty', 'is_new',
@@ -2715,9 +2920,10 @@ class Application:
 
     @functools.cached_property
     def session_store(self):
-        path = odoo.tools.config.session_dir
-        _logger.debug('HTTP sessions stored in: %s', path)
-        return FilesystemSessionStore(path, session_class=Session, renew_missing=True)
+        store_name = config['session_store']
+        if store_name not in SESSION_STORES:
+            raise ValueError(f"Unknown session store {store_name!r}, expected one of: {', '.join(SESSION_STORES)}")
+        return SESSION_STORES[store_name].from_config(session_class=Session)
 
     def get_db_router(self, db):
         if not db:
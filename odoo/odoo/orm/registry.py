@@ -9,6 +9,7 @@ import functools
 import inspect
 import logging
 import os
+import selectors
 import threading
 import time
 import typing
@@ -74,6 +75,14 @@ _CACHES_BY_KEY = {
 
 _REPLICA_RETRY_TIME = 20 * 60  # 20 minutes
 
+# With `db_signaling_notify`, the signaling changes are announced on this
+# channel of the `postgres` database, the payload being the database name
+_SIGNALING_CHANNEL = 'orm_signaling'
+_SIGNALING_LISTENER_TIMEOUT = 50
+# the signaling tables are still checked at least this often (in seconds),
+# in case a notification is lost without the listener noticing it
+_SIGNALING_MAX_AGE = 60
+
 
 def _unaccent(x: SQL | str | psycopg2.sql.Composable) -> SQL | str | psycopg2.sql.Composed:
     if isinstance(x, SQL):
@@ -83,6 +92,78 @@ def _unaccent(x: SQL | str | psycopg2.sql.Composable) -> SQL | str | psycopg2.sq
     return f'unaccent({x})'
 
 
+class _SignalingListener(threading.Thread):
+    """ Listen to the signaling notifications of all the databases, and
+    count them per database. A registry whose database received no
+    notification since its last check does not need to query the signaling
+    tables (see :meth:`Registry.check_signaling`).
+    """
+    def __init__(self):
+        super().__init__(daemon=True, name=f'{__name__}.SignalingListener')
+        self.pid = os.getpid()
+        # incremented each time the listening starts, as notifications may
+        # have been missed while not listening
+        self._epoch = 0
+        self._listening = False
+        self._counts: dict[str, int] = {}
+
+    def token(self, db_name: str) -> tuple[int, int] | None:
+        """ Return a value that changes each time a change is announced for
+        the database, or ``None`` when the changes cannot be announced. """
+        if not self._listening:
+            return None
+        return self._epoch, self._counts.get(db_name, 0)
+
+    def loop(self):
+        with sql_db.db_connect('postgres').cursor() as cr, \
+             selectors.DefaultSelector() as sel:
+            cr.execute(SQL("LISTEN %s", SQL.identifier(_SIGNALING_CHANNEL)))
+            cr.commit()
+            conn = cr._cnx
+            sel.register(conn, selectors.EVENT_READ)
+            self._epoch += 1
+            self._listening = True
+            _logger.info("Listening to the registry signaling notifications")
+            try:
+                while True:
+                    if sel.select(_SIGNALING_LISTENER_TIMEOUT):
+                        conn.poll()
+                        while conn.notifies:
+                            db_name = conn.notifies.pop().payload
+                            self._counts[db_name] = self._counts.get(db_name, 0) + 1
+            finally:
+                self._listening = False
+
+    def run(self):
+        while True:
+            try:
+                self.loop()
+            except Exception:
+                _logger.exception("Registry signaling listener error, sleep and retry")
+                time.sleep(_SIGNALING_LISTENER_TIMEOUT)
+
+
+_signaling_listener: _SignalingListener | None = None
+_signaling_listener_lock = threading.Lock()
+
+
+def _get_signaling_listener() -> _SignalingListener | None:
+    """ Return the signaling listener of the current process, started on
+    demand, or ``None`` when ``db_signaling_notify`` is disabled. """
+    global _signaling_listener  # noqa: PLW0603 (global-statement)
+    if not config['db_signaling_notify']:
+        return None
+    listener = _signaling_listener
+    # threads do not survive a fork, each worker has its own listener
+    if listener is None or listener.pid != os.getpid():
+        with _signaling_listener_lock:
+            listener = _signaling_listener
+            if listener is None or listener.pid != os.getpid():
+                listener = _signaling_listener = _SignalingListener()
+                listener.start()
+    return listener
+
+
 class Registry(Mapping[str, type["BaseModel"]]):
     """ Model registry for a particular database.
 
@@ -293,6 +374,10 @@ class Registry(Mapping[str, type["BaseModel"]]):
         # invalidated (i.e. cleared).
         self.registry_sequence: int = -1
         self.cache_sequences: dict[str, int] = {}
+        # With `db_signaling_notify`, the token of the signaling listener
+        # and the time of the last check of the sequences
+        self._signaling_token: tuple[int, int] | None = None
+        self._signaling_checked: float = 0.0
 
         # Flags indicating invalidation of the registry or the cache.
         self._invalidation_flags = threading.local()
@@ -1055,7 +1140,19 @@ class Registry(Mapping[str, type["BaseModel"]]):
     def check_signaling(self, cr: BaseCursor | None = None) -> Registry:
         """ Check whether the registry has changed, and performs all necessary
         operations to update the registry. Return an up-to-date registry.
+
+        With ``db_signaling_notify``, the sequences are only read when a
+        change was announced for the database since the last check.
         """
+        listener = _get_signaling_listener()
+        token = listener and listener.token(self.db_name)
+        if (
+            token is not None
+            and token == self._signaling_token
+            and time.monotonic() - self._signaling_checked < _SIGNALING_MAX_AGE
+        ):
+            return self
+        checked = time.monotonic()
         with nullcontext(cr) if cr is not None else closing(self.cursor(readonly=True)) as cr:
             assert cr is not None
             db_registry_sequence, db_cache_sequences = self.get_sequences(cr)
@@ -1084,6 +1181,10 @@ class Registry(Mapping[str, type["BaseModel"]]):
                     _logger.info("Invalidating caches after database signaling: %s", sorted(invalidated))
             if changes:
                 _logger.debug("Multiprocess signaling check: %s", changes)
+        # the token is taken before reading the sequences: a change announced
+        # meanwhile is checked again next time
+        self._signaling_token = token
+        self._signaling_checked = checked
         return self
 
     def signal_changes(self) -> None:
@@ -1101,6 +1202,7 @@ class Registry(Mapping[str, type["BaseModel"]]):
                 # and the next call to check_signaling() will detect that and trigger a registry reload.
                 # otherwise, self.registry_sequence should be equal to cr.fetchone()[0]
                 self.registry_sequence += 1
+            self._notify_signaling()
 
         # no need to notify cache invalidation in case of registry invalidation,
         # because reloading the registry implies starting with an empty cache
@@ -1114,10 +1216,24 @@ class Registry(Mapping[str, type["BaseModel"]]):
                     # and the next call to check_signaling() will detect that and trigger cache invalidation.
                     # otherwise, self.cache_sequences[cache_name] should be equal to cr.fetchone()[0]
                     self.cache_sequences[cache_name] += 1
+            self._notify_signaling()
 
         self.registry_invalidated = False
         self.cache_invalidated.clear()
 
+    def _notify_signaling(self) -> None:
+        """ Announce the committed signaling changes to the listeners of all
+        the processes, when ``db_signaling_notify`` is enabled. """
+        if not config['db_signaling_notify']:
+            return
+        # the changes are committed already, the other processes catch up
+        # with them on their next check_signaling() anyway
+        try:
+            with sql_db.db_connect('postgres').cursor() as cr:
+                cr.execute(SQL("SELECT pg_notify(%s, %s)", _SIGNALING_CHANNEL, self.db_name))
+        except Exception:
+            _logger.warning("Could not announce the signaling changes of %s", self.db_name, exc_info=True)
+
     def reset_changes(self) -> None:
         """ Reset the registry and cancel all invalidations. """
         if self.registry_invalidated:
@@ -82,6 +82,8 @@ def categorize_query(decoded_query: str) -> tuple[typing.Literal['from', 'into']
 sql_counter: int = 0
 
 MAX_IDLE_TIMEOUT = 60 * 10
+POOL_REAP_INTERVAL = 60
+POOL_WAIT_TIMEOUT = 1.0
 
 
 class Savepoint:
@@ -607,22 +609,38 @@ class ConnectionPool:
         Keep a set of connections to pg databases open, and reuse them
         to open cursors for all transactions.
 
-        The connections are *not* automatically closed. Only a close_db()
-        can trigger that.
+        The idle connections are kept in a free-list per DSN, so borrowing
+        one does not depend on the size of the pool. Connections idle for
+        more than ``MAX_IDLE_TIMEOUT`` are closed by a reaping pass run at
+        most every ``POOL_REAP_INTERVAL`` seconds. When the pool is
+        exhausted, :meth:`borrow` waits up to ``timeout`` seconds for a
+        connection to be given back before raising a :class:`PoolError`.
     """
-    _connections: list[PsycoConnection]
-
-    def __init__(self, maxconn: int = 64, readonly: bool = False):
-        self._connections = []
+    _connections: set[PsycoConnection]
+
+    def __init__(self, maxconn: int = 64, readonly: bool = False, timeout: float = POOL_WAIT_TIMEOUT):
+        self._connections = set()
+        # idle connections per DSN key, and all of them from the least to
+        # the most recently used (dicts used as ordered sets)
+        self._idle: dict[frozenset, dict[PsycoConnection, None]] = {}
+        self._idle_lru: dict[PsycoConnection, None] = {}
         self._maxconn = max(maxconn, 1)
         self._readonly = readonly
+        self._timeout = timeout
         self._lock = threading.Lock()
+        self._available = threading.Condition(self._lock)
+        self._waiting = 0
+        self._last_reap = time.monotonic()
+        self._stats = dict.fromkeys((
+            'borrowed', 'created', 'saturated', 'timeouts', 'reaped',
+            'borrow_time', 'max_borrow_time', 'wait_time',
+        ), 0)
 
     def __repr__(self):
-        used = sum(1 for c in self._connections if c._pool_in_use)
         count = len(self._connections)
+        used = count - len(self._idle_lru)
         mode = 'read-only' if self._readonly else 'read/write'
-        return f"ConnectionPool({mode};used={used}/count={count}/max={self._maxconn})"
+        return f"ConnectionPool({mode};used={used}/count={count}/max={self._maxconn}/waiting={self._waiting})"
 
     @property
     def readonly(self) -> bool:
@@ -632,57 +650,97 @@ class ConnectionPool:
         _logger_conn.debug(('%r ' + msg), self, *args)
 
     @locked
+    def stats(self) -> dict:
+        """ Return a snapshot of the pool counters, for monitoring.
+
+        ``borrowed``, ``created``, ``reaped``: number of connections
+        borrowed, opened and closed because idle; ``saturated``: number of
+        borrows that found the pool exhausted, ``timeouts`` the ones that
+        gave up waiting; ``borrow_time``, ``max_borrow_time`` and
+        ``wait_time``: total and max time spent in :meth:`borrow`, and
+        total time spent waiting for a connection, in seconds.
+        """
+        count = len(self._connections)
+        return dict(
+            self._stats,
+            count=count,
+            used=count - len(self._idle_lru),
+            idle=len(self._idle_lru),
+            waiting=self._waiting,
+            maxconn=self._maxconn,
+        )
+
     def borrow(self, connection_info: dict) -> PsycoConnection:
         """
         Borrow a PsycoConnection from the pool. If no connection is available, create a new one
-        as long as there are still slots available. Perform some garbage-collection in the pool:
-        idle, dead and leaked connections are removed.
+        as long as there are still slots available, or wait for one to be given back.
+        Perform some garbage-collection in the pool: idle, dead and leaked connections are removed.
 
         :param dict connection_info: dict of psql connection keywords
         :rtype: PsycoConnection
+        :raise PoolError: when no connection is available within the timeout
         """
-        # free idle, dead and leaked connections
-        for i, cnx in tools.reverse_enumerate(self._connections):
-            if not cnx._pool_in_use and not cnx.closed and time.time() - cnx._pool_last_used > MAX_IDLE_TIMEOUT:
-                self._debug('Close connection at index %d: %r', i, cnx.dsn)
-                cnx.close()
+        key = self._dsn_key(connection_info)
+        start = time.monotonic()
+        with self._lock:
+            if start - self._last_reap > POOL_REAP_INTERVAL:
+                self._reap()
+            deadline = None
+            while True:
+                cnx = self._pop_idle(key)
+                if cnx is None and (len(self._connections) < self._maxconn or self._free_slot()):
+                    cnx = self._connect(connection_info, key)
+                if cnx is not None:
+                    break
+                # the pool is exhausted, wait for a connection to be given back
+                now = time.monotonic()
+                if deadline is None:
+                    self._stats['saturated'] += 1
+                    deadline = start + self._timeout
+                if now >= deadline:
+                    self._stats['timeouts'] += 1
+                    self._stats['wait_time'] += now - start
+                    raise PoolError('The Connection Pool Is Full')
+                self._waiting += 1
+                try:
+                    self._available.wait(deadline - now)
+                finally:
+                    self._waiting -= 1
+
+            cnx._pool_in_use = True
+            elapsed = time.monotonic() - start
+            self._stats['borrowed'] += 1
+            self._stats['borrow_time'] += elapsed
+            self._stats['max_borrow_time'] = max(self._stats['max_borrow_time'], elapsed)
+            if deadline is not None:
+                self._stats['wait_time'] += elapsed
+            return cnx
+
+    def _pop_idle(self, key: frozenset) -> PsycoConnection | None:
+        """ Return the most recently used idle connection to ``key``, ready
+        to be used, or ``None``. Must be called with the lock held. """
+        idle = self._idle.get(key)
+        while idle:
+            cnx, _ = idle.popitem()
+            del self._idle_lru[cnx]
+            if not idle:
+                del self._idle[key]
             if cnx.closed:
-                self._connections.pop(i)
-                self._debug('Removing closed connection at index %d: %r', i, cnx.dsn)
+                self._debug('Removing closed connection: %r', cnx.dsn)
+                self._forget(cnx)
                 continue
-            if getattr(cnx, 'leaked', False):
-                delattr(cnx, 'leaked')
-                cnx._pool_in_use = False
-                _logger.info('%r: Free leaked connection to %r', self, cnx.dsn)
-
-        for i, cnx in enumerate(self._connections):
-            if not cnx._pool_in_use and self._dsn_equals(cnx.dsn, connection_info):
-                try:
-                    cnx.reset()
-                except psycopg2.OperationalError:
-                    self._debug('Cannot reset connection at index %d: %r', i, cnx.dsn)
-                    # psycopg2 2.4.4 and earlier do not allow closing a closed connection
-                    if not cnx.closed:
-                        cnx.close()
-                    continue
-                cnx._pool_in_use = True
-                self._debug('Borrow existing connection to %r at index %d', cnx.dsn, i)
-
-                return cnx
-
-        if len(self._connections) >= self._maxconn:
-            # try to remove the oldest connection not used
-            for i, cnx in enumerate(self._connections):
-                if not cnx._pool_in_use:
-                    self._connections.pop(i)
-                    if not cnx.closed:
-                        cnx.close()
-                    self._debug('Removing old connection at index %d: %r', i, cnx.dsn)
-                    break
-            else:
-                # note: this code is called only if the for loop has completed (no break)
-                raise PoolError('The Connection Pool Is Full')
+            try:
+                cnx.reset()
+            except psycopg2.OperationalError:
+                self._debug('Cannot reset connection: %r', cnx.dsn)
+                self._forget(cnx)
+                continue
+            self._debug('Borrow existing connection to %r', cnx.dsn)
+            return cnx
+        return None
 
+    def _connect(self, connection_info: dict, key: frozenset) -> PsycoConnection:
+        """ Open a new connection. Must be called with the lock held. """
         try:
             result = psycopg2.connect(
                 connection_factory=PsycoConnection,
@@ -692,52 +750,110 @@ class ConnectionPool:
             raise
         if result.server_version < MIN_PG_VERSION * 10000:
             warnings.warn(f"Postgres version is {result.server_version}, lower than minimum required {MIN_PG_VERSION * 10000}")
-        result._pool_in_use = True
-        self._connections.append(result)
+        result._pool_dsn_key = key
+        self._connections.add(result)
+        self._stats['created'] += 1
         self._debug('Create new connection backend PID %d', result.get_backend_pid())
-
         return result
 
+    def _free_slot(self) -> bool:
+        """ Make room for a new connection in a full pool, by freeing the
+        leaked connections or closing the least recently used idle one.
+        Must be called with the lock held. """
+        if not self._idle_lru:
+            self._free_leaked()
+        if not self._idle_lru:
+            return False
+        cnx = next(iter(self._idle_lru))
+        self._debug('Removing old connection: %r', cnx.dsn)
+        self._forget(cnx)
+        return True
+
+    def _free_leaked(self) -> None:
+        """ Put the leaked connections (see :meth:`Cursor._close`) back in
+        the pool. Must be called with the lock held. """
+        for cnx in self._connections:
+            if getattr(cnx, 'leaked', False):
+                delattr(cnx, 'leaked')
+                _logger.info('%r: Free leaked connection to %r', self, cnx.dsn)
+                self._release(cnx)
+
+    def _reap(self) -> None:
+        """ Close the idle connections unused for more than ``MAX_IDLE_TIMEOUT``
+        and free the leaked ones. Must be called with the lock held. """
+        self._last_reap = time.monotonic()
+        self._free_leaked()
+        limit = time.time() - MAX_IDLE_TIMEOUT
+        # connections are sorted from the least recently used
+        for cnx in list(self._idle_lru):
+            if not cnx.closed and cnx._pool_last_used > limit:
+                break
+            self._debug('Close idle connection: %r', cnx.dsn)
+            self._forget(cnx)
+            self._stats['reaped'] += 1
+
+    def _release(self, cnx: PsycoConnection) -> None:
+        """ Mark a connection as idle. Must be called with the lock held. """
+        cnx._pool_in_use = False
+        cnx._pool_last_used = time.time()
+        self._idle.setdefault(cnx._pool_dsn_key, {})[cnx] = None
+        self._idle_lru[cnx] = None
+        self._available.notify()
+
+    def _forget(self, cnx: PsycoConnection) -> None:
+        """ Remove a connection from the pool and close it. Must be called
+        with the lock held. """
+        self._connections.discard(cnx)
+        if cnx in self._idle_lru:
+            del self._idle_lru[cnx]
+            idle = self._idle[cnx._pool_dsn_key]
+            del idle[cnx]
+            if not idle:
+                del self._idle[cnx._pool_dsn_key]
+        # psycopg2 2.4.4 and earlier do not allow closing a closed connection
+        if not cnx.closed:
+            cnx.close()
+        self._available.notify()
+
     @locked
     def give_back(self, connection: PsycoConnection, keep_in_pool: bool = True):
         self._debug('Give back connection to %r', connection.dsn)
-        try:
-            index = self._connections.index(connection)
-        except ValueError:
+        if connection not in self._connections:
             raise PoolError('This connection does not belong to the pool')
 
         if keep_in_pool:
             # Release the connection and record the last time used
-            connection._pool_in_use = False
-            connection._pool_last_used = time.time()
+            self._release(connection)
             self._debug('Put connection to %r in pool', connection.dsn)
         else:
-            cnx = self._connections.pop(index)
-            self._debug('Forgot connection to %r', cnx.dsn)
-            cnx.close()
+            self._forget(connection)
+            self._debug('Forgot connection to %r', connection.dsn)
 
     @locked
     def close_all(self, dsn: dict | str | None = None):
-        count = 0
-        last = None
-        for i, cnx in tools.reverse_enumerate(self._connections):
-            if dsn is None or self._dsn_equals(cnx.dsn, dsn):
-                cnx.close()
-                last = self._connections.pop(i)
-                count += 1
-        if count:
-            _logger.info('%r: Closed %d connections %s', self, count,
-                        (dsn and last and 'to %r' % last.dsn) or '')
-
-    def _dsn_equals(self, dsn1: dict | str, dsn2: dict | str) -> bool:
+        key = dsn and self._dsn_key(dsn)
+        connections = [
+            cnx for cnx in self._connections
+            if key is None or cnx._pool_dsn_key == key
+        ]
+        for cnx in connections:
+            self._forget(cnx)
+        if connections:
+            _logger.info('%r: Closed %d connections %s', self, len(connections),
+                        (dsn and 'to %r' % connections[-1].dsn) or '')
+
+    def _dsn_key(self, dsn: dict | str) -> frozenset:
+        """ Return a hashable key identifying the database a DSN connects to. """
         alias_keys = {'dbname': 'database'}
         ignore_keys = ['password']
-        dsn1, dsn2 = ({
-            alias_keys.get(key, key): str(value)
+        return frozenset(
+            (alias_keys.get(key, key), str(value))
             for key, value in (psycopg2.extensions.parse_dsn(dsn) if isinstance(dsn, str) else dsn).items()
             if key not in ignore_keys
-        } for dsn in (dsn1, dsn2))
-        return dsn1 == dsn2
+        )
+
+    def _dsn_equals(self, dsn1: dict | str, dsn2: dict | str) -> bool:
+        return self._dsn_key(dsn1) == self._dsn_key(dsn2)
 
 
 class Connection:
@@ -269,6 +269,11 @@ class configmanager:
                          help="Activate X-Sendfile (apache) and X-Accel-Redirect (nginx) "
                               "HTTP response header to delegate the delivery of large "
                               "files (assets/attachments) to the web server.")
+        group.add_option("--session-store", dest="session_store", my_default='filesystem',
+                         help="Store of the HTTP sessions: 'filesystem' (files in the data dir) or "
+                              "'postgresql' (a table of the --session-db database, shared by all the servers)")
+        group.add_option("--session-db", dest="session_db", my_default='',
+                         help="Database holding the HTTP sessions with --session-store=postgresql")
         parser.add_option_group(group)
 
         # WEB
@@ -391,6 +396,9 @@ class configmanager:
                          help="specify the maximum number of physical connections to PostgreSQL")
         group.add_option("--db_maxconn_gevent", dest="db_maxconn_gevent", type='int', my_default=None,
                          help="specify the maximum number of physical connections to PostgreSQL specifically for the gevent worker")
+        group.add_option("--db_signaling_notify", dest="db_signaling_notify", action="store_true", my_default=False,
+                         help="announce the registry and cache invalidations with PostgreSQL NOTIFY; each process "
+                              "listens to them instead of checking the signaling tables on every request")
         group.add_option("--db-template", dest="db_template", my_default="template0", env_name='PGDATABASE_TEMPLATE',
                          help="specify a custom database template to create a new database")
         parser.add_option_group(group)